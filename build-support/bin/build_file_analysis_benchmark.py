@@ -0,0 +1,128 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import statistics
+import sys
+import time
+from textwrap import dedent
+from typing import Callable
+
+from pants.engine.fs import FileContent
+from pants.engine.internals.build_files import BUILDFileEnvVarExtractor
+from pants.engine.internals.parser import (
+    BuildFileAnalyzer,
+    CompiledBuildFile,
+    CompiledBuildFileCache,
+)
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measures the per-file cost of analyzing the BUILD files of a synthetic repo: with "
+            "separate passes for the env vars, the compilation and the import check of each file, "
+            "with a single pass which shares the AST between all three, and with the single pass "
+            "behind the in-memory cache of compiled BUILD files."
+        )
+    )
+    parser.add_argument(
+        "-f", "--files", type=int, default=10_000, help="The number of BUILD files to analyze."
+    )
+    parser.add_argument(
+        "-d",
+        "--distinct",
+        type=int,
+        default=50,
+        help=(
+            "The number of distinct BUILD file contents among them: like in real repos, many BUILD "
+            "files share identical content, which only the cache takes advantage of."
+        ),
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="The number of times to analyze the files in each configuration.",
+    )
+    return parser
+
+
+def main() -> None:
+    args = create_parser().parse_args()
+    file_contents = synthetic_build_files(args.files, args.distinct)
+    timings = {
+        "separate_passes": [
+            time_per_file(separate_passes, file_contents) for _ in range(args.repeat)
+        ],
+        "single_pass": [time_per_file(single_pass, file_contents) for _ in range(args.repeat)],
+        # Each repetition gets a fresh cache, which it populates.
+        "cached_single_pass": [
+            time_per_file(CompiledBuildFileCache().get, file_contents) for _ in range(args.repeat)
+        ],
+    }
+    json.dump(
+        {
+            "files": len(file_contents),
+            "distinct": args.distinct,
+            **{
+                config: {"min_us": min(times) * 1e6, "median_us": statistics.median(times) * 1e6}
+                for config, times in timings.items()
+            },
+        },
+        indent=2,
+        fp=sys.stdout,
+    )
+
+
+def synthetic_build_files(count: int, distinct: int) -> list[FileContent]:
+    return [
+        FileContent(
+            f"src/python/project{i}/BUILD",
+            dedent(
+                f"""\
+                python_sources(
+                    dependencies=["3rdparty/python:requirements#dep{i % distinct}"],
+                    tags=[env("TAG_{i % distinct}", "default")],
+                )
+
+                python_tests(
+                    name="tests",
+                    overrides={{"test_{i % distinct}.py": {{"timeout": 10}}}},
+                )
+                """
+            ).encode(),
+        )
+        for i in range(count)
+    ]
+
+
+def separate_passes(filepath: str, content: str) -> None:
+    """Analyze a BUILD file as before the single-pass analysis: parsing it once per fact."""
+    BUILDFileEnvVarExtractor.get_env_vars(FileContent(filepath, content.encode()))
+    compile(content, filepath, "exec", dont_inherit=True)
+    # The import check only parsed the files which mention "import".
+    if "import" in content:
+        BuildFileAnalyzer.analyze(ast.parse(content, filepath), filepath)
+
+
+def single_pass(filepath: str, content: str) -> None:
+    CompiledBuildFile.create(filepath, content)
+
+
+def time_per_file(analyze: Callable[[str, str], object], file_contents: list[FileContent]) -> float:
+    """The time it takes to analyze each of the given files, on average, in seconds."""
+    contents = [(fc.path, fc.content.decode()) for fc in file_contents]
+    start = time.perf_counter()
+    for filepath, content in contents:
+        analyze(filepath, content)
+    return (time.perf_counter() - start) / len(contents)
+
+
+if __name__ == "__main__":
+    main()
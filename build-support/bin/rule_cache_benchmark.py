@@ -0,0 +1,106 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SRC_ROOT = Path("src/python")
+
+# Imports the given modules in a fresh interpreter, and reports how long that took.
+IMPORT_SCRIPT = """\
+import importlib, sys, time
+start = time.perf_counter()
+for module in sys.argv[1:]:
+    importlib.import_module(module)
+print(time.perf_counter() - start)
+"""
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measures how long it takes to import the backends of Pants (and so to declare all "
+            "of their rules) in a fresh interpreter: without the cache of the awaitables of each "
+            "rule, with a cold cache, and with a warm one."
+        )
+    )
+    parser.add_argument(
+        "-m",
+        "--module",
+        action="append",
+        default=[],
+        help=(
+            "A module to import. Defaults to the `register` module of every backend under "
+            f"`{SRC_ROOT}`."
+        ),
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="The number of times to import the modules in each configuration.",
+    )
+    return parser
+
+
+def main() -> None:
+    args = create_parser().parse_args()
+    modules = args.module or backend_register_modules()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        warm_cache_dir = os.path.join(cache_dir, "warm")
+        import_time(modules, cache_dir=warm_cache_dir)
+        timings = {
+            "uncached": [import_time(modules, cache_dir="") for _ in range(args.repeat)],
+            # Each run gets a fresh cache directory, which it populates.
+            "cold": [
+                import_time(modules, cache_dir=os.path.join(cache_dir, f"cold-{i}"))
+                for i in range(args.repeat)
+            ],
+            "warm": [import_time(modules, cache_dir=warm_cache_dir) for _ in range(args.repeat)],
+        }
+    json.dump(
+        {
+            "modules": len(modules),
+            **{
+                config: {"min": min(times), "median": statistics.median(times)}
+                for config, times in timings.items()
+            },
+        },
+        indent=2,
+        fp=sys.stdout,
+    )
+
+
+def backend_register_modules() -> list[str]:
+    return sorted(
+        ".".join(path.relative_to(SRC_ROOT).with_suffix("").parts)
+        for path in (SRC_ROOT / "pants" / "backend").rglob("register.py")
+    )
+
+
+def import_time(modules: list[str], *, cache_dir: str) -> float:
+    """Import the modules in a fresh interpreter, with the given cache directory, if any."""
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT, *modules],
+        env={
+            **os.environ,
+            "PYTHONPATH": str(SRC_ROOT),
+            "PANTS_RULE_AWAITABLES_CACHE_DIR": cache_dir,
+        },
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    return float(result.stdout)
+
+
+if __name__ == "__main__":
+    main()
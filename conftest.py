@@ -1,9 +1,15 @@
 # Copyright 2022 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+import os
 
 import pytest
 
+# Tests must not share the persistent cache of rule awaitables in the user's cache dir: its entries
+# are keyed by the path of each rule's source, which is different in every sandbox. Rules are
+# declared as their modules are imported, so this must be set before any tests are collected.
+os.environ["PANTS_RULE_AWAITABLES_CACHE_DIR"] = ""
+
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo[None]):
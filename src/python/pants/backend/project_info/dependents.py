@@ -4,7 +4,7 @@ import json
 from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
-from typing import Iterable, Set
+from typing import Iterable
 
 from pants.engine.addresses import Address, Addresses
 from pants.engine.collection import DeduplicatedCollection
@@ -16,17 +16,37 @@ from pants.engine.target import (
     AlwaysTraverseDeps,
     Dependencies,
     DependenciesRequest,
+    Target,
 )
 from pants.option.option_types import BoolOption, EnumOption
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
-from pants.util.ordered_set import FrozenOrderedSet
+from pants.util.ordered_set import FrozenOrderedSet, OrderedSet
 
 
 @dataclass(frozen=True)
 class AddressToDependents:
     mapping: FrozenDict[Address, FrozenOrderedSet[Address]]
 
+    def dependents_of(self, addresses: Iterable[Address], *, transitive: bool) -> set[Address]:
+        """Find the (transitive) dependents of the given addresses.
+
+        The roots are only included in the result if they are dependents of other roots.
+        """
+        dependents: set[Address] = set()
+        frontier = list(addresses)
+        while frontier:
+            next_frontier = []
+            for address in frontier:
+                for dependent in self.mapping.get(address, ()):
+                    if dependent not in dependents:
+                        dependents.add(dependent)
+                        next_frontier.append(dependent)
+            if not transitive:
+                break
+            frontier = next_frontier
+        return dependents
+
 
 class DependentsOutputFormat(Enum):
     """Output format for listing dependents.
@@ -39,8 +59,22 @@ class DependentsOutputFormat(Enum):
     json = "json"
 
 
-@rule(desc="Map all targets to their dependents", level=LogLevel.DEBUG)
-async def map_addresses_to_dependents(all_targets: AllUnexpandedTargets) -> AddressToDependents:
+@dataclass(frozen=True)
+class DirectoryDependentsRequest:
+    """The targets declared in a single directory, whose dependencies are inverted together."""
+
+    targets: tuple[Target, ...]
+
+
+@dataclass(frozen=True)
+class DirectoryDependents:
+    """The dependents declared in a single directory, of any target."""
+
+    mapping: FrozenDict[Address, FrozenOrderedSet[Address]]
+
+
+@rule(desc="Map the targets of a directory to their dependents", level=LogLevel.DEBUG)
+async def map_directory_to_dependents(request: DirectoryDependentsRequest) -> DirectoryDependents:
     dependencies_per_target = await MultiGet(
         Get(
             Addresses,
@@ -48,13 +82,39 @@ async def map_addresses_to_dependents(all_targets: AllUnexpandedTargets) -> Addr
                 tgt.get(Dependencies), should_traverse_deps_predicate=AlwaysTraverseDeps()
             ),
         )
-        for tgt in all_targets
+        for tgt in request.targets
     )
 
     address_to_dependents = defaultdict(set)
-    for tgt, dependencies in zip(all_targets, dependencies_per_target):
+    for tgt, dependencies in zip(request.targets, dependencies_per_target):
         for dependency in dependencies:
             address_to_dependents[dependency].add(tgt.address)
+    return DirectoryDependents(
+        FrozenDict(
+            {
+                addr: FrozenOrderedSet(sorted(dependents))
+                for addr, dependents in address_to_dependents.items()
+            }
+        )
+    )
+
+
+@rule(desc="Map all targets to their dependents", level=LogLevel.DEBUG)
+async def map_addresses_to_dependents(all_targets: AllUnexpandedTargets) -> AddressToDependents:
+    # The dependencies are inverted per directory, so that after an edit the engine only re-runs
+    # the inversion for the directories whose targets changed, and the rest are memoized.
+    targets_by_directory: dict[str, list[Target]] = defaultdict(list)
+    for tgt in all_targets:
+        targets_by_directory[tgt.address.spec_path].append(tgt)
+    shards = await MultiGet(
+        Get(DirectoryDependents, DirectoryDependentsRequest(tuple(targets)))
+        for _, targets in sorted(targets_by_directory.items())
+    )
+
+    address_to_dependents: dict[Address, OrderedSet[Address]] = defaultdict(OrderedSet)
+    for shard in shards:
+        for address, dependents in shard.mapping.items():
+            address_to_dependents[address].update(dependents)
     return AddressToDependents(
         FrozenDict(
             {
@@ -87,22 +147,14 @@ class Dependents(DeduplicatedCollection[Address]):
 def find_dependents(
     request: DependentsRequest, address_to_dependents: AddressToDependents
 ) -> Dependents:
-    check = set(request.addresses)
-    known_dependents: Set[Address] = set()
-    while True:
-        dependents = set(known_dependents)
-        for target in check:
-            target_dependents = address_to_dependents.mapping.get(target, FrozenOrderedSet())
-            dependents.update(target_dependents)
-        check = dependents - known_dependents
-        if not check or not request.transitive:
-            result = (
-                dependents | set(request.addresses)
-                if request.include_roots
-                else dependents - set(request.addresses)
-            )
-            return Dependents(result)
-        known_dependents = dependents
+    dependents = address_to_dependents.dependents_of(
+        request.addresses, transitive=request.transitive
+    )
+    return Dependents(
+        dependents.union(request.addresses)
+        if request.include_roots
+        else dependents.difference(request.addresses)
+    )
 
 
 class DependentsSubsystem(LineOriented, GoalSubsystem):
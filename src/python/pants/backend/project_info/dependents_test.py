@@ -6,10 +6,17 @@ from typing import Dict, List, Union
 
 import pytest
 
-from pants.backend.project_info.dependents import DependentsGoal, DependentsOutputFormat
+from pants.backend.project_info.dependents import (
+    AddressToDependents,
+    DependentsGoal,
+    DependentsOutputFormat,
+)
 from pants.backend.project_info.dependents import rules as dependent_rules
+from pants.engine.addresses import Address
 from pants.engine.target import Dependencies, SpecialCasedDependencies, Target
-from pants.testutil.rule_runner import RuleRunner
+from pants.testutil.rule_runner import QueryRule, RuleRunner
+from pants.util.frozendict import FrozenDict
+from pants.util.ordered_set import FrozenOrderedSet
 
 
 class SpecialDeps(SpecialCasedDependencies):
@@ -221,3 +228,43 @@ def test_dependents_as_json_transitive_deps(rule_runner: RuleRunner) -> None:
             "special:special": ["special:special"],
         },
     )
+
+
+def test_transitive_dependents_of() -> None:
+    a, b, c, d = Address("a"), Address("b"), Address("c"), Address("d")
+    address_to_dependents = AddressToDependents(
+        FrozenDict(
+            {
+                a: FrozenOrderedSet([b, c]),
+                b: FrozenOrderedSet([c]),
+                c: FrozenOrderedSet([d]),
+            }
+        )
+    )
+    assert address_to_dependents.dependents_of([a], transitive=False) == {b, c}
+    assert address_to_dependents.dependents_of([a], transitive=True) == {b, c, d}
+    assert address_to_dependents.dependents_of([d], transitive=True) == set()
+
+
+def test_dependents_after_edit() -> None:
+    rule_runner = RuleRunner(
+        rules=[*dependent_rules(), QueryRule(AddressToDependents, [])], target_types=[MockTarget]
+    )
+    rule_runner.write_files(
+        {
+            "base/BUILD": "tgt()",
+            "intermediate/BUILD": "tgt(dependencies=['base'])",
+            "leaf/BUILD": "tgt(dependencies=['intermediate'])",
+        }
+    )
+    base, intermediate, leaf = Address("base"), Address("intermediate"), Address("leaf")
+    assert rule_runner.request(AddressToDependents, []).mapping == FrozenDict(
+        {base: FrozenOrderedSet([intermediate]), intermediate: FrozenOrderedSet([leaf])}
+    )
+
+    # Only the directory of `leaf` changed, and the memoized inversion of the others is merged
+    # with its new one.
+    rule_runner.write_files({"leaf/BUILD": "tgt(dependencies=['base'])"})
+    assert rule_runner.request(AddressToDependents, []).mapping == FrozenDict(
+        {base: FrozenOrderedSet([intermediate, leaf])}
+    )
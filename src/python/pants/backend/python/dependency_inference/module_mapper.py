@@ -9,7 +9,7 @@ import itertools
 import logging
 import os
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import total_ordering
 from pathlib import PurePath
 from typing import DefaultDict, Iterable, Mapping, Tuple
@@ -71,6 +71,78 @@ class PossibleModuleProvider:
     ancestry: int
 
 
+class ModuleProviderTrie:
+    """A frozen prefix trie over dotted module names, mapping modules to their providers.
+
+    This allows finding the providers for a module and all of its ancestor modules with a single
+    walk, rather than repeatedly splitting the module name and looking up each ancestor.
+    """
+
+    __slots__ = ("_children", "_providers")  # Speeds up attr access significantly.
+
+    _children: dict[str, ModuleProviderTrie]
+    _providers: tuple[ModuleProvider, ...]
+
+    def __init__(
+        self, children: dict[str, ModuleProviderTrie], providers: tuple[ModuleProvider, ...]
+    ) -> None:
+        self._children = children
+        self._providers = providers
+
+    @classmethod
+    def create(
+        cls, modules_to_providers: Mapping[str, Iterable[ModuleProvider]]
+    ) -> ModuleProviderTrie:
+        # Each mutable node is a pair of its children and its providers.
+        root: tuple[dict, list[ModuleProvider]] = ({}, [])
+        for module, providers in modules_to_providers.items():
+            node = root
+            for part in module.split("."):
+                node = node[0].setdefault(part, ({}, []))
+            node[1].extend(providers)
+
+        def freeze(node: tuple[dict, list[ModuleProvider]]) -> ModuleProviderTrie:
+            return cls(
+                {part: freeze(child) for part, child in node[0].items()},
+                tuple(node[1]),
+            )
+
+        return freeze(root)
+
+    def providers_for_module(
+        self, module: str, *, max_ancestry: int | None = None
+    ) -> tuple[PossibleModuleProvider, ...]:
+        """Find the providers for the closest of the module and its ancestors which has any.
+
+        If `max_ancestry` is set, ancestors further than that many levels up are not considered.
+        """
+        parts = module.split(".")
+        closest: tuple[int, tuple[ModuleProvider, ...]] | None = None
+        node = self
+        for depth, part in enumerate(parts, start=1):
+            child = node._children.get(part)
+            if child is None:
+                break
+            node = child
+            if node._providers:
+                closest = (len(parts) - depth, node._providers)
+        if closest is None:
+            return ()
+        ancestry, providers = closest
+        if max_ancestry is not None and ancestry > max_ancestry:
+            return ()
+        return tuple(PossibleModuleProvider(provider, ancestry) for provider in providers)
+
+
+def _tries_per_resolve(
+    resolves_to_modules_to_providers: Mapping[ResolveName, Mapping[str, Iterable[ModuleProvider]]]
+) -> dict[ResolveName, ModuleProviderTrie]:
+    return {
+        resolve: ModuleProviderTrie.create(modules_to_providers)
+        for resolve, modules_to_providers in resolves_to_modules_to_providers.items()
+    }
+
+
 def module_from_stripped_path(path: PurePath) -> str:
     module_name_with_slashes = (
         path.parent if path.name in ("__init__.py", "__init__.pyi") else path.with_suffix("")
@@ -152,45 +224,44 @@ class FirstPartyPythonModuleMapping:
     implementations for each codegen backends.
     """
 
+    _tries: dict[ResolveName, ModuleProviderTrie] = field(
+        init=False, repr=False, compare=False, hash=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_tries", _tries_per_resolve(self.resolves_to_modules_to_providers)
+        )
+
     def _providers_for_resolve(
-        self, module: str, resolve: str
+        self, module: str, resolve: str, max_ancestry: int
     ) -> tuple[PossibleModuleProvider, ...]:
-        mapping = self.resolves_to_modules_to_providers.get(resolve)
-        if not mapping:
-            return ()
-
-        result = mapping.get(module, ())
-        if result:
-            return tuple(PossibleModuleProvider(provider, 0) for provider in result)
-
-        # If the module is not found, try the parent, if any. This is to handle `from` imports
-        # where the "module" we were handed was actually a symbol inside the module.
-        # E.g., with `from my_project.app import App`, we would be passed "my_project.app.App".
-        #
-        # We do not look past the direct parent, as this could cause multiple ambiguous owners to
-        # be resolved. This contrasts with the third-party module mapping, which will try every
-        # ancestor.
-        # TODO: Now that we capture the ancestry, we could look past the direct parent.
-        #  One reason to do so would be to unify more of the FirstParty and ThirdParty impls.
-        if "." not in module:
+        trie = self._tries.get(resolve)
+        if not trie:
             return ()
-        parent_module = module.rsplit(".", maxsplit=1)[0]
-        parent_providers = mapping.get(parent_module, ())
-        return tuple(PossibleModuleProvider(mp, 1) for mp in parent_providers)
+        return trie.providers_for_module(module, max_ancestry=max_ancestry)
 
     def providers_for_module(
-        self, module: str, resolve: str | None
+        self, module: str, resolve: str | None, *, max_ancestry: int = 1
     ) -> tuple[PossibleModuleProvider, ...]:
         """Find all providers for the module.
 
         If `resolve` is None, will not consider resolves, i.e. any `python_source` et al can be
         used. Otherwise, providers can only come from first-party targets with the resolve.
+
+        If the module is not found, its ancestors are tried, up to `max_ancestry` levels. By
+        default, only the direct parent is tried. This is to handle `from` imports where the
+        "module" we were handed was actually a symbol inside the module: e.g., with
+        `from my_project.app import App`, we would be passed "my_project.app.App". Looking further
+        could cause imports of missing first-party modules to be inferred as dependencies on
+        their packages. This contrasts with the third-party module mapping, which will try every
+        ancestor.
         """
         if resolve:
-            return self._providers_for_resolve(module, resolve)
+            return self._providers_for_resolve(module, resolve, max_ancestry)
         return tuple(
             itertools.chain.from_iterable(
-                self._providers_for_resolve(module, resolve)
+                self._providers_for_resolve(module, resolve, max_ancestry)
                 for resolve in list(self.resolves_to_modules_to_providers.keys())
             )
         )
@@ -278,24 +349,24 @@ class ThirdPartyPythonModuleMapping:
     resolves_to_modules_to_providers: FrozenDict[
         ResolveName, FrozenDict[str, Tuple[ModuleProvider, ...]]
     ]
+    _tries: dict[ResolveName, ModuleProviderTrie] = field(
+        init=False, repr=False, compare=False, hash=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_tries", _tries_per_resolve(self.resolves_to_modules_to_providers)
+        )
 
     def _providers_for_resolve(
-        self, module: str, resolve: str, ancestry: int = 0
+        self, module: str, resolve: str
     ) -> tuple[PossibleModuleProvider, ...]:
-        mapping = self.resolves_to_modules_to_providers.get(resolve)
-        if not mapping:
+        trie = self._tries.get(resolve)
+        if not trie:
             return ()
-
-        result = mapping.get(module, ())
-        if result:
-            return tuple(PossibleModuleProvider(mp, ancestry) for mp in result)
-
-        # If the module is not found, recursively try the ancestor modules, if any. For example,
+        # If the module is not found, try the ancestor modules, if any. For example,
         # pants.task.task.Task -> pants.task.task -> pants.task -> pants
-        if "." not in module:
-            return ()
-        parent_module = module.rsplit(".", maxsplit=1)[0]
-        return self._providers_for_resolve(parent_module, resolve, ancestry + 1)
+        return trie.providers_for_module(module)
 
     def providers_for_module(
         self, module: str, resolve: str | None
@@ -448,15 +519,35 @@ class PythonModuleOwnersRequest:
     locality: str | None = None
 
 
-@rule
-async def map_module_to_address(
-    request: PythonModuleOwnersRequest,
+@dataclass(frozen=True)
+class PythonModulesOwnersRequest:
+    """A request for the owners of several Python modules, e.g. all of the imports of a file.
+
+    This is equivalent to a `PythonModuleOwnersRequest` per module, but is resolved in a single
+    rule invocation, which avoids creating an engine node per module.
+    """
+
+    modules: tuple[str, ...]
+    resolve: str | None
+    # See `PythonModuleOwnersRequest.locality`.
+    locality: str | None = None
+
+
+@dataclass(frozen=True)
+class PythonModulesOwners:
+    owners: FrozenDict[str, PythonModuleOwners]
+
+
+def _owners_for_module(
+    module: str,
+    resolve: str | None,
+    locality: str | None,
     first_party_mapping: FirstPartyPythonModuleMapping,
     third_party_mapping: ThirdPartyPythonModuleMapping,
 ) -> PythonModuleOwners:
     possible_providers: tuple[PossibleModuleProvider, ...] = (
-        *third_party_mapping.providers_for_module(request.module, resolve=request.resolve),
-        *first_party_mapping.providers_for_module(request.module, resolve=request.resolve),
+        *third_party_mapping.providers_for_module(module, resolve=resolve),
+        *first_party_mapping.providers_for_module(module, resolve=resolve),
     )
 
     # We first attempt to disambiguate conflicting providers by taking - for each provider type -
@@ -478,7 +569,7 @@ async def map_module_to_address(
         if possible_provider.ancestry == val[0]:
             val[1].append(possible_provider.provider)
 
-    if request.locality:
+    if locality:
         # For each provider type, if we have more than one provider left, prefer
         # the one with the closest common ancestor to the requester.
         for val in type_to_closest_providers.values():
@@ -488,9 +579,7 @@ async def map_module_to_address(
             providers_with_closest_common_ancestor: list[ModuleProvider] = []
             closest_common_ancestor_len = 0
             for provider in providers:
-                common_ancestor_len = len(
-                    os.path.commonpath([request.locality, provider.addr.spec_path])
-                )
+                common_ancestor_len = len(os.path.commonpath([locality, provider.addr.spec_path]))
                 if common_ancestor_len > closest_common_ancestor_len:
                     closest_common_ancestor_len = common_ancestor_len
                     providers_with_closest_common_ancestor = []
@@ -510,6 +599,44 @@ async def map_module_to_address(
     return PythonModuleOwners(addresses)
 
 
+@rule
+async def map_module_to_address(
+    request: PythonModuleOwnersRequest,
+    first_party_mapping: FirstPartyPythonModuleMapping,
+    third_party_mapping: ThirdPartyPythonModuleMapping,
+) -> PythonModuleOwners:
+    return _owners_for_module(
+        request.module,
+        request.resolve,
+        request.locality,
+        first_party_mapping,
+        third_party_mapping,
+    )
+
+
+@rule
+async def map_modules_to_addresses(
+    request: PythonModulesOwnersRequest,
+    first_party_mapping: FirstPartyPythonModuleMapping,
+    third_party_mapping: ThirdPartyPythonModuleMapping,
+) -> PythonModulesOwners:
+    return PythonModulesOwners(
+        FrozenDict(
+            (
+                module,
+                _owners_for_module(
+                    module,
+                    request.resolve,
+                    request.locality,
+                    first_party_mapping,
+                    third_party_mapping,
+                ),
+            )
+            for module in request.modules
+        )
+    )
+
+
 def rules():
     return (
         *collect_rules(),
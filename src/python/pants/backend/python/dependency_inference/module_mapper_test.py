@@ -30,10 +30,13 @@ from pants.backend.python.dependency_inference.default_module_mapping import (
 from pants.backend.python.dependency_inference.module_mapper import (
     FirstPartyPythonModuleMapping,
     ModuleProvider,
+    ModuleProviderTrie,
     ModuleProviderType,
     PossibleModuleProvider,
     PythonModuleOwners,
     PythonModuleOwnersRequest,
+    PythonModulesOwners,
+    PythonModulesOwnersRequest,
     ThirdPartyPythonModuleMapping,
     generate_mappings_from_pattern,
     module_from_stripped_path,
@@ -178,6 +181,33 @@ def test_first_party_modules_mapping() -> None:
     assert_addresses("two_resolves", (root_provider0,), resolve="default")
     assert_addresses("two_resolves", (test_provider0,), resolve="another")
 
+    # Ancestors beyond the direct parent are only considered when requested.
+    assert mapping.providers_for_module("root.submodule.func", None, max_ancestry=None) == (
+        PossibleModuleProvider(root_provider, 2),
+    )
+    assert mapping.providers_for_module("util.strutil.a.b.c", None, max_ancestry=2) == ()
+    assert mapping.providers_for_module("util.strutil.a.b", None, max_ancestry=2) == (
+        PossibleModuleProvider(util_provider, 2),
+        PossibleModuleProvider(util_stubs_provider, 2),
+    )
+
+
+def test_module_provider_trie() -> None:
+    a = ModuleProvider(Address("", target_name="a"), ModuleProviderType.IMPL)
+    b = ModuleProvider(Address("", target_name="b"), ModuleProviderType.IMPL)
+    c = ModuleProvider(Address("", target_name="c"), ModuleProviderType.TYPE_STUB)
+    trie = ModuleProviderTrie.create({"foo": (a,), "foo.bar.baz": (b, c)})
+
+    assert trie.providers_for_module("foo") == (PossibleModuleProvider(a, 0),)
+    assert trie.providers_for_module("foo.bar") == (PossibleModuleProvider(a, 1),)
+    assert trie.providers_for_module("foo.bar.baz.qux") == (
+        PossibleModuleProvider(b, 1),
+        PossibleModuleProvider(c, 1),
+    )
+    assert trie.providers_for_module("foo.bar.qux.quux") == (PossibleModuleProvider(a, 3),)
+    assert trie.providers_for_module("foo.bar.qux.quux", max_ancestry=2) == ()
+    assert trie.providers_for_module("bar") == ()
+
 
 def test_third_party_modules_mapping() -> None:
     colors_provider = ModuleProvider(Address("", target_name="ansicolors"), ModuleProviderType.IMPL)
@@ -269,6 +299,7 @@ def rule_runner() -> RuleRunner:
             QueryRule(FirstPartyPythonModuleMapping, []),
             QueryRule(ThirdPartyPythonModuleMapping, []),
             QueryRule(PythonModuleOwners, [PythonModuleOwnersRequest]),
+            QueryRule(PythonModulesOwners, [PythonModulesOwnersRequest]),
         ],
         target_types=[
             PythonSourceTarget,
@@ -915,6 +946,42 @@ def test_map_module_considers_resolves(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_map_modules_to_addresses(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "BUILD": dedent(
+                """\
+                python_requirement(name="req", requirements=["req"])
+                python_requirement(name="dep1", requirements=["dep"])
+                python_requirement(name="dep2", requirements=["dep"])
+                """
+            ),
+            "src/python/project/BUILD": "python_sources()",
+            "src/python/project/app.py": "",
+        }
+    )
+    rule_runner.set_options(["--source-root-patterns=['src/python']"])
+    modules = ("req.submodule", "dep", "project.app.App", "unowned")
+    owners = rule_runner.request(
+        PythonModulesOwners, [PythonModulesOwnersRequest(modules, resolve=None)]
+    )
+    assert owners.owners == {
+        module: rule_runner.request(
+            PythonModuleOwners, [PythonModuleOwnersRequest(module, resolve=None)]
+        )
+        for module in modules
+    }
+    assert owners.owners["req.submodule"].unambiguous == (Address("", target_name="req"),)
+    assert owners.owners["dep"].ambiguous == (
+        Address("", target_name="dep1"),
+        Address("", target_name="dep2"),
+    )
+    assert owners.owners["project.app.App"].unambiguous == (
+        Address("src/python/project", relative_file_path="app.py"),
+    )
+    assert owners.owners["unowned"] == PythonModuleOwners(())
+
+
 def test_issue_15111(rule_runner: RuleRunner) -> None:
     """Ensure we can handle when a single address provides multiple modules.
 
@@ -17,6 +17,8 @@ from pants.backend.python.dependency_inference.default_unowned_dependencies impo
 from pants.backend.python.dependency_inference.module_mapper import (
     PythonModuleOwners,
     PythonModuleOwnersRequest,
+    PythonModulesOwners,
+    PythonModulesOwnersRequest,
     ResolveName,
 )
 from pants.backend.python.dependency_inference.parse_python_dependencies import (
@@ -413,13 +415,11 @@ async def resolve_parsed_dependencies(
         locality = source_root.path
 
     if parsed_imports:
-        owners_per_import = await MultiGet(
-            Get(
-                PythonModuleOwners,
-                PythonModuleOwnersRequest(imported_module, request.resolve, locality),
-            )
-            for imported_module in parsed_imports
+        owners = await Get(
+            PythonModulesOwners,
+            PythonModulesOwnersRequest(tuple(parsed_imports), request.resolve, locality),
         )
+        owners_per_import = [owners.owners[imported_module] for imported_module in parsed_imports]
         resolve_results = _get_imports_info(
             address=request.field_set.address,
             owners_per_import=owners_per_import,
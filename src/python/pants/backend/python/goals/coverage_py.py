@@ -6,9 +6,10 @@ from __future__ import annotations
 import configparser
 from dataclasses import dataclass
 from enum import Enum
+from hashlib import sha256
 from io import StringIO
 from pathlib import PurePath
-from typing import Any, MutableMapping, cast
+from typing import Any, Iterable, Mapping, MutableMapping, cast
 
 import toml
 
@@ -51,6 +52,7 @@ from pants.option.option_types import (
     EnumListOption,
     FileOption,
     FloatOption,
+    IntOption,
     StrListOption,
     StrOption,
 )
@@ -199,6 +201,24 @@ class CoverageSubsystem(PythonToolBase):
         ),
     )
 
+    merge_fan_in = IntOption(
+        default=50,
+        advanced=True,
+        help=softwrap(
+            """
+            The number of coverage data files to combine at once when merging the coverage
+            data of many batches of tests.
+
+            Data files are combined in a tree of groups of about this size, whose merges run in
+            parallel and are cached, so that a run in which only some batches of tests ran
+            again only has to redo the merges of their groups, before merging a few groups
+            into the final data file.
+
+            Set to 0 to combine all the data files in a single step.
+            """
+        ),
+    )
+
     def output_dir(self, distdir: DistDir) -> PurePath:
         return PurePath(self._output_dir.format(distdir=distdir.relpath))
 
@@ -366,6 +386,76 @@ class MergedCoverageData:
     addresses: tuple[Address, ...]
 
 
+def coverage_merge_groups(paths: Iterable[str], fan_in: int) -> list[tuple[str, ...]]:
+    """Split the given data files into groups of about `fan_in` files, for a level of a tree merge.
+
+    A group ends after a path whose hash is a multiple of `fan_in`, rather than after a fixed
+    number of paths, so that adding or removing a batch of tests only changes the group that it
+    falls into, and the merges of the other groups remain cached. No group has more than twice
+    `fan_in` paths.
+    """
+    groups: list[tuple[str, ...]] = []
+    group: list[str] = []
+    for path in sorted(paths):
+        group.append(path)
+        boundary = int(sha256(path.encode()).hexdigest()[:8], 16) % fan_in == 0
+        if boundary or len(group) >= 2 * fan_in:
+            groups.append(tuple(group))
+            group = []
+    if group:
+        groups.append(tuple(group))
+    return groups
+
+
+async def _combine_coverage_data(
+    coverage_setup: CoverageSetup, data_files: Mapping[str, Digest]
+) -> Digest:
+    input_digest = await Get(Digest, MergeDigests(data_files.values()))
+    result = await Get(
+        ProcessResult,
+        VenvPexProcess(
+            coverage_setup.pex,
+            # We tell combine to keep the original input files, to aid debugging in the sandbox.
+            argv=("combine", "--keep", *sorted(data_files)),
+            input_digest=input_digest,
+            output_files=(".coverage",),
+            description=f"Merge {len(data_files)} Pytest coverage reports.",
+            level=LogLevel.DEBUG,
+        ),
+    )
+    return result.output_digest
+
+
+async def _merge_coverage_data_group(
+    coverage_setup: CoverageSetup, data_files: Mapping[str, Digest]
+) -> tuple[str, Digest]:
+    """Merge a group of data files into a single one, named after the group."""
+    name = sha256("\n".join(sorted(data_files)).encode()).hexdigest()[:16]
+    merged = await _combine_coverage_data(coverage_setup, data_files)
+    prefix = f"__merged__/{name}"
+    return f"{prefix}/.coverage", await Get(Digest, AddPrefix(merged, prefix))
+
+
+async def _tree_merge_coverage_data(
+    coverage_setup: CoverageSetup, data_files: Mapping[str, Digest], fan_in: int
+) -> Mapping[str, Digest]:
+    """Merge the given data files in parallel groups until at most `fan_in` of them are left."""
+    while fan_in > 1 and len(data_files) > fan_in:
+        groups = coverage_merge_groups(data_files, fan_in)
+        if len(groups) in (1, len(data_files)):
+            # Merging would not reduce the number of data files for the final merge.
+            break
+        data_files = dict(
+            await MultiGet(  # noqa: PNT30: each level merges the outputs of the previous one
+                _merge_coverage_data_group(
+                    coverage_setup, {path: data_files[path] for path in group}
+                )
+                for group in groups
+            )
+        )
+    return data_files
+
+
 @rule(desc="Merge Pytest coverage data", level=LogLevel.DEBUG)
 async def merge_coverage_data(
     data_collection: PytestCoverageDataCollection,
@@ -391,6 +481,14 @@ async def merge_coverage_data(
         coverage_data_file_paths.append(f"{path_prefix}/.coverage")
         addresses.extend(data.addresses)
 
+    data_files = dict(
+        await _tree_merge_coverage_data(
+            coverage_setup,
+            dict(zip(coverage_data_file_paths, await MultiGet(coverage_digest_gets))),
+            coverage.merge_fan_in,
+        )
+    )
+
     if coverage.global_report:
         # It's important to set the `branch` value in the empty base report to the value it will
         # have when running on real inputs, so that the reports are of the same type, and can be
@@ -457,30 +555,15 @@ async def merge_coverage_data(
                 level=LogLevel.DEBUG,
             ),
         )
-        coverage_digest_gets.append(
-            Get(
-                Digest, AddPrefix(digest=result.output_digest, prefix=str(global_coverage_base_dir))
-            )
+        data_files[str(global_coverage_base_dir / ".coverage")] = await Get(
+            Digest, AddPrefix(digest=result.output_digest, prefix=str(global_coverage_base_dir))
         )
-        coverage_data_file_paths.append(str(global_coverage_base_dir / ".coverage"))
     else:
         extra_sources_digest = EMPTY_DIGEST
 
-    input_digest = await Get(Digest, MergeDigests(await MultiGet(coverage_digest_gets)))
-    result = await Get(
-        ProcessResult,
-        VenvPexProcess(
-            coverage_setup.pex,
-            # We tell combine to keep the original input files, to aid debugging in the sandbox.
-            argv=("combine", "--keep", *sorted(coverage_data_file_paths)),
-            input_digest=input_digest,
-            output_files=(".coverage",),
-            description=f"Merge {len(coverage_data_file_paths)} Pytest coverage reports.",
-            level=LogLevel.DEBUG,
-        ),
-    )
+    merged_digest = await _combine_coverage_data(coverage_setup, data_files)
     return MergedCoverageData(
-        await Get(Digest, MergeDigests((result.output_digest, extra_sources_digest))),
+        await Get(Digest, MergeDigests((merged_digest, extra_sources_digest))),
         tuple(addresses),
     )
 
@@ -7,6 +7,7 @@ from textwrap import dedent
 
 from pants.backend.python.goals.coverage_py import (
     CoverageSubsystem,
+    coverage_merge_groups,
     create_or_update_coverage_config,
     get_branch_value_from_config,
     get_namespace_value_from_config,
@@ -439,3 +440,18 @@ def test_get_namespace_value_from_config() -> None:
         )
         is True
     )
+
+
+def test_coverage_merge_groups() -> None:
+    paths = [f"src/python/project/test_{i}.py/.coverage" for i in range(1000)]
+    groups = coverage_merge_groups(reversed(paths), 20)
+    assert [path for group in groups for path in group] == sorted(paths)
+    assert all(len(group) <= 40 for group in groups)
+    assert 10 < len(groups) < 100
+
+    # Adding a path only changes the group that it falls into.
+    new_path = "src/python/project/test_new.py/.coverage"
+    new_groups = coverage_merge_groups([*paths, new_path], 20)
+    changed = set(new_groups) - set(groups)
+    assert 1 <= len(changed) <= 2
+    assert any(new_path in group for group in changed)
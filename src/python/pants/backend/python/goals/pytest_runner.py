@@ -67,6 +67,7 @@ from pants.engine.fs import (
     DigestContents,
     DigestSubset,
     Directory,
+    FileContent,
     MergeDigests,
     PathGlobs,
     RemovePrefix,
@@ -76,6 +77,7 @@ from pants.engine.process import (
     InteractiveProcess,
     Process,
     ProcessCacheScope,
+    ProcessExecutionEnvironment,
     ProcessResultWithRetries,
     ProcessWithRetries,
 )
@@ -93,6 +95,7 @@ from pants.util.docutil import doc_url
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.pip_requirement import PipRequirement
+from pants.util.resources import read_resource
 from pants.util.strutil import softwrap
 
 logger = logging.getLogger()
@@ -172,6 +175,10 @@ async def run_all_setup_plugins(
 # ./pants test <target> -- --html=extra-output/report.html
 _EXTRA_OUTPUT_DIR = "extra-output"
 
+# Runs batches of tests in forks of a long-lived worker, for `[pytest].worker_pool`.
+_pytest_worker_resource = "scripts/pytest_worker.py"
+_named_cache_venv_resource = ("pants.backend.python.util_rules.scripts", "named_cache_venv.py")
+
 
 @dataclass(frozen=True)
 class TestMetadata:
@@ -258,6 +265,7 @@ async def setup_pytest_for_target(
     coverage_config: CoverageConfig,
     coverage_subsystem: CoverageSubsystem,
     test_extra_env: TestExtraEnv,
+    environment: ProcessExecutionEnvironment,
 ) -> TestSetup:
     addresses = tuple(field_set.address for field_set in request.field_sets)
 
@@ -269,7 +277,10 @@ async def setup_pytest_for_target(
 
     interpreter_constraints = request.metadata.interpreter_constraints
 
-    requirements_pex_get = Get(Pex, RequirementsPexRequest(addresses))
+    requirements_pex_get = Get(
+        Pex,
+        RequirementsPexRequest(addresses, use_entire_lockfile=pytest.run_against_entire_lockfile),
+    )
     pytest_pex_get = Get(
         Pex, PexRequest, pytest.to_pex_request(interpreter_constraints=interpreter_constraints)
     )
@@ -436,6 +447,45 @@ async def setup_pytest_for_target(
             else:
                 timeout_seconds = timeout
 
+    argv: tuple[str, ...] = (
+        *request.prepend_argv,
+        *pytest.args,
+        *(("-c", pytest.config) if pytest.config else ()),
+        *(("-n", "{pants_concurrency}") if xdist_concurrency else ()),
+        # N.B.: Now that we're using command-line options instead of the PYTEST_ADDOPTS
+        # environment variable, it's critical that `pytest_args` comes after `pytest.args`.
+        *pytest_args,
+        *field_set_source_files.files,
+    )
+
+    # Forks of a worker can't be debugged, nor spawn `pytest-xdist` workers, as those start a new
+    # interpreter outside of the venv's usual environment.
+    append_only_caches: dict[str, str] = {}
+    if (
+        pytest.worker_pool
+        and not request.is_debug
+        and not xdist_concurrency
+        and not environment.remote_execution
+    ):
+        worker = FileContent("__pytest_worker.py", read_resource(__name__, _pytest_worker_resource))
+        named_cache_venv = FileContent(
+            "__named_cache_venv.py", read_resource(*_named_cache_venv_resource)
+        )
+        worker_digest = await Get(Digest, CreateDigest([worker, named_cache_venv]))
+        input_digest = await Get(Digest, MergeDigests([input_digest, worker_digest]))
+        named_cache_dir = ".cache/pytest_workers"
+        append_only_caches["pytest_workers"] = named_cache_dir
+        # Run the worker script with the interpreter of the venv, rather than pytest itself.
+        extra_env["PEX_INTERPRETER"] = "1"
+        argv = (
+            worker.path,
+            f"--pool-dir={named_cache_dir}",
+            f"--idle-timeout={pytest.worker_pool_idle_timeout}",
+            *(f"--preload={module}" for module in pytest.worker_pool_preload),
+            "--",
+            *argv,
+        )
+
     run_description = request.field_sets[0].address.spec
     if len(request.field_sets) > 1:
         run_description = f"batch of {run_description} and {len(request.field_sets)-1} other files"
@@ -443,16 +493,7 @@ async def setup_pytest_for_target(
         Process,
         VenvPexProcess(
             pytest_runner_pex,
-            argv=(
-                *request.prepend_argv,
-                *pytest.args,
-                *(("-c", pytest.config) if pytest.config else ()),
-                *(("-n", "{pants_concurrency}") if xdist_concurrency else ()),
-                # N.B.: Now that we're using command-line options instead of the PYTEST_ADDOPTS
-                # environment variable, it's critical that `pytest_args` comes after `pytest.args`.
-                *pytest_args,
-                *field_set_source_files.files,
-            ),
+            argv=argv,
             extra_env=extra_env,
             input_digest=input_digest,
             output_directories=(_EXTRA_OUTPUT_DIR,),
@@ -463,6 +504,7 @@ async def setup_pytest_for_target(
             description=f"Run Pytest for {run_description}",
             level=LogLevel.DEBUG,
             cache_scope=cache_scope,
+            append_only_caches=append_only_caches,
         ),
     )
     return TestSetup(process, results_file_name=results_file_name)
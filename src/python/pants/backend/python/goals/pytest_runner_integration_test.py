@@ -453,6 +453,43 @@ def test_force(rule_runner: PythonRuleRunner) -> None:
     assert result_one is result_two
 
 
+def test_worker_pool(rule_runner: PythonRuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            f"{PACKAGE}/tests.py": dedent(
+                """\
+                import os
+                import sys
+
+                def test_env():
+                    assert os.environ["SOME_VAR"] == "some_value"
+
+                def test_fails():
+                    assert False
+
+                def test_forked_from_worker():
+                    # Only imported by the worker, which preloads it.
+                    assert "colorsys" in sys.modules
+                """
+            ),
+            f"{PACKAGE}/BUILD": "python_tests(extra_env_vars=['SOME_VAR=some_value'])",
+        }
+    )
+    tgt = rule_runner.get_target(Address(PACKAGE, relative_file_path="tests.py"))
+    extra_args = [
+        "--pytest-worker-pool",
+        "--pytest-worker-pool-preload=['colorsys']",
+        "--pytest-worker-pool-idle-timeout=30",
+        "--test-force",
+    ]
+    # The first run starts a worker, and both runs are forked from it.
+    for _ in range(2):
+        result = run_pytest(rule_runner, [tgt], extra_args=extra_args)
+        assert result.exit_code == 1
+        assert result.xml_results is not None
+        assert f"{PACKAGE}/tests.py .F." in result.stdout_simplified_str
+
+
 def test_extra_output(rule_runner: PythonRuleRunner) -> None:
     rule_runner.write_files(
         {
@@ -0,0 +1,285 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+# NB: This runs with the interpreter of the pytest runner venv, so it must be compatible with every
+# Python that pytest supports.
+#
+# Runs pytest in a fresh fork of a long-lived "zygote" process, which has already started the
+# interpreter of the venv and imported pytest and the modules to preload, so that each batch of
+# tests doesn't pay for that again.
+#
+# This script is both the client, which runs in the sandbox of a batch, and the zygote, which the
+# client starts if there is none yet for its venv and preloaded modules. The zygote listens on a
+# Unix socket under a named cache and, for each connection, forks a child which takes on the
+# working directory, environment, `sys.path` and standard streams of the client, runs pytest and
+# reports its exit code back. The zygote is started from the sandbox of a batch, but drops the
+# entries of `sys.path` in that sandbox before importing anything, so every batch starts from the
+# same state.
+#
+# If the zygote can't be reached or started, pytest runs in the client instead, just as it would
+# without the worker pool.
+
+from __future__ import annotations
+
+import argparse
+import array
+import fcntl
+import hashlib
+import importlib
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+# Copied next to this script from `pants.backend.python.util_rules.scripts`.
+from __named_cache_venv import stable_executable
+
+_STARTUP_TIMEOUT_SECONDS = 60.0
+# The standard streams of the client.
+_STREAMS = (0, 1, 2)
+
+
+def send_message(sock: socket.socket, message: dict, fds: tuple[int, ...] = ()) -> None:
+    data = json.dumps(message).encode() + b"\n"
+    if fds:
+        sent = sock.sendmsg([data], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", fds))])
+        data = data[sent:]
+    sock.sendall(data)
+
+
+def receive_request(sock: socket.socket) -> tuple[dict | None, list[int]]:
+    """Receive the single message sent by a client, along with the file descriptors it passed."""
+    fds = array.array("i")
+    data, ancdata, _, _ = sock.recvmsg(64 * 1024, socket.CMSG_LEN(len(_STREAMS) * fds.itemsize))
+    for level, kind, cmsg_data in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(cmsg_data[: len(cmsg_data) - len(cmsg_data) % fds.itemsize])
+    while not data.endswith(b"\n"):
+        chunk = sock.recv(64 * 1024)
+        if not chunk:
+            return None, list(fds)
+        data += chunk
+    return json.loads(data.decode()), list(fds)
+
+
+def exit_when_closed(sock: socket.socket) -> None:
+    # The client sends nothing after its request, and holds the connection open until we report
+    # back. So if it goes away, e.g. because it timed out and was killed, so should we.
+    try:
+        while sock.recv(1024):
+            pass
+    except OSError:
+        pass
+    os._exit(1)
+
+
+def run_batch(conn: socket.socket) -> int:
+    """Run pytest in this fork of the zygote, on behalf of the client at the other end of `conn`."""
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    conn.settimeout(None)
+    request, fds = receive_request(conn)
+    if request is None or len(fds) != len(_STREAMS):
+        return 1
+    for fd, stream in zip(fds, _STREAMS):
+        os.dup2(fd, stream)
+        os.close(fd)
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+    sys.path[:] = request["sys_path"]
+    sys.argv = ["pytest", *request["args"]]
+    # Recomputed from the environment of the batch on first use.
+    tempfile.tempdir = None
+
+    send_message(conn, {"pid": os.getpid()})
+    threading.Thread(target=exit_when_closed, args=(conn,), daemon=True).start()
+
+    exit_code = 1
+    try:
+        import pytest
+
+        exit_code = int(pytest.main(request["args"]))
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        send_message(conn, {"exit_code": exit_code})
+    # The connection is closed when this process exits, after any `atexit` hooks have run.
+    return 0
+
+
+def serve(socket_path: str, preload: list[str], idle_timeout: float) -> None:
+    # The zygote is started as `python <sandbox>/__pytest_worker.py`, so `sys.path` starts with the
+    # sandbox of the batch that started it: preloading must not import first-party code from there.
+    sandbox = os.path.join(os.path.realpath(os.getcwd()), "")
+    sys.path[:] = [
+        entry
+        for entry in sys.path
+        if not os.path.join(os.path.realpath(entry or "."), "").startswith(sandbox)
+    ]
+    os.chdir("/")
+    for module in ("pytest", *preload):
+        importlib.import_module(module)
+
+    # Bind to a temporary path and then rename it into place, which atomically replaces the socket
+    # of a zygote which died without cleaning up after itself.
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    tmp_path = f"{socket_path}.{os.getpid()}"
+    server.bind(tmp_path)
+    server.listen(64)
+    os.rename(tmp_path, socket_path)
+    inode = os.stat(socket_path).st_ino
+    server.settimeout(idle_timeout)
+    # Children report their exit code over their connection, so let the OS reap them.
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+    zygote_pid = os.getpid()
+    try:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                return
+            if os.fork() == 0:
+                server.close()
+                sys.exit(run_batch(conn))
+            conn.close()
+    finally:
+        if os.getpid() == zygote_pid:
+            try:
+                if os.stat(socket_path).st_ino == inode:
+                    os.unlink(socket_path)
+            except OSError:
+                pass
+
+
+def connect(socket_path: str) -> socket.socket:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def connect_or_start_zygote(pool_dir: str, preload: list[str], idle_timeout: str) -> socket.socket:
+    """Connect to the zygote for this venv and set of preloaded modules, starting it if needed.
+
+    Raises an `OSError` if the zygote can't be reached.
+    """
+    python = stable_executable(sys.executable)
+    script = os.path.abspath(__file__)
+    with open(script, "rb") as f:
+        script_digest = hashlib.sha256(f.read()).hexdigest()
+    key = hashlib.sha256("\0".join((script_digest, python, *preload)).encode()).hexdigest()
+    os.makedirs(pool_dir, exist_ok=True)
+    socket_path = os.path.join(pool_dir, f"{key[:16]}.sock")
+    try:
+        return connect(socket_path)
+    except OSError:
+        pass
+
+    # Concurrent batches for the same venv would each start a zygote, so serialize starting it.
+    # The lock is released by the OS if we die.
+    with open(os.path.join(pool_dir, f"{key[:16]}.lock"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            return connect(socket_path)
+        except OSError:
+            pass
+        zygote = subprocess.Popen(
+            [
+                python,
+                script,
+                f"--serve={socket_path}",
+                f"--idle-timeout={idle_timeout}",
+                *(f"--preload={module}" for module in preload),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        deadline = time.time() + _STARTUP_TIMEOUT_SECONDS
+        while True:
+            try:
+                return connect(socket_path)
+            except OSError:
+                if zygote.poll() is not None or time.time() > deadline:
+                    raise
+            time.sleep(0.05)
+
+
+def run_in_zygote(conn: socket.socket, args: list[str]) -> int | None:
+    """Run pytest in a fork of the zygote, returning None if it never started running."""
+    sys_path = sys.path
+    if sys_path and os.path.realpath(sys_path[0]) == os.path.dirname(os.path.abspath(__file__)):
+        # The directory of this script, which pytest would not have on its path.
+        sys_path = sys_path[1:]
+    request = {
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+        # Resolved, so that the entries for the venv match those of the zygote.
+        "sys_path": [os.path.realpath(entry) for entry in sys_path],
+        "args": args,
+    }
+    sys.stdout.flush()
+    sys.stderr.flush()
+    with conn, conn.makefile("rb") as reader:
+        try:
+            send_message(conn, request, fds=_STREAMS)
+            if not reader.readline():
+                return None
+        except OSError:
+            return None
+        line = reader.readline()
+        # Wait for the fork to exit, so that everything it writes is part of this process's output.
+        reader.read()
+    if not line:
+        sys.stderr.write("The pytest worker exited without reporting a result.\n")
+        return 1
+    return int(json.loads(line.decode())["exit_code"])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pool-dir")
+    parser.add_argument("--serve")
+    parser.add_argument("--idle-timeout", required=True)
+    parser.add_argument("--preload", action="append", default=[])
+    parser.add_argument("pytest_args", nargs=argparse.REMAINDER)
+    options = parser.parse_args()
+
+    if options.serve:
+        serve(options.serve, options.preload, float(options.idle_timeout))
+        return 0
+
+    args = options.pytest_args
+    if args[:1] == ["--"]:
+        args = args[1:]
+    # Set to run this script through the pytest runner PEX, and not meant for pytest.
+    os.environ.pop("PEX_INTERPRETER", None)
+
+    try:
+        conn = connect_or_start_zygote(
+            os.path.realpath(options.pool_dir), options.preload, options.idle_timeout
+        )
+    except OSError:
+        conn = None
+    if conn is not None:
+        exit_code = run_in_zygote(conn, args)
+        if exit_code is not None:
+            return exit_code
+
+    import pytest
+
+    return int(pytest.main(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,8 +3,9 @@
 
 from __future__ import annotations
 
+import os
 from collections import defaultdict
-from typing import Tuple
+from typing import Iterable, Tuple
 
 from pants.backend.python.lint.flake8.subsystem import (
     Flake8,
@@ -18,11 +19,28 @@ from pants.backend.python.util_rules.pex import PexRequest, VenvPex, VenvPexProc
 from pants.base.glob_match_error_behavior import GlobMatchErrorBehavior
 from pants.core.goals.lint import REPORT_DIR, LintResult, LintTargetsRequest, Partitions
 from pants.core.util_rules.config_files import ConfigFiles, ConfigFilesRequest
+from pants.core.util_rules.lint_result_cache import (
+    LINT_RESULT_CACHE_DIR,
+    FileLintResult,
+    LintResultCache,
+    combine_file_results,
+    fingerprint,
+)
 from pants.core.util_rules.partitions import Partition
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
-from pants.engine.fs import CreateDigest, Digest, Directory, MergeDigests, PathGlobs, RemovePrefix
+from pants.engine.fs import (
+    CreateDigest,
+    Digest,
+    DigestEntries,
+    Directory,
+    FileEntry,
+    MergeDigests,
+    PathGlobs,
+    RemovePrefix,
+)
 from pants.engine.process import FallibleProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
+from pants.option.global_options import GlobalOptions
 from pants.util.logging import LogLevel
 from pants.util.strutil import pluralize
 
@@ -32,13 +50,13 @@ class Flake8Request(LintTargetsRequest):
     tool_subsystem = Flake8
 
 
-def generate_argv(source_files: SourceFiles, flake8: Flake8) -> Tuple[str, ...]:
+def generate_argv(files: Iterable[str], flake8: Flake8) -> Tuple[str, ...]:
     args = []
     if flake8.config:
         args.append(f"--config={flake8.config}")
     args.append("--jobs={pants_concurrency}")
     args.extend(flake8.args)
-    args.extend(source_files.files)
+    args.extend(files)
     return tuple(args)
 
 
@@ -71,6 +89,7 @@ async def run_flake8(
     request: Flake8Request.Batch[Flake8FieldSet, InterpreterConstraints],
     flake8: Flake8,
     first_party_plugins: Flake8FirstPartyPlugins,
+    global_options: GlobalOptions,
 ) -> LintResult:
     interpreter_constraints = request.partition_metadata
     flake8_pex_get = Get(
@@ -116,21 +135,74 @@ async def run_flake8(
         ),
     )
 
+    files = source_files.files
+    cache = None
+    cache_keys: dict[str, str] = {}
+    cached: dict[str, FileLintResult] = {}
+    if flake8.per_file_cache:
+        cache = LintResultCache(
+            os.path.join(global_options.pants_workdir, LINT_RESULT_CACHE_DIR, Flake8.options_scope)
+        )
+        entries = await Get(DigestEntries, Digest, source_files.snapshot.digest)
+        tool_key = fingerprint(
+            str(interpreter_constraints),
+            flake8_pex.digest.fingerprint,
+            first_party_plugins.sources_digest.fingerprint,
+            config_files.snapshot.digest.fingerprint,
+            extra_files.fingerprint,
+            *generate_argv((), flake8),
+        )
+        file_keys = {
+            entry.path: fingerprint(tool_key, entry.path, entry.file_digest.fingerprint)
+            for entry in entries
+            if isinstance(entry, FileEntry)
+        }
+        cache_keys = {path: file_keys[path] for path in files}
+        cached = cache.lookup(cache_keys)
+        if len(cached) == len(files):
+            combined = combine_file_results(files, cached)
+            return LintResult(
+                exit_code=combined.exit_code,
+                stdout=combined.stdout,
+                stderr="",
+                linter_name=request.tool_name,
+                partition_description=interpreter_constraints.description,
+            )
+    files_to_lint = [path for path in files if path not in cached]
+
     result = await Get(
         FallibleProcessResult,
         VenvPexProcess(
             flake8_pex,
-            argv=generate_argv(source_files, flake8),
+            argv=generate_argv(files_to_lint, flake8),
             input_digest=input_digest,
             output_directories=(REPORT_DIR,),
             extra_env={"PEX_EXTRA_SYS_PATH": first_party_plugins.PREFIX},
-            concurrency_available=len(request.elements),
-            description=f"Run Flake8 on {pluralize(len(request.elements), 'file')}.",
+            concurrency_available=len(files_to_lint),
+            description=f"Run Flake8 on {pluralize(len(files_to_lint), 'file')}.",
             level=LogLevel.DEBUG,
         ),
     )
     report = await Get(Digest, RemovePrefix(result.output_digest, REPORT_DIR))
-    return LintResult.create(request, result, report=report)
+    if cache is None:
+        return LintResult.create(request, result, report=report)
+
+    combined = cache.splice(
+        files,
+        cache_keys,
+        cached,
+        result.exit_code,
+        result.stdout.decode(),
+        exit_code_for=lambda output: 1 if output else 0,
+    )
+    return LintResult(
+        exit_code=combined.exit_code,
+        stdout=combined.stdout,
+        stderr=result.stderr.decode(),
+        linter_name=request.tool_name,
+        partition_description=interpreter_constraints.description,
+        report=report,
+    )
 
 
 def rules():
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import os
 from textwrap import dedent
 from typing import Any
 
@@ -17,6 +18,7 @@ from pants.backend.python.target_types import PythonSourcesGeneratorTarget
 from pants.backend.python.util_rules import python_sources
 from pants.core.goals.lint import LintResult, Partitions
 from pants.core.util_rules import config_files
+from pants.core.util_rules.lint_result_cache import LINT_RESULT_CACHE_DIR
 from pants.engine.addresses import Address
 from pants.engine.fs import EMPTY_DIGEST, DigestContents
 from pants.engine.target import Target
@@ -120,6 +122,34 @@ def test_multiple_targets(rule_runner: PythonRuleRunner) -> None:
     assert "bad.py:1:1: F401" in result[0].stdout
 
 
+def test_per_file_cache(rule_runner: PythonRuleRunner) -> None:
+    rule_runner.write_files(
+        {"good.py": GOOD_FILE, "bad.py": BAD_FILE, "BUILD": "python_sources(name='t')"}
+    )
+
+    def run() -> LintResult:
+        tgts = [
+            rule_runner.get_target(Address("", target_name="t", relative_file_path="good.py")),
+            rule_runner.get_target(Address("", target_name="t", relative_file_path="bad.py")),
+        ]
+        result = run_flake8(rule_runner, tgts, extra_args=["--flake8-per-file-cache"])
+        assert len(result) == 1
+        return result[0]
+
+    result = run()
+    assert result.exit_code == 1
+    assert result.stdout == "bad.py:1:1: F401 'typing' imported but unused\n"
+    cache_dir = os.path.join(rule_runner.pants_workdir, LINT_RESULT_CACHE_DIR, "flake8")
+    assert sum(len(files) for _, _, files in os.walk(cache_dir)) == 2
+
+    # Only the changed file is linted again, and the cached result of the other is spliced in.
+    rule_runner.write_files({"good.py": f"{GOOD_FILE}print('Still nothing.')\n"})
+    result = run()
+    assert result.exit_code == 1
+    assert result.stdout == "bad.py:1:1: F401 'typing' imported but unused\n"
+    assert sum(len(files) for _, _, files in os.walk(cache_dir)) == 3
+
+
 @skip_unless_python37_and_python39_present
 def test_uses_correct_python_version(rule_runner: PythonRuleRunner) -> None:
     rule_runner.write_files(
@@ -98,6 +98,24 @@ class Flake8(PythonToolBase):
             """
         ),
     )
+    per_file_cache = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            If true, cache the results of Flake8 for each file in `<pants_workdir>`, so that
+            files which did not change are not linted again, even when other files in the same
+            batch did.
+
+            A file's results are reused while its content, Flake8, its plugins and config, and
+            `[flake8].args` and `[flake8].extra_files` are unchanged. Only the files without cached
+            results are passed to Flake8, and any report it writes only covers those files.
+
+            Results are only cached when the output of Flake8 can be attributed to individual
+            files, which requires the default output format.
+            """
+        ),
+    )
     _source_plugins = TargetListOption(
         advanced=True,
         help=softwrap(
@@ -0,0 +1,17 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+"""What the isort backend provides, so that it is only loaded when needed.
+
+See `[GLOBAL].lazy_backends`.
+"""
+
+from pants.backend.python.lint.isort import skip_field
+
+goals = ("fmt", "fix", "lint", "generate-lockfiles", "export")
+subsystems = ("isort",)
+
+
+def rules():
+    # BUILD files may set the skip field even when the backend isn't loaded.
+    return skip_field.rules()
@@ -3,8 +3,10 @@
 
 from __future__ import annotations
 
+import os
+import re
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Iterable, Mapping, Tuple
 
 import packaging
 
@@ -14,6 +16,7 @@ from pants.backend.python.lint.pylint.subsystem import (
     PylintFirstPartyPlugins,
 )
 from pants.backend.python.subsystems.setup import PythonSetup
+from pants.backend.python.target_types import PythonRequirementsField
 from pants.backend.python.util_rules import pex_from_targets
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
 from pants.backend.python.util_rules.partition import (
@@ -28,18 +31,46 @@ from pants.backend.python.util_rules.pex import (
     VenvPexRequest,
 )
 from pants.backend.python.util_rules.pex_environment import PexEnvironment
-from pants.backend.python.util_rules.pex_from_targets import RequirementsPexRequest
+from pants.backend.python.util_rules.pex_from_targets import (
+    ChosenPythonResolve,
+    ChosenPythonResolveRequest,
+    RequirementsPexRequest,
+)
+from pants.backend.python.util_rules.pex_requirements import LoadedLockfile, LoadedLockfileRequest
 from pants.backend.python.util_rules.python_sources import (
     PythonSourceFiles,
     PythonSourceFilesRequest,
 )
 from pants.core.goals.lint import REPORT_DIR, LintResult, LintTargetsRequest, Partitions
 from pants.core.util_rules.config_files import ConfigFiles, ConfigFilesRequest
+from pants.core.util_rules.lint_result_cache import (
+    LINT_RESULT_CACHE_DIR,
+    FileLintResult,
+    LintResultCache,
+    combine_file_results,
+    fingerprint,
+)
 from pants.core.util_rules.partitions import Partition
-from pants.engine.fs import CreateDigest, Digest, Directory, MergeDigests, RemovePrefix
+from pants.engine.addresses import Addresses
+from pants.engine.fs import (
+    CreateDigest,
+    Digest,
+    DigestEntries,
+    Directory,
+    FileEntry,
+    MergeDigests,
+    RemovePrefix,
+)
 from pants.engine.process import FallibleProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
-from pants.engine.target import CoarsenedTargets, CoarsenedTargetsRequest
+from pants.engine.target import (
+    CoarsenedTargets,
+    CoarsenedTargetsRequest,
+    SingleSourceField,
+    SourcesField,
+    Target,
+)
+from pants.option.global_options import GlobalOptions
 from pants.util.logging import LogLevel
 from pants.util.strutil import pluralize
 
@@ -62,16 +93,64 @@ class PylintRequest(LintTargetsRequest):
     tool_subsystem = Pylint
 
 
-def generate_argv(field_sets: tuple[PylintFieldSet, ...], pylint: Pylint) -> Tuple[str, ...]:
+def generate_argv(field_sets: Iterable[PylintFieldSet], pylint: Pylint) -> Tuple[str, ...]:
     args = []
     if pylint.config is not None:
         args.append(f"--rcfile={pylint.config}")
     args.append("--jobs={pants_concurrency}")
     args.extend(pylint.args)
+    if pylint.per_file_cache:
+        # The scores of separate runs can't be combined, so don't print a misleading one.
+        args.append("--score=n")
     args.extend(field_set.source.file_path for field_set in field_sets)
     return tuple(args)
 
 
+# The exit code bit which Pylint sets for each message category, see
+# https://pylint.readthedocs.io/en/stable/user_guide/usage/run.html#exit-codes.
+_PYLINT_EXIT_CODE_BITS = {"F": 1, "E": 2, "W": 4, "R": 8, "C": 16}
+_PYLINT_MESSAGE_ID = re.compile(r"^[^\n]*?:\d+:\d+: ([A-Z])\d+: ", re.MULTILINE)
+# Messages which depend on the other files that Pylint was run on, rather than only on the closure
+# of the file they are reported for, by id or by name.
+_PYLINT_CROSS_FILE_MESSAGE = re.compile(r"\b(R0401|R0801|cyclic-import|duplicate-code)\b")
+
+
+def _pylint_exit_code(output: str) -> int:
+    exit_code = 0
+    for category in _PYLINT_MESSAGE_ID.findall(output):
+        exit_code |= _PYLINT_EXIT_CODE_BITS.get(category, 0)
+    return exit_code
+
+
+def _is_pylint_module_header(line: str) -> bool:
+    return line.startswith("************* Module ")
+
+
+def _has_cross_file_messages(output: str) -> bool:
+    return _PYLINT_CROSS_FILE_MESSAGE.search(output) is not None
+
+
+def _closure_fingerprint(targets: Iterable[Target], file_digests: Mapping[str, str]) -> str | None:
+    """A fingerprint of the sources and requirements of the given targets.
+
+    Returns None if the content of some source can't be determined, e.g. because it is generated.
+    """
+    parts = []
+    for target in sorted(targets, key=lambda t: t.address):
+        parts.append(target.address.spec)
+        if target.has_field(SourcesField):
+            sources = target[SourcesField]
+            if not isinstance(sources, SingleSourceField):
+                return None
+            file_digest = file_digests.get(sources.file_path)
+            if file_digest is None:
+                return None
+            parts.append(file_digest)
+        if target.has_field(PythonRequirementsField):
+            parts.extend(str(req) for req in target[PythonRequirementsField].value)
+    return fingerprint(*parts)
+
+
 @rule(desc="Determine if necessary to partition Pylint input", level=LogLevel.DEBUG)
 async def partition_pylint(
     request: PylintRequest.PartitionRequest[PylintFieldSet],
@@ -120,6 +199,8 @@ async def run_pylint(
     pylint: Pylint,
     first_party_plugins: PylintFirstPartyPlugins,
     pex_environment: PexEnvironment,
+    python_setup: PythonSetup,
+    global_options: GlobalOptions,
 ) -> LintResult:
     assert request.partition_metadata is not None
 
@@ -172,34 +253,99 @@ async def run_pylint(
         report_directory_digest_get,
     )
 
+    config_files_get = Get(
+        ConfigFiles,
+        ConfigFilesRequest,
+        pylint.config_request(sources.source_files.snapshot.dirs),
+    )
+
+    field_sets = request.elements
+    config_files: ConfigFiles | None = None
+    cache = None
+    cache_keys: dict[str, str] = {}
+    cached: dict[str, FileLintResult] = {}
+    if pylint.per_file_cache:
+        cache = LintResultCache(
+            os.path.join(global_options.pants_workdir, LINT_RESULT_CACHE_DIR, Pylint.options_scope)
+        )
+        entries, config_files = await MultiGet(
+            Get(DigestEntries, Digest, sources.source_files.snapshot.digest), config_files_get
+        )
+        file_digests = {
+            entry.path: entry.file_digest.fingerprint
+            for entry in entries
+            if isinstance(entry, FileEntry)
+        }
+        # NB: The requirement strings are accounted for per file, as the requirements PEX of a
+        # batch depends on which other files are in it. What they resolve to is determined by the
+        # lockfile of the resolve, if any: otherwise by the requirements PEX itself.
+        if python_setup.enable_resolves:
+            chosen_resolve = await Get(
+                ChosenPythonResolve,
+                ChosenPythonResolveRequest(Addresses(fs.address for fs in request.elements)),
+            )
+            loaded_lockfile = await Get(
+                LoadedLockfile, LoadedLockfileRequest(chosen_resolve.lockfile)
+            )
+            requirements_digest = loaded_lockfile.lockfile_digest
+        else:
+            requirements_digest = requirements_pex.digest
+        tool_key = fingerprint(
+            request.partition_metadata.description,
+            pylint_pex.digest.fingerprint,
+            requirements_digest.fingerprint,
+            first_party_plugins.sources_digest.fingerprint,
+            config_files.snapshot.digest.fingerprint,
+            *generate_argv((), pylint),
+        )
+        # Files whose closure can't be fingerprinted have no key, and are linted every time.
+        for field_set in request.elements:
+            closure_key = _closure_fingerprint(
+                all_coarsened_targets_by_address[field_set.address].closure(), file_digests
+            )
+            if closure_key is not None:
+                cache_keys[field_set.source.file_path] = fingerprint(
+                    tool_key, field_set.source.file_path, closure_key
+                )
+        cached = cache.lookup(cache_keys)
+        field_sets = tuple(fs for fs in request.elements if fs.source.file_path not in cached)
+        if not field_sets:
+            combined = combine_file_results(
+                [fs.source.file_path for fs in request.elements], cached
+            )
+            return LintResult(
+                exit_code=combined.exit_code,
+                stdout=combined.stdout,
+                stderr="",
+                linter_name=request.tool_name,
+                partition_description=request.partition_metadata.description,
+            )
+
     pylint_pex_info = await Get(PexResolveInfo, Pex, pylint_pex)
     astroid_info = pylint_pex_info.find("astroid")
     # Astroid is a transitive dependency of pylint and should always be available in the pex.
     assert astroid_info
 
-    pylint_runner_pex, config_files = await MultiGet(
-        Get(
-            VenvPex,
-            VenvPexRequest(
-                PexRequest(
-                    output_filename="pylint_runner.pex",
-                    interpreter_constraints=request.partition_metadata.interpreter_constraints,
-                    main=pylint.main,
-                    internal_only=True,
-                    pex_path=[pylint_pex, requirements_pex],
-                ),
-                pex_environment.in_sandbox(working_directory=None),
-                # Astroid < 2.9.1 had a regression that prevented the use of symlinks:
-                # https://github.com/PyCQA/pylint/issues/1470
-                site_packages_copies=(astroid_info.version < packaging.version.Version("2.9.1")),
+    pylint_runner_pex_get = Get(
+        VenvPex,
+        VenvPexRequest(
+            PexRequest(
+                output_filename="pylint_runner.pex",
+                interpreter_constraints=request.partition_metadata.interpreter_constraints,
+                main=pylint.main,
+                internal_only=True,
+                pex_path=[pylint_pex, requirements_pex],
             ),
-        ),
-        Get(
-            ConfigFiles,
-            ConfigFilesRequest,
-            pylint.config_request(sources.source_files.snapshot.dirs),
+            pex_environment.in_sandbox(working_directory=None),
+            # Astroid < 2.9.1 had a regression that prevented the use of symlinks:
+            # https://github.com/PyCQA/pylint/issues/1470
+            site_packages_copies=(astroid_info.version < packaging.version.Version("2.9.1")),
         ),
     )
+    if config_files is None:
+        pylint_runner_pex, config_files = await MultiGet(pylint_runner_pex_get, config_files_get)
+    else:
+        pylint_runner_pex = await pylint_runner_pex_get
 
     pythonpath = list(sources.source_roots)
     if first_party_plugins:
@@ -221,17 +367,39 @@ async def run_pylint(
         FallibleProcessResult,
         VenvPexProcess(
             pylint_runner_pex,
-            argv=generate_argv(request.elements, pylint),
+            argv=generate_argv(field_sets, pylint),
             input_digest=input_digest,
             output_directories=(REPORT_DIR,),
             extra_env={"PEX_EXTRA_SYS_PATH": ":".join(pythonpath)},
-            concurrency_available=len(request.elements),
-            description=f"Run Pylint on {pluralize(len(request.elements), 'target')}.",
+            concurrency_available=len(field_sets),
+            description=f"Run Pylint on {pluralize(len(field_sets), 'target')}.",
             level=LogLevel.DEBUG,
         ),
     )
     report = await Get(Digest, RemovePrefix(result.output_digest, REPORT_DIR))
-    return LintResult.create(request, result, report=report)
+    if cache is None:
+        return LintResult.create(request, result, report=report)
+
+    stdout = result.stdout.decode()
+    combined = cache.splice(
+        [fs.source.file_path for fs in request.elements],
+        # The output of a file can't be cached under the key of its own closure if it has messages
+        # about the other files in the batch.
+        {} if _has_cross_file_messages(stdout) else cache_keys,
+        cached,
+        result.exit_code,
+        stdout,
+        exit_code_for=_pylint_exit_code,
+        is_header=_is_pylint_module_header,
+    )
+    return LintResult(
+        exit_code=combined.exit_code,
+        stdout=combined.stdout,
+        stderr=result.stderr.decode(),
+        linter_name=request.tool_name,
+        partition_description=request.partition_metadata.description,
+        report=report,
+    )
 
 
 def rules():
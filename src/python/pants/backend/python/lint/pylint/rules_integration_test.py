@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import os
 from textwrap import dedent
 
 import pytest
@@ -20,6 +21,7 @@ from pants.backend.python.target_types import (
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
 from pants.core.goals.lint import LintResult, Partitions
 from pants.core.util_rules import config_files
+from pants.core.util_rules.lint_result_cache import LINT_RESULT_CACHE_DIR
 from pants.core.util_rules.partitions import Partition
 from pants.engine.addresses import Address
 from pants.engine.fs import DigestContents
@@ -156,6 +158,84 @@ def test_multiple_targets(rule_runner: PythonRuleRunner) -> None:
     assert result[0].report == EMPTY_DIGEST
 
 
+def _cache_entries(rule_runner: PythonRuleRunner) -> int:
+    cache_dir = os.path.join(rule_runner.pants_workdir, LINT_RESULT_CACHE_DIR, "pylint")
+    return sum(name != ".pruned" for _, _, files in os.walk(cache_dir) for name in files)
+
+
+def test_per_file_cache(rule_runner: PythonRuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            f"{PACKAGE}/good.py": GOOD_FILE,
+            f"{PACKAGE}/bad.py": BAD_FILE,
+            f"{PACKAGE}/BUILD": "python_sources()",
+            "lock.txt": "",
+        }
+    )
+
+    def run() -> LintResult:
+        tgts = [
+            rule_runner.get_target(Address(PACKAGE, relative_file_path="good.py")),
+            rule_runner.get_target(Address(PACKAGE, relative_file_path="bad.py")),
+        ]
+        result = run_pylint(
+            rule_runner,
+            tgts,
+            extra_args=[
+                "--pylint-per-file-cache",
+                "--python-enable-resolves",
+                "--python-resolves={'python-default': 'lock.txt'}",
+                "--python-invalid-lockfile-behavior=ignore",
+            ],
+        )
+        assert len(result) == 1
+        assert result[0].exit_code == PYLINT_CONVENTION_FAILURE_RETURN_CODE
+        assert f"{PACKAGE}/good.py" not in result[0].stdout
+        assert f"{PACKAGE}/bad.py:2:0: C0103" in result[0].stdout
+        assert "Your code has been rated" not in result[0].stdout
+        return result[0]
+
+    first = run()
+    assert _cache_entries(rule_runner) == 2
+
+    # Only the changed file is linted again, and the cached result of the other is spliced in.
+    rule_runner.write_files({f"{PACKAGE}/good.py": f"{GOOD_FILE}OTHER_CONSTANT = ''\n"})
+    assert run().stdout == first.stdout
+    assert _cache_entries(rule_runner) == 3
+
+    # The results depend on what the requirements of the resolve are locked to.
+    rule_runner.write_files({"lock.txt": "# Locked again.\n"})
+    assert run().stdout == first.stdout
+    assert _cache_entries(rule_runner) == 5
+
+
+def test_per_file_cache_cross_file_messages(rule_runner: PythonRuleRunner) -> None:
+    duplicated = "".join(f"print({i})\n" for i in range(6))
+    rule_runner.write_files(
+        {
+            f"{PACKAGE}/a.py": f"'''a'''\n{duplicated}",
+            f"{PACKAGE}/b.py": f"'''b'''\n{duplicated}",
+            f"{PACKAGE}/BUILD": "python_sources()",
+        }
+    )
+    tgts = [
+        rule_runner.get_target(Address(PACKAGE, relative_file_path="a.py")),
+        rule_runner.get_target(Address(PACKAGE, relative_file_path="b.py")),
+    ]
+    result = run_pylint(
+        rule_runner,
+        tgts,
+        extra_args=[
+            "--pylint-per-file-cache",
+            "--pylint-args='--disable=all --enable=duplicate-code --min-similarity-lines=4'",
+        ],
+    )
+    assert len(result) == 1
+    assert "R0801" in result[0].stdout
+    # The message is reported for one of the files, but depends on the other, so neither is cached.
+    assert _cache_entries(rule_runner) == 0
+
+
 @skip_unless_python37_and_python39_present
 def test_uses_correct_python_version(rule_runner: PythonRuleRunner) -> None:
     rule_runner.write_files(
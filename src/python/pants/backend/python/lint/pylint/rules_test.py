@@ -0,0 +1,70 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from pants.backend.python.lint.pylint.rules import (
+    _closure_fingerprint,
+    _has_cross_file_messages,
+    _is_pylint_module_header,
+    _pylint_exit_code,
+)
+from pants.backend.python.target_types import (
+    PythonRequirementTarget,
+    PythonSourcesGeneratorTarget,
+    PythonSourceTarget,
+)
+from pants.engine.addresses import Address
+
+
+def test_pylint_exit_code() -> None:
+    assert _pylint_exit_code("") == 0
+    assert _pylint_exit_code("f.py:2:0: C0103: Constant name (invalid-name)\n") == 16
+    assert (
+        _pylint_exit_code(
+            "************* Module f\n"
+            "f.py:1:0: E0401: Unable to import 'x' (import-error)\n"
+            "f.py:2:0: W0611: Unused import os (unused-import)\n"
+            "f.py:3:0: E1101: Module has no member (no-member)\n"
+        )
+        == 2 | 4
+    )
+    # Lines which aren't messages don't count, even if they look like part of one.
+    assert _pylint_exit_code("  x = 'f.py:1:0: F0001: '\n") == 0
+
+
+def test_is_pylint_module_header() -> None:
+    assert _is_pylint_module_header("************* Module project.f\n")
+    assert not _is_pylint_module_header("project/f.py:2:0: C0103: Constant name\n")
+
+
+def test_has_cross_file_messages() -> None:
+    assert not _has_cross_file_messages("f.py:2:0: C0103: Constant name (invalid-name)\n")
+    assert _has_cross_file_messages(
+        "f.py:1:0: R0801: Similar lines in 2 files\n==f:[0:5]\n==g:[0:5]\n"
+    )
+    assert _has_cross_file_messages("f.py:1:0: R0401: Cyclic import (f -> g) (cyclic-import)\n")
+    assert _has_cross_file_messages("f.py:1:0: Similar lines in 2 files (duplicate-code)\n")
+
+
+def test_closure_fingerprint() -> None:
+    source = PythonSourceTarget({"source": "f.py"}, Address("src", target_name="f"))
+    dep = PythonSourceTarget({"source": "g.py"}, Address("src", target_name="g"))
+    req = PythonRequirementTarget({"requirements": ["ansicolors==1.1.8"]}, Address("3rdparty"))
+    digests = {"src/f.py": "f1", "src/g.py": "g1"}
+
+    key = _closure_fingerprint([source, dep, req], digests)
+    assert key is not None
+    # The order of the closure doesn't matter, but every source and requirement in it does.
+    assert _closure_fingerprint([req, dep, source], digests) == key
+    assert _closure_fingerprint([source, dep, req], {**digests, "src/g.py": "g2"}) != key
+    assert _closure_fingerprint([source, dep], digests) != key
+    other_req = PythonRequirementTarget(
+        {"requirements": ["ansicolors==1.1.7"]}, Address("3rdparty")
+    )
+    assert _closure_fingerprint([source, dep, other_req], digests) != key
+
+    # A source whose content isn't known can't be fingerprinted.
+    assert _closure_fingerprint([source, dep], {"src/f.py": "f1"}) is None
+    generator = PythonSourcesGeneratorTarget({}, Address("src", target_name="lib"))
+    assert _closure_fingerprint([source, generator], digests) is None
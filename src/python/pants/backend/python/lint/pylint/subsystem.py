@@ -96,6 +96,29 @@ class Pylint(PythonToolBase):
             """
         ),
     )
+    per_file_cache = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            If true, cache the results of Pylint for each file in `<pants_workdir>`, so that
+            files which did not change are not linted again, even when other files in the same
+            batch did.
+
+            A file's results are reused while its content, the content of its transitive
+            dependencies, Pylint, its plugins and config, and `[pylint].args` are unchanged. Only
+            the files without cached results are passed to Pylint, and any report it writes only
+            covers those files. Since the results of separate runs can't be combined into a score,
+            this also passes `--score=n` to Pylint.
+
+            Results are only cached when the output of Pylint can be attributed to individual
+            files, which requires the default output format. They are also not cached when a run
+            reports `duplicate-code` or `cyclic-import`, which are about several files. Files
+            whose results are cached are not linted again, so these checks only compare the files
+            which are linted together: disable them, or this option, to get consistent results.
+            """
+        ),
+    )
     _source_plugins = TargetListOption(
         advanced=True,
         help=softwrap(
@@ -25,7 +25,15 @@ from pants.core.util_rules.config_files import ConfigFilesRequest
 from pants.core.util_rules.environments import EnvironmentField
 from pants.engine.rules import collect_rules
 from pants.engine.target import Target
-from pants.option.option_types import ArgsListOption, BoolOption, FileOption, SkipOption, StrOption
+from pants.option.option_types import (
+    ArgsListOption,
+    BoolOption,
+    FileOption,
+    IntOption,
+    SkipOption,
+    StrListOption,
+    StrOption,
+)
 from pants.util.strutil import softwrap
 
 
@@ -129,6 +137,71 @@ class PyTest(PythonToolBase):
             """
         ),
     )
+    run_against_entire_lockfile = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            If enabled, run tests against the entire lockfile of their resolve, rather than
+            just the subset of requirements that each batch of tests needs.
+
+            Every batch of tests with the same resolve and interpreter constraints then shares
+            a single requirements PEX, and so a single venv, which is built once and reused from
+            the named caches, while only the first-party sources differ between batches. This can
+            save a lot of time when there are many batches, at the cost of the consequences
+            described for `[python].run_against_entire_lockfile`, which enables this for tests,
+            binaries and repls at once.
+            """
+        ),
+    )
+    worker_pool = BoolOption(
+        default=False,
+        advanced=True,
+        help=lambda cls: softwrap(
+            f"""
+            If enabled, run local batches of tests in a fresh fork of a long-lived worker process,
+            which has already started the interpreter and imported pytest and the modules listed
+            in `[{cls.options_scope}].worker_pool_preload`, rather than in a new interpreter.
+
+            A worker is started for each venv that tests run in, and exits after
+            `[{cls.options_scope}].worker_pool_idle_timeout` seconds without work. Each batch still
+            runs in its own sandbox, and its results are cached as usual.
+
+            Use this with `[{cls.options_scope}].run_against_entire_lockfile`, so that there is a
+            venv for each resolve. Otherwise each distinct set of requirements of a batch has its
+            own venv, and so its own worker, which then sits idle for the idle timeout: a run
+            could start as many workers as it has batches.
+
+            Tests run the usual way when they are debugged, run with `pytest-xdist`, run with
+            remote execution, or if the worker can't be started.
+            """
+        ),
+    )
+    worker_pool_preload = StrListOption(
+        default=[],
+        advanced=True,
+        help=lambda cls: softwrap(
+            f"""
+            Modules for the workers of `[{cls.options_scope}].worker_pool` to import before
+            forking, e.g. `django` or `numpy`.
+
+            These should be third-party modules which are slow to import. They are imported
+            once, with the environment of the batch that started the worker, so they must not
+            be first-party modules, nor modules whose import-time behavior depends on the
+            environment of each test.
+            """
+        ),
+    )
+    worker_pool_idle_timeout = IntOption(
+        default=600,
+        advanced=True,
+        help=lambda cls: softwrap(
+            f"""
+            The number of seconds after which an idle worker of `[{cls.options_scope}].worker_pool`
+            exits.
+            """
+        ),
+    )
 
     skip = SkipOption("test")
 
@@ -5,10 +5,11 @@ from __future__ import annotations
 
 import dataclasses
 import itertools
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from hashlib import sha256
 from textwrap import dedent  # noqa: PNT20
-from typing import Iterable, Optional, Tuple
+from typing import Iterable, Mapping, Optional, Sequence, Tuple
 
 import packaging
 
@@ -46,15 +47,22 @@ from pants.core.util_rules.system_binaries import (
     MktempBinary,
     MvBinary,
 )
+from pants.engine.addresses import Address
 from pants.engine.collection import Collection
-from pants.engine.fs import CreateDigest, Digest, FileContent, MergeDigests, RemovePrefix
-from pants.engine.process import FallibleProcessResult, Process
+from pants.engine.fs import AddPrefix, CreateDigest, Digest, FileContent, MergeDigests, RemovePrefix
+from pants.engine.process import FallibleProcessResult, Process, ProcessExecutionEnvironment
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
-from pants.engine.target import CoarsenedTargets, CoarsenedTargetsRequest
+from pants.engine.target import (
+    CoarsenedTarget,
+    CoarsenedTargets,
+    CoarsenedTargetsRequest,
+    assign_weighted_shards,
+)
 from pants.engine.unions import UnionRule
 from pants.option.global_options import GlobalOptions
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet, OrderedSet
+from pants.util.resources import read_resource
 from pants.util.strutil import pluralize, shell_quote
 
 
@@ -64,10 +72,28 @@ class MyPyPartition:
     root_targets: CoarsenedTargets
     resolve_description: str | None
     interpreter_constraints: InterpreterConstraints
+    # When a resolve and interpreter constraints are split into several partitions, the (1-based)
+    # index of this partition and their count.
+    part: tuple[int, int] | None = None
 
     def description(self) -> str:
         ics = str(sorted(str(c) for c in self.interpreter_constraints))
-        return f"{self.resolve_description}, {ics}" if self.resolve_description else ics
+        description = f"{self.resolve_description}, {ics}" if self.resolve_description else ics
+        if self.part:
+            description += f" (part {self.part[0]} of {self.part[1]})"
+        return description
+
+    def parts_key(self) -> str:
+        """Identifies this part of a split resolve and interpreter constraints across runs.
+
+        Unlike the index of the part, this doesn't change when the number of parts does. It is
+        empty when the partition was not split.
+        """
+        if not self.part:
+            return ""
+        return sha256(
+            "\n".join(sorted(str(fs.address) for fs in self.field_sets)).encode()
+        ).hexdigest()
 
 
 class MyPyPartitions(Collection[MyPyPartition]):
@@ -79,6 +105,15 @@ class MyPyRequest(CheckRequest):
     tool_name = MyPy.options_scope
 
 
+def _mypy_flags(mypy: MyPy, *, python_version: Optional[str]) -> list[str]:
+    flags = list(mypy.args)
+    if mypy.config:
+        flags.append(f"--config-file={mypy.config}")
+    if python_version:
+        flags.append(f"--python-version={python_version}")
+    return flags
+
+
 async def _generate_argv(
     mypy: MyPy,
     *,
@@ -88,11 +123,11 @@ async def _generate_argv(
     file_list_path: str,
     python_version: Optional[str],
 ) -> Tuple[str, ...]:
-    args = [pex.pex.argv0, f"--python-executable={venv_python}", *mypy.args]
-    if mypy.config:
-        args.append(f"--config-file={mypy.config}")
-    if python_version:
-        args.append(f"--python-version={python_version}")
+    args = [
+        pex.pex.argv0,
+        f"--python-executable={venv_python}",
+        *_mypy_flags(mypy, python_version=python_version),
+    ]
 
     mypy_pex_info = await Get(PexResolveInfo, VenvPex, pex)
     mypy_info = mypy_pex_info.find("mypy")
@@ -111,6 +146,101 @@ async def _generate_argv(
     return tuple(args)
 
 
+_dmypy_runner_resource = "scripts/dmypy_runner.py"
+_named_cache_venv_resource = ("pants.backend.python.util_rules.scripts", "named_cache_venv.py")
+
+
+async def _setup_dmypy_process(
+    mypy: MyPy,
+    *,
+    partition: MyPyPartition,
+    build_root: BuildRoot,
+    mypy_pex: VenvPex,
+    requirements_venv_pex: VenvPex,
+    config_file: MyPyConfigFile,
+    first_party_plugins: MyPyFirstPartyPlugins,
+    sources_digest: Digest,
+    source_roots: Iterable[str],
+    file_list_path: str,
+    python_version: Optional[str],
+    env: Mapping[str, str],
+    description: str,
+) -> Process:
+    """Run MyPy through a `dmypy` daemon that outlives the sandbox.
+
+    See `scripts/dmypy_runner.py` for how the daemon is kept in sync with the sandbox.
+    """
+    sources_dir = "__sources"
+    runner = FileContent("__dmypy_runner.py", read_resource(__name__, _dmypy_runner_resource))
+    named_cache_venv = FileContent(
+        "__named_cache_venv.py", read_resource(*_named_cache_venv_resource)
+    )
+    runner_digest, prefixed_sources_digest = await MultiGet(
+        Get(Digest, CreateDigest([runner, named_cache_venv])),
+        Get(Digest, AddPrefix(sources_digest, sources_dir)),
+    )
+    input_digest = await Get(
+        Digest, MergeDigests([runner_digest, prefixed_sources_digest, requirements_venv_pex.digest])
+    )
+
+    flags = _mypy_flags(mypy, python_version=python_version)
+    # The daemon rechecks changed sources by itself, but not changes to the venvs it runs with and
+    # checks against, nor to the plugins it has imported and the roots it imported them from. The
+    # config is also included, as `dmypy run` only notices changes to some of its options.
+    daemon_key = sha256(
+        "\n".join(
+            (
+                mypy_pex.digest.fingerprint,
+                requirements_venv_pex.digest.fingerprint,
+                config_file.digest.fingerprint,
+                first_party_plugins.sources_digest.fingerprint,
+                *flags,
+                *source_roots,
+            )
+        ).encode()
+    ).hexdigest()
+    # Each part of a split partition has its own daemon, as they check different sources against
+    # different requirements, and run concurrently.
+    partition_key = sha256(
+        "\n".join(
+            (
+                build_root.path,
+                partition.resolve_description or "",
+                *sorted(str(c) for c in partition.interpreter_constraints),
+                partition.parts_key(),
+            )
+        ).encode()
+    ).hexdigest()
+
+    named_cache_dir = ".cache/mypy_daemon"
+    process = await Get(
+        Process,
+        VenvPexProcess(
+            mypy_pex,
+            input_digest=input_digest,
+            extra_env=env,
+            description=description,
+            level=LogLevel.DEBUG,
+            append_only_caches={"mypy_daemon": named_cache_dir},
+        ),
+    )
+    return dataclasses.replace(
+        process,
+        argv=(
+            mypy_pex.python.argv0,
+            runner.path,
+            f"--sources-dir={sources_dir}",
+            f"--partition-dir={named_cache_dir}/{partition_key}",
+            f"--daemon-key={daemon_key}",
+            f"--timeout={mypy.daemon_timeout}",
+            f"--python-executable={requirements_venv_pex.python.argv0}",
+            "--",
+            *flags,
+            f"@{file_list_path}",
+        ),
+    )
+
+
 def determine_python_files(files: Iterable[str]) -> Tuple[str, ...]:
     """We run over all .py and .pyi files, but .pyi files take precedence.
 
@@ -144,6 +274,7 @@ async def mypy_typecheck_partition(
     mv: MvBinary,
     ln: LnBinary,
     global_options: GlobalOptions,
+    environment: ProcessExecutionEnvironment,
 ) -> CheckResult:
     # MyPy requires 3.5+ to run, but uses the typed-ast library to work with 2.7, 3.4, 3.5, 3.6,
     # and 3.7. However, typed-ast does not understand 3.8+, so instead we must run MyPy with
@@ -228,8 +359,69 @@ async def mypy_typecheck_partition(
     py_version = config_file.python_version_to_autoset(
         partition.interpreter_constraints, python_setup.interpreter_versions_universe
     )
+    all_used_source_roots = sorted(
+        set(itertools.chain(first_party_plugins.source_roots, closure_sources.source_roots))
+    )
+    env = {
+        "PEX_EXTRA_SYS_PATH": ":".join(all_used_source_roots),
+        "MYPYPATH": ":".join(all_used_source_roots),
+        # Always emit colors to improve cache hit rates, the results are post-processed to match the
+        # global setting
+        "MYPY_FORCE_COLOR": "1",
+        # Mypy needs to know the terminal so it can use appropriate escape sequences. ansi is a
+        # reasonable lowest common denominator for the sort of escapes mypy uses (NB. TERM=xterm
+        # uses some additional codes that colors.strip_color doesn't remove).
+        "TERM": "ansi",
+        # Force a fixed terminal width. This is effectively infinite, disabling mypy's
+        # builtin truncation and line wrapping. Terminals do an acceptable job of soft-wrapping
+        # diagnostic text and source code is typically already hard-wrapped to a limited width.
+        # (Unique random number to make it easier to search for the source of this setting.)
+        "MYPY_FORCE_TERMINAL_WIDTH": "642092230765939",
+    }
+
+    description = f"Run MyPy on {pluralize(len(python_files), 'file')}."
+    if mypy.daemon and not environment.remote_execution:
+        sources_digest = await Get(
+            Digest,
+            MergeDigests(
+                [
+                    file_list_digest,
+                    first_party_plugins.sources_digest,
+                    closure_sources.source_files.snapshot.digest,
+                    config_file.digest,
+                ]
+            ),
+        )
+        process = await _setup_dmypy_process(
+            mypy,
+            partition=partition,
+            build_root=build_root,
+            mypy_pex=mypy_pex,
+            requirements_venv_pex=requirements_venv_pex,
+            config_file=config_file,
+            first_party_plugins=first_party_plugins,
+            sources_digest=sources_digest,
+            source_roots=all_used_source_roots,
+            file_list_path=file_list_path,
+            python_version=py_version,
+            env=env,
+            description=description,
+        )
+        # `dmypy` does not support generating reports.
+        result = await Get(FallibleProcessResult, Process, process)
+        return CheckResult.from_fallible_process_result(
+            result,
+            partition_description=partition.description(),
+            output_simplifier=global_options.output_simplifier(),
+        )
+
     named_cache_dir = ".cache/mypy_cache"
     mypy_cache_dir = f"{named_cache_dir}/{sha256(build_root.path.encode()).hexdigest()}"
+    # The parts of a split partition run concurrently, so each writes back to its own cache. A part
+    # without one yet starts from a copy of the cache of unsplit partitions, which it never writes.
+    part_cache_dir = (
+        f"{mypy_cache_dir}/parts/{partition.parts_key()}" if partition.part else mypy_cache_dir
+    )
     run_cache_dir = ".tmp_cache/mypy_cache"
     argv = await _generate_argv(
         mypy,
@@ -288,15 +480,19 @@ async def mypy_typecheck_partition(
                             # to partition MyPy runs by python version (which the DB is independent
                             # for different versions) and uses a one-process-at-a-time daemon by default,
                             # multiple MyPy processes operating on a single db cache should be rare.
+                            # The parts of a split partition do run concurrently, so each has its own
+                            # db, seeded from the shared one.
 
-                            NAMED_CACHE_DIR="{mypy_cache_dir}/{py_version}"
+                            NAMED_CACHE_DIR="{part_cache_dir}/{py_version}"
                             NAMED_CACHE_DB="$NAMED_CACHE_DIR/cache.db"
+                            SEED_CACHE_DB="{mypy_cache_dir}/{py_version}/cache.db"
                             SANDBOX_CACHE_DIR="{run_cache_dir}/{py_version}"
                             SANDBOX_CACHE_DB="$SANDBOX_CACHE_DIR/cache.db"
 
                             {mkdir.path} -p "$NAMED_CACHE_DIR" > /dev/null 2>&1
                             {mkdir.path} -p "$SANDBOX_CACHE_DIR" > /dev/null 2>&1
-                            {cp.path} "$NAMED_CACHE_DB" "$SANDBOX_CACHE_DB" > /dev/null 2>&1
+                            {cp.path} "$NAMED_CACHE_DB" "$SANDBOX_CACHE_DB" > /dev/null 2>&1 || \\
+                                {cp.path} "$SEED_CACHE_DB" "$SANDBOX_CACHE_DB" > /dev/null 2>&1
 
                             {' '.join((shell_quote(arg) for arg in argv))}
                             EXIT_CODE=$?
@@ -330,26 +526,6 @@ async def mypy_typecheck_partition(
         ),
     )
 
-    all_used_source_roots = sorted(
-        set(itertools.chain(first_party_plugins.source_roots, closure_sources.source_roots))
-    )
-    env = {
-        "PEX_EXTRA_SYS_PATH": ":".join(all_used_source_roots),
-        "MYPYPATH": ":".join(all_used_source_roots),
-        # Always emit colors to improve cache hit rates, the results are post-processed to match the
-        # global setting
-        "MYPY_FORCE_COLOR": "1",
-        # Mypy needs to know the terminal so it can use appropriate escape sequences. ansi is a
-        # reasonable lowest common denominator for the sort of escapes mypy uses (NB. TERM=xterm
-        # uses some additional codes that colors.strip_color doesn't remove).
-        "TERM": "ansi",
-        # Force a fixed terminal width. This is effectively infinite, disabling mypy's
-        # builtin truncation and line wrapping. Terminals do an acceptable job of soft-wrapping
-        # diagnostic text and source code is typically already hard-wrapped to a limited width.
-        # (Unique random number to make it easier to search for the source of this setting.)
-        "MYPY_FORCE_TERMINAL_WIDTH": "642092230765939",
-    }
-
     process = await Get(
         Process,
         VenvPexProcess(
@@ -357,7 +533,7 @@ async def mypy_typecheck_partition(
             input_digest=merged_input_files,
             extra_env=env,
             output_directories=(REPORT_DIR,),
-            description=f"Run MyPy on {pluralize(len(python_files), 'file')}.",
+            description=description,
             level=LogLevel.DEBUG,
             append_only_caches={"mypy_cache": named_cache_dir},
         ),
@@ -373,9 +549,61 @@ async def mypy_typecheck_partition(
     )
 
 
+def split_by_connected_components(
+    field_sets: Sequence[MyPyFieldSet],
+    coarsened_targets_by_address: Mapping[Address, CoarsenedTarget],
+    max_parts: int,
+) -> list[list[MyPyFieldSet]]:
+    """Split the field sets into at most `max_parts` groups with disjoint transitive closures.
+
+    Field sets whose closures overlap are connected, and are always put in the same group. The
+    connected components are then bin-packed by the number of targets in their closures.
+    """
+    # A union-find over the indexes of the field sets, merged whenever a closure walk reaches a
+    # CoarsenedTarget that was already walked from another root. Since the closure of an already
+    # walked CoarsenedTarget was walked in full, the walk can stop there.
+    parent = list(range(len(field_sets)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    owners: dict[CoarsenedTarget, int] = {}
+    for i, field_set in enumerate(field_sets):
+        queue = deque([coarsened_targets_by_address[field_set.address]])
+        while queue:
+            ct = queue.popleft()
+            owner = owners.get(ct)
+            if owner is not None:
+                parent[find(i)] = find(owner)
+                continue
+            owners[ct] = i
+            queue.extend(ct.dependencies)
+
+    sizes: dict[int, int] = defaultdict(int)
+    for ct, owner in owners.items():
+        sizes[find(owner)] += len(ct.members)
+    # NB: Each component is named after its first field set.
+    component_names: dict[int, str] = {}
+    for i, field_set in enumerate(field_sets):
+        component_names.setdefault(find(i), field_set.address.spec)
+
+    shards = assign_weighted_shards(
+        component_names.values(),
+        min(max_parts, len(component_names)),
+        {name: sizes[root] for root, name in component_names.items()},
+    )
+    parts: dict[int, list[MyPyFieldSet]] = defaultdict(list)
+    for i, field_set in enumerate(field_sets):
+        parts[shards[component_names[find(i)]]].append(field_set)
+    return [part for _, part in sorted(parts.items())]
+
+
 @rule(desc="Determine if necessary to partition MyPy input", level=LogLevel.DEBUG)
 async def mypy_determine_partitions(
-    request: MyPyRequest, mypy: MyPy, python_setup: PythonSetup
+    request: MyPyRequest, mypy: MyPy, python_setup: PythonSetup, global_options: GlobalOptions
 ) -> MyPyPartitions:
     resolve_and_interpreter_constraints_to_field_sets = (
         _partition_by_interpreter_constraints_and_resolve(request.field_sets, python_setup)
@@ -386,24 +614,36 @@ async def mypy_determine_partitions(
     )
     coarsened_targets_by_address = coarsened_targets.by_address()
 
-    return MyPyPartitions(
-        MyPyPartition(
-            FrozenOrderedSet(field_sets),
-            CoarsenedTargets(
-                OrderedSet(
-                    coarsened_targets_by_address[field_set.address] for field_set in field_sets
-                )
-            ),
-            resolve if len(python_setup.resolves) > 1 else None,
-            interpreter_constraints or mypy.interpreter_constraints,
-        )
-        for (resolve, interpreter_constraints), field_sets in sorted(
-            resolve_and_interpreter_constraints_to_field_sets.items()
+    partitions = []
+    for (resolve, interpreter_constraints), field_sets in sorted(
+        resolve_and_interpreter_constraints_to_field_sets.items()
+    ):
+        parts = (
+            split_by_connected_components(
+                list(field_sets),
+                coarsened_targets_by_address,
+                global_options.process_execution_local_parallelism,
+            )
+            if mypy.partition_by_components
+            else [list(field_sets)]
         )
-    )
+        for i, part in enumerate(parts):
+            partitions.append(
+                MyPyPartition(
+                    FrozenOrderedSet(part),
+                    CoarsenedTargets(
+                        OrderedSet(
+                            coarsened_targets_by_address[field_set.address] for field_set in part
+                        )
+                    ),
+                    resolve if len(python_setup.resolves) > 1 else None,
+                    interpreter_constraints or mypy.interpreter_constraints,
+                    part=(i + 1, len(parts)) if len(parts) > 1 else None,
+                )
+            )
+    return MyPyPartitions(partitions)
 
 
-# TODO(#10864): Improve performance, e.g. by leveraging the MyPy cache.
 @rule(desc="Typecheck using MyPy", level=LogLevel.DEBUG)
 async def mypy_typecheck(request: MyPyRequest, mypy: MyPy) -> CheckResults:
     if mypy.skip:
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 import re
 from textwrap import dedent
 
@@ -157,6 +158,37 @@ def test_multiple_targets(rule_runner: PythonRuleRunner) -> None:
     assert result[0].report == EMPTY_DIGEST
 
 
+def test_daemon(rule_runner: PythonRuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            f"{PACKAGE}/good.py": GOOD_FILE,
+            f"{PACKAGE}/bad.py": BAD_FILE,
+            f"{PACKAGE}/BUILD": "python_sources()",
+        }
+    )
+    daemon_args = ["--mypy-daemon", "--mypy-daemon-timeout=60"]
+    tgts = [
+        rule_runner.get_target(Address(PACKAGE, relative_file_path="good.py")),
+        rule_runner.get_target(Address(PACKAGE, relative_file_path="bad.py")),
+    ]
+    result = run_mypy(rule_runner, tgts, extra_args=daemon_args)
+    assert len(result) == 1
+    assert result[0].exit_code == 1
+    assert f"{PACKAGE}/bad.py:4" in result[0].stdout
+    assert "Daemon started" not in result[0].stdout
+
+    # The same daemon picks up the fixed file.
+    rule_runner.write_files({f"{PACKAGE}/bad.py": GOOD_FILE})
+    tgts = [
+        rule_runner.get_target(Address(PACKAGE, relative_file_path="good.py")),
+        rule_runner.get_target(Address(PACKAGE, relative_file_path="bad.py")),
+    ]
+    result = run_mypy(rule_runner, tgts, extra_args=daemon_args)
+    assert len(result) == 1
+    assert result[0].exit_code == 0
+    assert "Success: no issues found" in result[0].stdout
+
+
 @pytest.mark.parametrize(
     "config_path,extra_args",
     ([".mypy.ini", []], ["custom_config.ini", ["--mypy-config=custom_config.ini"]]),
@@ -818,6 +850,43 @@ def test_partition_targets(rule_runner: PythonRuleRunner) -> None:
     )
 
 
+def test_partition_by_components(rule_runner: PythonRuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "shared/dep.py": "",
+            "shared/BUILD": "python_source(source='dep.py')",
+            "a/root.py": "",
+            "a/BUILD": "python_source(source='root.py', dependencies=['shared'])",
+            "b/root.py": "",
+            "b/BUILD": "python_source(source='root.py', dependencies=['shared'])",
+            "c/root.py": "",
+            "c/BUILD": "python_source(source='root.py')",
+        }
+    )
+    rule_runner.set_options(
+        ["--mypy-partition-by-components", "--process-execution-local-parallelism=4"],
+        env_inherit={"PATH", "PYENV_ROOT", "HOME"},
+    )
+    roots = [rule_runner.get_target(Address(d)) for d in ("a", "c", "b")]
+    partitions = rule_runner.request(
+        MyPyPartitions, [MyPyRequest(MyPyFieldSet.create(t) for t in roots)]
+    )
+    # `a` and `b` share a dependency, and so must be checked together.
+    assert [[fs.address for fs in p.field_sets] for p in partitions] == [
+        [Address("a"), Address("b")],
+        [Address("c")],
+    ]
+    assert {t.address for t in partitions[0].root_targets.closure()} == {
+        Address("a"),
+        Address("b"),
+        Address("shared"),
+    }
+    assert partitions[1].description().endswith("(part 2 of 2)")
+    # Each part keeps its own daemon and cache, keyed on its roots rather than on its index.
+    assert partitions[0].parts_key() != partitions[1].parts_key()
+    assert partitions[1].parts_key() == dataclasses.replace(partitions[1], part=(1, 3)).parts_key()
+
+
 def test_determine_python_files() -> None:
     assert determine_python_files([]) == ()
     assert determine_python_files(["f.py"]) == ("f.py",)
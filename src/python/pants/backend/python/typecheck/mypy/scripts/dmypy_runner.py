@@ -0,0 +1,154 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+# NB: This runs with the interpreter of the MyPy venv, so it must be compatible with every Python
+# that MyPy supports.
+#
+# Runs MyPy through a `dmypy` daemon which outlives the sandbox that this script runs in.
+#
+# The daemon can't work in the sandbox directly: each run gets a new sandbox, and the daemon
+# tracks files by path. So the sources are mirrored into a stable directory under a named cache,
+# writing only the files whose content changed, so that the daemon sees unchanged files as
+# unchanged and only re-checks the rest.
+#
+# Every partition has its own directory, holding at most one daemon at a time, in a subdirectory
+# named after a key for everything the daemon can't notice changing by itself: the MyPy and
+# requirements venvs, the config and first-party plugins, and the source roots. When the key
+# changes, the old daemon is stopped and its directory removed.
+
+from __future__ import annotations
+
+import argparse
+import fcntl
+import os
+import shutil
+import subprocess
+import sys
+
+# Copied next to this script from `pants.backend.python.util_rules.scripts`.
+from __named_cache_venv import stable_executable
+
+# Messages from the `dmypy` client about the daemon's lifecycle, which would otherwise be mixed
+# into the type checking results.
+_LIFECYCLE_MESSAGES = (b"Daemon started", b"Daemon stopped", b"Restarting: ")
+
+
+def sys_executable_of(python: str) -> str:
+    output = subprocess.check_output([python, "-c", "import sys; print(sys.executable)"])
+    return stable_executable(output.decode().strip())
+
+
+def sync_tree(src: str, dest: str) -> None:
+    """Make `dest` a copy of `src`, leaving files whose content is unchanged untouched."""
+    expected = set()
+    for root, _, files in os.walk(src):
+        for name in files:
+            src_path = os.path.join(root, name)
+            rel_path = os.path.relpath(src_path, src)
+            expected.add(rel_path)
+            dest_path = os.path.join(dest, rel_path)
+            with open(src_path, "rb") as f:
+                content = f.read()
+            try:
+                with open(dest_path, "rb") as f:
+                    if f.read() == content:
+                        continue
+            except OSError:
+                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+            with open(dest_path, "wb") as f:
+                f.write(content)
+
+    for root, dirs, files in os.walk(dest, topdown=False):
+        for name in files:
+            dest_path = os.path.join(root, name)
+            if os.path.relpath(dest_path, dest) not in expected:
+                os.unlink(dest_path)
+        if root != dest and not os.listdir(root):
+            os.rmdir(root)
+
+
+def dmypy(python: str, status_file: str, *args: str, **kwargs) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [python, "-m", "mypy.dmypy", "--status-file", status_file, *args], **kwargs
+    )
+
+
+def stop_stale_daemons(python: str, partition_dir: str, daemon_key: str) -> None:
+    for name in os.listdir(partition_dir):
+        daemon_dir = os.path.join(partition_dir, name)
+        if name == daemon_key or not os.path.isdir(daemon_dir):
+            continue
+        status_file = os.path.join(daemon_dir, "status.json")
+        if os.path.exists(status_file):
+            dmypy(
+                python,
+                status_file,
+                "stop",
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        shutil.rmtree(daemon_dir, ignore_errors=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sources-dir", required=True)
+    parser.add_argument("--partition-dir", required=True)
+    parser.add_argument("--daemon-key", required=True)
+    parser.add_argument("--timeout", required=True)
+    parser.add_argument("--python-executable", required=True)
+    parser.add_argument("mypy_args", nargs=argparse.REMAINDER)
+    options = parser.parse_args()
+    mypy_args = options.mypy_args
+    if mypy_args[:1] == ["--"]:
+        mypy_args = mypy_args[1:]
+
+    python = stable_executable(sys.executable)
+    python_executable = sys_executable_of(options.python_executable)
+    sources_dir = os.path.abspath(options.sources_dir)
+
+    partition_dir = os.path.realpath(options.partition_dir)
+    os.makedirs(partition_dir, exist_ok=True)
+    # Concurrent runs for the same partition would race on the mirrored sources, so serialize
+    # them. The lock is released by the OS if we die.
+    with open(os.path.join(partition_dir, "lock"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        stop_stale_daemons(python, partition_dir, options.daemon_key)
+
+        daemon_dir = os.path.join(partition_dir, options.daemon_key)
+        workdir = os.path.join(daemon_dir, "root")
+        os.makedirs(workdir, exist_ok=True)
+        sync_tree(sources_dir, workdir)
+
+        env = dict(os.environ)
+        # First-party plugins are imported by the daemon from the source roots.
+        env["PYTHONPATH"] = os.pathsep.join(
+            os.path.join(workdir, root) for root in env.get("MYPYPATH", "").split(":") if root
+        )
+        result = dmypy(
+            python,
+            os.path.join(daemon_dir, "status.json"),
+            "run",
+            "--timeout",
+            options.timeout,
+            "--",
+            f"--python-executable={python_executable}",
+            f"--cache-dir={os.path.join(daemon_dir, 'cache')}",
+            *mypy_args,
+            cwd=workdir,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+
+    output = b"".join(
+        line
+        for line in result.stdout.splitlines(keepends=True)
+        if not line.startswith(_LIFECYCLE_MESSAGES)
+    )
+    sys.stdout.buffer.write(output)
+    return result.returncode
+
+
+if __name__ == "__main__":
+    sys.exit(main())
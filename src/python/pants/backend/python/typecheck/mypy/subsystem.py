@@ -34,6 +34,7 @@ from pants.option.option_types import (
     ArgsListOption,
     BoolOption,
     FileOption,
+    IntOption,
     SkipOption,
     TargetListOption,
 )
@@ -103,6 +104,50 @@ class MyPy(PythonToolBase):
             """
         ),
     )
+    daemon = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            If true, run MyPy through its daemon, `dmypy`, keeping one daemon alive per
+            partition between runs of Pants, so that incremental runs only re-check the files
+            which changed and their dependents.
+
+            A daemon is restarted whenever the requirements, the MyPy config, the first-party
+            plugins or the source roots of its partition change. Daemons are not used with
+            `[GLOBAL].remote_execution`, which always runs MyPy from scratch.
+
+            Not every MyPy option is supported by the daemon (notably `follow_imports = silent`
+            and report generation); see
+            https://mypy.readthedocs.io/en/stable/mypy_daemon.html.
+            """
+        ),
+    )
+    daemon_timeout = IntOption(
+        default=3600,
+        advanced=True,
+        help=softwrap(
+            """
+            How many seconds a MyPy daemon may sit idle before it shuts itself down, when
+            `[mypy].daemon` is enabled.
+            """
+        ),
+    )
+    partition_by_components = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            If true, further split the targets which share a resolve and interpreter
+            constraints into independent parts of the dependency graph, so that several MyPy
+            processes can run in parallel.
+
+            Targets whose transitive dependencies overlap are always checked together, and the
+            parts are packed into at most `[GLOBAL].process_execution_local_parallelism`
+            partitions of roughly equal size.
+            """
+        ),
+    )
     _source_plugins = TargetListOption(
         advanced=True,
         help=softwrap(
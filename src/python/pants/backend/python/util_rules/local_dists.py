@@ -3,25 +3,36 @@
 
 from __future__ import annotations
 
+import dataclasses
+import io
 import logging
-import shlex
+import zipfile
 from dataclasses import dataclass
 from typing import Iterable
 
+from pants.backend.python.subsystems.setup import PythonSetup
 from pants.backend.python.subsystems.setuptools import PythonDistributionFieldSet
+from pants.backend.python.target_types import WheelField
+from pants.backend.python.util_rules import package_dists
+from pants.backend.python.util_rules.dists import DistBuildRequest, DistBuildResult
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
+from pants.backend.python.util_rules.package_dists import create_dist_build_request
 from pants.backend.python.util_rules.pex import Pex, PexRequest
 from pants.backend.python.util_rules.pex import rules as pex_rules
 from pants.backend.python.util_rules.pex_requirements import PexRequirements
 from pants.backend.python.util_rules.python_sources import PythonSourceFiles
 from pants.build_graph.address import Address
-from pants.core.goals.package import BuiltPackage, PackageFieldSet
-from pants.core.util_rules import system_binaries
 from pants.core.util_rules.source_files import SourceFiles
-from pants.core.util_rules.system_binaries import BashBinary, UnzipBinary
 from pants.engine.addresses import Addresses
-from pants.engine.fs import Digest, DigestSubset, MergeDigests, PathGlobs, Snapshot
-from pants.engine.process import Process, ProcessResult
+from pants.engine.fs import (
+    EMPTY_DIGEST,
+    Digest,
+    DigestContents,
+    DigestSubset,
+    MergeDigests,
+    PathGlobs,
+    Snapshot,
+)
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import (
     TransitiveTargets,
@@ -29,6 +40,7 @@ from pants.engine.target import (
     WrappedTarget,
     WrappedTargetRequest,
 )
+from pants.engine.unions import UnionMembership
 from pants.util.dirutil import fast_relpath_optional
 from pants.util.docutil import doc_url
 from pants.util.strutil import softwrap
@@ -48,23 +60,14 @@ class LocalDistWheels:
 @rule
 async def isolate_local_dist_wheels(
     dist_field_set: PythonDistributionFieldSet,
-    bash: BashBinary,
-    unzip_binary: UnzipBinary,
+    python_setup: PythonSetup,
+    union_membership: UnionMembership,
 ) -> LocalDistWheels:
-    dist = await Get(BuiltPackage, PackageFieldSet, dist_field_set)
-    wheels_snapshot = await Get(Snapshot, DigestSubset(dist.digest, PathGlobs(["**/*.whl"])))
-
-    # A given local dist might build a wheel and an sdist (and maybe other artifacts -
-    # we don't know what setup command was run...)
-    # As long as there is a wheel, we can ignore the other artifacts.
-    artifacts = {(a.relpath or "") for a in dist.artifacts}
-    wheels = [wheel for wheel in wheels_snapshot.files if wheel in artifacts]
-
-    if not wheels:
-        tgt = await Get(
-            WrappedTarget,
-            WrappedTargetRequest(dist_field_set.address, description_of_origin="<infallible>"),
-        )
+    tgt = await Get(
+        WrappedTarget,
+        WrappedTargetRequest(dist_field_set.address, description_of_origin="<infallible>"),
+    )
+    if not tgt.target.get(WheelField).value:
         logger.warning(
             softwrap(
                 f"""
@@ -78,27 +81,34 @@ async def isolate_local_dist_wheels(
                 """
             )
         )
+        return LocalDistWheels((), EMPTY_DIGEST, frozenset())
 
-    wheels_listing_result = await Get(
-        ProcessResult,
-        Process(
-            argv=[
-                bash.path,
-                "-c",
-                f"""
-                set -ex
-                for f in {' '.join(shlex.quote(f) for f in wheels)}; do
-                  {unzip_binary.path} -Z1 "$f"
-                done
-                """,
-            ],
-            input_digest=wheels_snapshot.digest,
-            description=f"List contents of artifacts produced by {dist_field_set.address}",
-        ),
+    dist_build_request = await create_dist_build_request(
+        field_set=dist_field_set,
+        python_setup=python_setup,
+        union_membership=union_membership,
+        validate_wheel_sdist=False,
+    )
+    # Only the wheel is consumed, so don't spend time building an sdist as well, even if the
+    # target would when packaged. NB: For targets that build an sdist, this is a different request
+    # than the one made by `package`, so the two no longer share a build. Local dists are built on
+    # every test and run that depends on them, but only packaged on request, so skipping the sdist
+    # here is the better trade.
+    dist = await Get(
+        DistBuildResult,
+        DistBuildRequest,
+        dataclasses.replace(dist_build_request, build_sdist=False),
     )
-    provided_files = set(wheels_listing_result.stdout.decode().splitlines())
+    wheels = (dist.wheel_path,) if dist.wheel_path else ()
+    wheels_digest = await Get(Digest, DigestSubset(dist.output, PathGlobs(wheels)))
+
+    # List the contents of the wheels in-process, rather than in a process per distribution.
+    provided_files: set[str] = set()
+    for wheel in await Get(DigestContents, Digest, wheels_digest):
+        with zipfile.ZipFile(io.BytesIO(wheel.content)) as zf:
+            provided_files.update(zf.namelist())
 
-    return LocalDistWheels(tuple(wheels), wheels_snapshot.digest, frozenset(provided_files))
+    return LocalDistWheels(wheels, wheels_digest, frozenset(provided_files))
 
 
 @dataclass(frozen=True)
@@ -225,5 +235,5 @@ def rules():
     return (
         *collect_rules(),
         *pex_rules(),
-        *system_binaries.rules(),
+        *package_dists.rules(),
     )
@@ -13,11 +13,16 @@ import pytest
 from pants.backend.python import target_types_rules
 from pants.backend.python.goals import package_dists
 from pants.backend.python.macros.python_artifact import PythonArtifact
+from pants.backend.python.subsystems.setuptools import PythonDistributionFieldSet
 from pants.backend.python.subsystems.setuptools import rules as setuptools_rules
 from pants.backend.python.target_types import PythonDistribution, PythonSourcesGeneratorTarget
 from pants.backend.python.util_rules import local_dists, pex_from_targets
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
-from pants.backend.python.util_rules.local_dists import LocalDistsPex, LocalDistsPexRequest
+from pants.backend.python.util_rules.local_dists import (
+    LocalDistsPex,
+    LocalDistsPexRequest,
+    LocalDistWheels,
+)
 from pants.backend.python.util_rules.pex_from_targets import InterpreterConstraintsRequest
 from pants.backend.python.util_rules.python_sources import PythonSourceFiles
 from pants.build_graph.address import Address
@@ -38,6 +43,7 @@ def rule_runner() -> PythonRuleRunner:
             *pex_from_targets.rules(),
             QueryRule(InterpreterConstraints, (InterpreterConstraintsRequest,)),
             QueryRule(LocalDistsPex, (LocalDistsPexRequest,)),
+            QueryRule(LocalDistWheels, (PythonDistributionFieldSet,)),
         ],
         target_types=[PythonSourcesGeneratorTarget, PythonDistribution],
         objects={"python_artifact": PythonArtifact},
@@ -109,3 +115,40 @@ def test_build_local_dists(rule_runner: PythonRuleRunner) -> None:
 
     # Check that srcroot/foo/bar.py was subtracted out, because the dist provides foo/bar.py.
     assert result.remaining_sources.source_files.files == ("srcroot/foo/qux.py",)
+
+
+def test_isolate_local_dist_wheels(rule_runner: PythonRuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "foo/BUILD": dedent(
+                """
+                python_sources()
+
+                python_distribution(
+                    name = "dist",
+                    dependencies = [":foo"],
+                    provides = python_artifact(name="foo", version="9.8.7"),
+                    generate_setup = False,
+                )
+                """
+            ),
+            "foo/bar.py": "BAR = 42",
+            "foo/setup.py": dedent(
+                """
+                from setuptools import setup
+
+                setup(name="foo", version="9.8.7", packages=["foo"], package_dir={"foo": "."},)
+                """
+            ),
+        }
+    )
+    rule_runner.set_options([], env_inherit={"PATH"})
+    tgt = rule_runner.get_target(Address("foo", target_name="dist"))
+    result = rule_runner.request(LocalDistWheels, [PythonDistributionFieldSet.create(tgt)])
+
+    # The target also builds an sdist when packaged, but only the wheel is built here.
+    assert result.wheel_paths == ("foo-9.8.7-py3-none-any.whl",)
+    contents = rule_runner.request(DigestContents, [result.wheels_digest])
+    assert [content.path for content in contents] == ["foo-9.8.7-py3-none-any.whl"]
+    assert "foo/bar.py" in result.provided_files
+    assert "foo-9.8.7.dist-info/METADATA" in result.provided_files
@@ -43,6 +43,8 @@ from pants.backend.python.util_rules.pex_requirements import (
     LoadedLockfile,
     LoadedLockfileRequest,
     Lockfile,
+    LockfileSubset,
+    LockfileSubsetRequest,
 )
 from pants.backend.python.util_rules.pex_requirements import (
     PexRequirements as PexRequirements,  # Explicit re-export.
@@ -613,10 +615,17 @@ async def _setup_pex_requirements(
                 resolve_config=resolve_config,
             )
 
+        req_strings = reqs_info.req_strings
+        if "--intransitive" not in request.additional_args:
+            subset = await Get(
+                LockfileSubset, LockfileSubsetRequest(loaded_lockfile, reqs_info.req_strings)
+            )
+            req_strings = subset.req_strings
+
         return _BuildPexRequirementsSetup(
             [loaded_lockfile.lockfile_digest],
             [
-                *reqs_info.req_strings,
+                *req_strings,
                 "--lock",
                 loaded_lockfile.lockfile_path,
                 *pex_lock_resolver_args,
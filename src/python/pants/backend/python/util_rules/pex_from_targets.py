@@ -88,6 +88,7 @@ class PexFromTargetsRequest:
     additional_inputs: Digest | None
     hardcoded_interpreter_constraints: InterpreterConstraints | None
     warn_for_transitive_files_targets: bool
+    use_entire_lockfile: bool
     # This field doesn't participate in comparison (and therefore hashing), as it doesn't affect
     # the result.
     description: str | None = dataclasses.field(compare=False)
@@ -114,6 +115,7 @@ class PexFromTargetsRequest:
         hardcoded_interpreter_constraints: InterpreterConstraints | None = None,
         description: str | None = None,
         warn_for_transitive_files_targets: bool = False,
+        use_entire_lockfile: bool = False,
     ) -> None:
         """Request to create a Pex from the transitive closure of the given addresses.
 
@@ -153,6 +155,9 @@ class PexFromTargetsRequest:
             the Pex.
         :param warn_for_transitive_files_targets: If True (and include_source_files is also true),
             emit a warning if the pex depends on any `files` targets, since they won't be included.
+        :param use_entire_lockfile: If True (and internal_only is also true), use the entire
+            lockfile of the resolve rather than the subset needed by the addresses, as if
+            `[python].run_against_entire_lockfile` was set for this request.
         """
         object.__setattr__(self, "addresses", Addresses(addresses))
         object.__setattr__(self, "output_filename", output_filename)
@@ -177,6 +182,7 @@ class PexFromTargetsRequest:
         object.__setattr__(
             self, "warn_for_transitive_files_targets", warn_for_transitive_files_targets
         )
+        object.__setattr__(self, "use_entire_lockfile", use_entire_lockfile)
 
         self.__post_init__()
 
@@ -430,8 +436,8 @@ async def _determine_requirements_for_pex_from_targets(
             )
 
     should_return_entire_lockfile = (
-        python_setup.run_against_entire_lockfile and request.internal_only
-    )
+        python_setup.run_against_entire_lockfile or request.use_entire_lockfile
+    ) and request.internal_only
     should_request_repository_pex = (
         # The entire lockfile was explicitly requested.
         should_return_entire_lockfile
@@ -473,7 +479,8 @@ async def _determine_requirements_for_pex_from_targets(
             raise ValueError(
                 softwrap(
                     f"""
-                    [python].run_against_entire_lockfile was set, but could not find a
+                    The entire lockfile was requested (e.g. with
+                    `[python].run_against_entire_lockfile`), but could not find a
                     lockfile or constraints file for this target set. See
                     {doc_url('docs/python/overview/third-party-dependencies')} for details.
                     """
@@ -754,17 +761,20 @@ class RequirementsPexRequest:
 
     addresses: tuple[Address, ...]
     hardcoded_interpreter_constraints: InterpreterConstraints | None
+    use_entire_lockfile: bool
 
     def __init__(
         self,
         addresses: Iterable[Address],
         *,
         hardcoded_interpreter_constraints: InterpreterConstraints | None = None,
+        use_entire_lockfile: bool = False,
     ) -> None:
         object.__setattr__(self, "addresses", Addresses(addresses))
         object.__setattr__(
             self, "hardcoded_interpreter_constraints", hardcoded_interpreter_constraints
         )
+        object.__setattr__(self, "use_entire_lockfile", use_entire_lockfile)
 
 
 @rule
@@ -777,6 +787,7 @@ async def generalize_requirements_pex_request(
         internal_only=True,
         include_source_files=False,
         hardcoded_interpreter_constraints=request.hardcoded_interpreter_constraints,
+        use_entire_lockfile=request.use_entire_lockfile,
     )
 
 
@@ -195,6 +195,7 @@ def test_determine_requirements_for_pex_from_targets() -> None:
         _platforms: bool,
         include_requirements: bool = True,
         run_against_entire_lockfile: bool = False,
+        use_entire_lockfile: bool = False,
         expected_reqs: PexRequirements = PexRequirements(),
         expected_pexes: Iterable[Pex] = (),
     ) -> None:
@@ -217,6 +218,7 @@ def test_determine_requirements_for_pex_from_targets() -> None:
             include_requirements=include_requirements,
             platforms=PexPlatforms(["foo"] if _platforms else []),
             internal_only=_internal_only,
+            use_entire_lockfile=use_entire_lockfile,
         )
         resolved_pex_requirements = PexRequirements(
             req_strings,
@@ -332,6 +334,22 @@ def test_determine_requirements_for_pex_from_targets() -> None:
         expected_reqs=repository_pex_request__lockfile.requirements,
         expected_pexes=[repository_pex__lockfile],
     )
+    # The same applies when a single request asks for the entire lockfile.
+    assert_setup(
+        RequirementMode.PEX_LOCKFILE,
+        _internal_only=True,
+        use_entire_lockfile=True,
+        _platforms=False,
+        expected_reqs=repository_pex_request__lockfile.requirements,
+        expected_pexes=[repository_pex__lockfile],
+    )
+    assert_setup(
+        RequirementMode.PEX_LOCKFILE,
+        _internal_only=False,
+        use_entire_lockfile=True,
+        _platforms=False,
+        expected_reqs=PexRequirements(req_strings, from_superset=resolve__pex),
+    )
 
     # Non-Pex lockfiles: except for when run_against_entire_lockfile is applicable, return
     # PexRequirements with from_superset as the lockfile repository Pex and constraint_strings as
@@ -4,11 +4,15 @@
 from __future__ import annotations
 
 import importlib.resources
+import json
 import logging
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Iterable, Iterator
 from urllib.parse import urlparse
 
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.utils import canonicalize_name as canonicalize_project_name
+
 from pants.backend.python.subsystems.repos import PythonRepos
 from pants.backend.python.subsystems.setup import InvalidLockfileBehavior, PythonSetup
 from pants.backend.python.target_types import PythonRequirementsField
@@ -36,6 +40,7 @@ from pants.engine.fs import (
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.unions import UnionMembership
 from pants.util.docutil import bin_name, doc_url
+from pants.util.frozendict import FrozenDict
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.util.pip_requirement import PipRequirement
 from pants.util.requirements import parse_requirements_file
@@ -259,6 +264,137 @@ async def load_lockfile(
     )
 
 
+@dataclass(frozen=True)
+class LockedDependencies:
+    """The dependency graph of the projects locked in a PEX-native lockfile.
+
+    There is one graph per locked resolve (i.e. per platform the lockfile was generated for),
+    mapping the canonical name of each locked project to its locked version and to the canonical
+    names of the projects that it requires unconditionally, i.e. regardless of environment markers
+    and extras.
+    """
+
+    resolves: tuple[FrozenDict[str, tuple[str, tuple[str, ...]]], ...]
+
+    @classmethod
+    def parse(cls, lock_bytes: bytes) -> LockedDependencies:
+        """Parse the graph out of a lockfile, or return an empty graph if that isn't possible."""
+        try:
+            lock = json.loads(strip_comments_from_pex_json_lockfile(lock_bytes))
+            if not lock.get("transitive", True):
+                # The dependencies of the requested projects are not part of subsets.
+                return cls(())
+            resolves = []
+            for locked_resolve in lock["locked_resolves"]:
+                projects = {}
+                for locked_requirement in locked_resolve["locked_requirements"]:
+                    requires = []
+                    for dist in locked_requirement.get("requires_dists", ()):
+                        dependency = Requirement(dist)
+                        if dependency.marker is None:
+                            requires.append(canonicalize_project_name(dependency.name))
+                    projects[canonicalize_project_name(locked_requirement["project_name"])] = (
+                        locked_requirement["version"],
+                        tuple(sorted(requires)),
+                    )
+                resolves.append(FrozenDict(projects))
+        except (ValueError, KeyError, TypeError, AttributeError, InvalidRequirement) as e:
+            logger.debug(f"Failed to parse the dependencies locked in a lockfile: {e}")
+            return cls(())
+        return cls(tuple(resolves))
+
+    def _covers(self, roots: Iterable[Requirement], requirement: Requirement) -> bool:
+        """Whether subsetting `roots` out of every locked resolve includes `requirement`."""
+        if not self.resolves:
+            return False
+        name = canonicalize_project_name(requirement.name)
+        for projects in self.resolves:
+            locked = projects.get(name)
+            if locked is None or not requirement.specifier.contains(locked[0], prereleases=True):
+                return False
+            to_visit = [canonicalize_project_name(root.name) for root in roots]
+            seen: set[str] = set()
+            while to_visit and name not in seen:
+                project = to_visit.pop()
+                if project in seen or project not in projects:
+                    continue
+                seen.add(project)
+                to_visit.extend(projects[project][1])
+            if name not in seen:
+                return False
+        return True
+
+    def minimize(self, req_strings: Iterable[str]) -> tuple[str, ...]:
+        """Drop the requirements which subsetting the other requirements already includes.
+
+        Subsetting the result out of the lockfile resolves exactly the same distributions as
+        subsetting `req_strings`, but requests which only differ by such requirements, e.g. by a
+        transitive dependency which some of their targets also depend on directly, are made
+        identical, and so can share a single resolve.
+        """
+        kept = list(req_strings)
+        try:
+            parsed = {req_string: Requirement(req_string) for req_string in kept}
+        except InvalidRequirement:
+            return tuple(kept)
+
+        def unconditional(requirement: Requirement) -> bool:
+            return requirement.marker is None and not requirement.url
+
+        for req_string, requirement in parsed.items():
+            if requirement.extras or not unconditional(requirement):
+                continue
+            # Only the requirements which are always resolved, from the lockfile, may cover others.
+            others = [
+                parsed[other]
+                for other in kept
+                if other != req_string and unconditional(parsed[other])
+            ]
+            try:
+                covered = bool(others) and self._covers(others, requirement)
+            except ValueError:
+                # E.g. a locked version which can't be compared with the requirement's specifier.
+                covered = False
+            # Any requirement that is dropped is covered by those that remain, whose subset is
+            # transitively closed, so that the requirements dropped earlier remain covered.
+            if covered:
+                kept.remove(req_string)
+        return tuple(kept)
+
+
+@rule
+async def parse_locked_dependencies(loaded_lockfile: LoadedLockfile) -> LockedDependencies:
+    if not loaded_lockfile.is_pex_native:
+        return LockedDependencies(())
+    digest_contents = await Get(DigestContents, Digest, loaded_lockfile.lockfile_digest)
+    return LockedDependencies.parse(digest_contents[0].content)
+
+
+@dataclass(frozen=True)
+class LockfileSubsetRequest:
+    """The requirements to resolve out of a PEX-native lockfile, to be minimized."""
+
+    loaded_lockfile: LoadedLockfile
+    req_strings: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class LockfileSubset:
+    req_strings: tuple[str, ...]
+
+
+@rule
+async def minimize_lockfile_subset(request: LockfileSubsetRequest) -> LockfileSubset:
+    """Compute the minimal requirements to subset out of a lockfile, without invoking Pex.
+
+    The result is memoized for each lockfile and set of requirements, and the requests to subset
+    the same distributions out of a lockfile are made identical, so that Pex resolves each such
+    subset once, and its results are shared through the process cache.
+    """
+    locked_dependencies = await Get(LockedDependencies, LoadedLockfile, request.loaded_lockfile)
+    return LockfileSubset(locked_dependencies.minimize(request.req_strings))
+
+
 @dataclass(frozen=True)
 class EntireLockfile:
     """A request to resolve the entire contents of a lockfile.
@@ -13,6 +13,7 @@ from pants.backend.python.subsystems.setup import InvalidLockfileBehavior, Pytho
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
 from pants.backend.python.util_rules.lockfile_metadata import PythonLockfileMetadataV3
 from pants.backend.python.util_rules.pex_requirements import (
+    LockedDependencies,
     Lockfile,
     ResolvePexConfig,
     ResolvePexConstraintsFile,
@@ -423,3 +424,59 @@ class TestResolvePexConfigPexArgs:
 
         assert "--wheel" in self.simple_config_args(no_binary=["foo", ":none:"])
         assert "--only-build" not in " ".join(self.simple_config_args(no_binary=["foo", ":none:"]))
+
+
+def _locked_requirement(name: str, version: str, *requires_dists: str) -> dict:
+    return {
+        "artifacts": [],
+        "project_name": name,
+        "requires_dists": list(requires_dists),
+        "requires_python": None,
+        "version": version,
+    }
+
+
+def test_locked_dependencies_minimize() -> None:
+    locked_requirements = [
+        _locked_requirement("Django", "4.2.1", "asgiref<4,>=3.6.0", "sqlparse>=0.3.1"),
+        _locked_requirement("asgiref", "3.7.2", 'typing-extensions>=4; python_version < "3.11"'),
+        _locked_requirement("sqlparse", "0.4.4"),
+        _locked_requirement("typing-extensions", "4.8.0"),
+        _locked_requirement("cycle-a", "1.0", "cycle-b"),
+        _locked_requirement("cycle-b", "1.0", "cycle-a"),
+    ]
+    lock = {"locked_resolves": [{"locked_requirements": locked_requirements}]}
+    locked_dependencies = LockedDependencies.parse(b"// A header.\n" + json.dumps(lock).encode())
+
+    def minimize(*req_strings: str) -> tuple[str, ...]:
+        return locked_dependencies.minimize(req_strings)
+
+    assert minimize("Django", "sqlparse", "asgiref>=3") == ("Django",)
+    assert minimize("asgiref", "django>=4") == ("django>=4",)
+    # Requirements that pin another version than the locked one, or that have extras or markers.
+    assert minimize("Django", "sqlparse<0.4") == ("Django", "sqlparse<0.4")
+    assert minimize("Django", "asgiref[tests]") == ("Django", "asgiref[tests]")
+    conditional = 'sqlparse; os_name == "nt"'
+    assert minimize("Django", conditional) == ("Django", conditional)
+    # Requirements with markers or URLs don't cover others.
+    conditional = 'Django; sys_platform == "win32"'
+    assert minimize(conditional, "sqlparse") == (conditional, "sqlparse")
+    direct = "Django @ https://example.com/Django-4.2.1-py3-none-any.whl"
+    assert minimize(direct, "sqlparse") == (direct, "sqlparse")
+    # Dependencies that depend on the environment.
+    assert minimize("asgiref", "typing-extensions") == ("asgiref", "typing-extensions")
+    # Projects that depend on each other are only dropped once.
+    assert minimize("cycle-a", "cycle-b") == ("cycle-b",)
+    assert minimize("unknown", "sqlparse") == ("unknown", "sqlparse")
+
+    # A dependency must be covered in every locked resolve.
+    other_resolve = {"locked_requirements": [*locked_requirements[:2], locked_requirements[3]]}
+    lock["locked_resolves"].append(other_resolve)
+    locked_dependencies = LockedDependencies.parse(json.dumps(lock).encode())
+    assert minimize("Django", "asgiref", "sqlparse") == ("Django", "sqlparse")
+
+    # Lockfiles that don't include transitive dependencies in their subsets.
+    lock["transitive"] = False
+    locked_dependencies = LockedDependencies.parse(json.dumps(lock).encode())
+    assert minimize("Django", "sqlparse") == ("Django", "sqlparse")
+    assert LockedDependencies.parse(b"not json") == LockedDependencies(())
@@ -0,0 +1,18 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+# NB: This is copied next to the scripts which start processes that outlive their sandbox, e.g. the
+# `dmypy` daemon and the pytest worker pool, and runs with the interpreter of their venv. So it must
+# be compatible with every Python that those tools support.
+
+import os
+
+
+def stable_executable(executable: str) -> str:
+    """Resolve the venv directory of the given interpreter, without resolving the interpreter.
+
+    The interpreter is reached through the sandbox's symlink to the named caches, which dangles
+    once the sandbox is gone, while the interpreter itself usually symlinks out of its venv.
+    """
+    executable = os.path.abspath(executable)
+    return os.path.join(os.path.realpath(os.path.dirname(executable)), os.path.basename(executable))
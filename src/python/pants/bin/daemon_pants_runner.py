@@ -6,7 +6,6 @@ import os
 import sys
 import time
 from contextlib import contextmanager
-from threading import Lock
 from typing import Dict, Tuple
 
 from pants.base.exiter import PANTS_FAILED_EXIT_CODE, ExitCode
@@ -30,7 +29,7 @@ class DaemonPantsRunner:
     def __init__(self, core: PantsDaemonCore) -> None:
         super().__init__()
         self._core = core
-        self._run_lock = Lock()
+        self._run_lock = core.run_lock
 
     @staticmethod
     def _send_stderr(stderr_fileno: int, msg: str) -> None:
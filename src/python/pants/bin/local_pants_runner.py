@@ -110,7 +110,7 @@ class LocalPantsRunner:
 
         # Verify configs.
         if global_bootstrap_options.verify_config:
-            options.verify_configs(options_bootstrapper.config)
+            options.verify_configs(options_bootstrapper.config, build_config.deferred_scopes)
 
         # If we're running with the daemon, we'll be handed a warmed Scheduler, which we use
         # to initialize a session here.
@@ -63,6 +63,9 @@ class BuildConfiguration:
     union_rule_to_providers: FrozenDict[UnionRule, tuple[str, ...]]
     allow_unknown_options: bool
     remote_auth_plugin_func: Callable | None
+    # The option scopes of the backends that were not loaded for this run (see
+    # `[GLOBAL].lazy_backends`), whose config sections are accepted without being verified.
+    deferred_scopes: frozenset[str] = frozenset()
 
     @property
     def all_subsystems(self) -> tuple[type[Subsystem], ...]:
@@ -139,6 +142,7 @@ class BuildConfiguration:
         )
         _allow_unknown_options: bool = False
         _remote_auth_plugin: Callable | None = None
+        _deferred_scopes: set[str] = field(default_factory=set)
 
         def registered_aliases(self) -> BuildFileAliases:
             """Return the registered aliases exposed in BUILD files.
@@ -269,6 +273,10 @@ class BuildConfiguration:
         def register_remote_auth_plugin(self, remote_auth_plugin: Callable) -> None:
             self._remote_auth_plugin = remote_auth_plugin
 
+        def register_deferred_scopes(self, scopes: Iterable[str]) -> None:
+            """Registers the option scopes of a backend which was not loaded for this run."""
+            self._deferred_scopes.update(scopes)
+
         def allow_unknown_options(self, allow: bool = True) -> None:
             """Allows overriding whether Options parsing will fail for unrecognized Options.
 
@@ -298,4 +306,5 @@ class BuildConfiguration:
                 ),
                 allow_unknown_options=self._allow_unknown_options,
                 remote_auth_plugin_func=self._remote_auth_plugin,
+                deferred_scopes=frozenset(self._deferred_scopes),
             )
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import logging
 import os.path
-from typing import Iterable, Mapping, Protocol, Sequence, TypeVar
+from typing import Container, Iterable, Mapping, Protocol, Sequence, TypeVar
 
 from pants.core.util_rules.distdir import DistDir
 from pants.engine.fs import EMPTY_DIGEST, Digest, Workspace
@@ -72,6 +72,38 @@ class BatchSizeOption(IntOption):
         )
 
 
+def order_longest_first(
+    estimates: Sequence[float], *, first: Container[int] = frozenset()
+) -> list[int]:
+    """Return the indices of `estimates`, ordered from the longest estimate to the shortest.
+
+    Submitting batches in this order starts the batches expected to take the longest first, rather
+    than leaving them to set the critical path at the end of the run. Ties keep their original
+    order.
+
+    Any indices in `first` are placed before all others (and are ordered longest-first amongst
+    themselves).
+    """
+    return sorted(range(len(estimates)), key=lambda i: (i not in first, -estimates[i]))
+
+
+def tail_idle_seconds(intervals: Iterable[tuple[float, float]], parallelism: int) -> float:
+    """Measure the slot time left idle at the end of a run, given the (start, end) times of its
+    batches.
+
+    The tail starts when the last batch starts: from then on no work is left to fill a slot that
+    frees up, so each of the `parallelism` slots that isn't running a batch is idle until the run
+    ends.
+    """
+    intervals = list(intervals)
+    if not intervals:
+        return 0.0
+    tail_start = max(start for start, _ in intervals)
+    run_end = max(end for _, end in intervals)
+    busy = sum(max(0.0, end - max(start, tail_start)) for start, end in intervals)
+    return max(0.0, max(1, parallelism) * (run_end - tail_start) - busy)
+
+
 def determine_specified_tool_ids(
     goal_name: str,
     only_option: Iterable[str],
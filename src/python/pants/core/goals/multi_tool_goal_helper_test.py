@@ -9,7 +9,12 @@ from pathlib import Path
 import pytest
 
 from pants.core.goals.check import CheckResult, CheckResults
-from pants.core.goals.multi_tool_goal_helper import determine_specified_tool_ids, write_reports
+from pants.core.goals.multi_tool_goal_helper import (
+    determine_specified_tool_ids,
+    order_longest_first,
+    tail_idle_seconds,
+    write_reports,
+)
 from pants.core.util_rules.distdir import DistDir
 from pants.engine.fs import EMPTY_DIGEST, Workspace
 from pants.testutil.rule_runner import RuleRunner
@@ -98,3 +103,17 @@ def test_write_reports() -> None:
 
     assert (check_dir / "partition_duplicate/p/r.txt").exists() is True
     assert (check_dir / "partition_duplicate/p_/r.txt").exists() is True
+
+
+def test_order_longest_first() -> None:
+    assert order_longest_first([]) == []
+    assert order_longest_first([1.0, 5.0, 3.0, 5.0]) == [1, 3, 2, 0]
+    assert order_longest_first([1.0, 5.0, 3.0, 5.0], first={0, 2}) == [2, 0, 1, 3]
+
+
+def test_tail_idle_seconds() -> None:
+    # The last batch starts at 2s and runs until 6s, while the other slot has finished at 3s.
+    assert tail_idle_seconds([(0.0, 2.0), (0.0, 3.0), (2.0, 6.0)], parallelism=2) == 3.0
+    # Started first, the long batch runs alongside the short ones.
+    assert tail_idle_seconds([(0.0, 4.0), (0.0, 1.0), (1.0, 2.0)], parallelism=2) == 2.0
+    assert tail_idle_seconds([], parallelism=2) == 0.0
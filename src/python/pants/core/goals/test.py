@@ -4,14 +4,35 @@
 from __future__ import annotations
 
 import itertools
+import json
 import logging
+import os
+import statistics
+import time
 from abc import ABC, ABCMeta
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import PurePath
-from typing import Any, ClassVar, Iterable, Optional, Sequence, Tuple, TypeVar, cast
+from typing import (
+    Any,
+    ClassVar,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
-from pants.core.goals.multi_tool_goal_helper import SkippableSubsystem
+from pants.base.build_environment import get_buildroot
+from pants.core.goals.multi_tool_goal_helper import (
+    SkippableSubsystem,
+    order_longest_first,
+    tail_idle_seconds,
+)
 from pants.core.goals.package import BuiltPackage, EnvironmentAwarePackageRequest, PackageFieldSet
 from pants.core.subsystems.debug_adapter import DebugAdapterSubsystem
 from pants.core.util_rules.distdir import DistDir
@@ -27,13 +48,26 @@ from pants.core.util_rules.partitions import (
     _BatchBase,
     _PartitionFieldSetsRequestBase,
 )
+from pants.core.util_rules.timing_store import TimingRecord, TimingStore
 from pants.engine.addresses import Address, UnparsedAddressInputs
 from pants.engine.collection import Collection
 from pants.engine.console import Console
 from pants.engine.desktop import OpenFiles, OpenFilesRequest
 from pants.engine.engine_aware import EngineAwareReturnType
 from pants.engine.env_vars import EnvironmentVars, EnvironmentVarsRequest
-from pants.engine.fs import EMPTY_FILE_DIGEST, Digest, FileDigest, MergeDigests, Snapshot, Workspace
+from pants.engine.fs import (
+    EMPTY_FILE_DIGEST,
+    CreateDigest,
+    Digest,
+    DigestContents,
+    FileContent,
+    FileDigest,
+    GlobMatchErrorBehavior,
+    MergeDigests,
+    PathGlobs,
+    Snapshot,
+    Workspace,
+)
 from pants.engine.goal import Goal, GoalSubsystem
 from pants.engine.internals.session import RunId
 from pants.engine.process import (
@@ -60,13 +94,23 @@ from pants.engine.target import (
     parse_shard_spec,
 )
 from pants.engine.unions import UnionMembership, UnionRule, distinct_union_type_per_subclass, union
-from pants.option.option_types import BoolOption, EnumOption, IntOption, StrListOption, StrOption
-from pants.util.collections import partition_sequentially
+from pants.option.global_options import GlobalOptions
+from pants.option.option_types import (
+    BoolOption,
+    EnumOption,
+    FloatOption,
+    IntOption,
+    StrListOption,
+    StrOption,
+)
+from pants.util.collections import partition_sequentially, partition_sequentially_by_weight
 from pants.util.docutil import bin_name
 from pants.util.logging import LogLevel
 from pants.util.memo import memoized, memoized_property
 from pants.util.meta import classproperty
 from pants.util.strutil import Simplifier, help_text, softwrap
+from pants.vcs.changed import ChangedAddresses, ChangedRequest, DependentsOption
+from pants.vcs.git import GitWorktreeRequest, MaybeGitWorktree
 
 logger = logging.getLogger(__name__)
 
@@ -502,6 +546,21 @@ class CoverageReports(EngineAwareReturnType):
         return artifacts or None
 
 
+class TestOrder(Enum):
+    AS_PARTITIONED = "as_partitioned"
+    LONGEST_FIRST = "longest_first"
+    LIKELY_FAILURES_FIRST = "likely_failures_first"
+
+    __test__ = False
+
+
+TEST_TIMINGS_FILENAME = "timings.json"
+TIMING_STORE_PATH = os.path.join("test", "timings.jsonl")
+TIMING_STORE_MAX_ENTRIES = 20000
+TIMING_STORE_MAX_AGE_DAYS = 30
+RECENT_FAILURE_SECONDS = 24 * 60 * 60
+
+
 class TestSubsystem(GoalSubsystem):
     name = "test"
     help = "Run tests."
@@ -590,9 +649,84 @@ class TestSubsystem(GoalSubsystem):
             Useful for splitting large numbers of test files across multiple machines in CI.
             For example, you can run three shards with `--shard=0/3`, `--shard=1/3`, `--shard=2/3`.
 
-            Note that the shards are roughly equal in size as measured by number of files.
-            No attempt is made to consider the size of different files, the time they have
-            taken to run in the past, or other such sophisticated measures.
+            By default, the shards are roughly equal in size as measured by number of files.
+            If `[test].timings_file` is set, the shards are instead balanced by the time
+            each test took to run in the past.
+            """
+        ),
+    )
+    timings_file = StrOption(
+        default=None,
+        advanced=True,
+        help=softwrap(
+            f"""
+            Path to a JSON file of historical test durations, used to balance `[test].shard`
+            and `[test].batch_duration` by runtime rather than by number of files. Must be
+            relative to the build root.
+
+            The file maps target addresses to durations in seconds, and is written to
+            `[test].report_dir` as `{TEST_TIMINGS_FILENAME}` when running with `--test-report`.
+            Tests without a recorded duration are treated as if this option was unset.
+
+            All shards must be run with the same timings file, or some tests may run in more than
+            one shard while others run in none.
+
+            If unset, `[test].batch_duration` and the order in which tests are run use the local
+            history recorded by `[test].record_timings` instead. Sharding never does, since the
+            history differs between machines.
+            """
+        ),
+    )
+    record_timings = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            f"""
+            Record how long each test takes to run, and whether it failed, in
+            `<pants_workdir>/{TIMING_STORE_PATH}`.
+
+            This history is used to estimate durations for `[test].batch_duration` and to order
+            test runs, when `[test].timings_file` is not set. It keeps rolling statistics for at
+            most {TIMING_STORE_MAX_ENTRIES} tests, and forgets tests which have not run in
+            {TIMING_STORE_MAX_AGE_DAYS} days.
+
+            The history is local to the machine, and is read and written outside of the engine's
+            sandboxing, so it is not used unless this option is set.
+            """
+        ),
+    )
+    order = EnumOption(
+        default=TestOrder.AS_PARTITIONED,
+        help=softwrap(
+            """
+            The order in which to start test batches.
+
+            `as_partitioned` starts the batches in the order that they were partitioned in.
+
+            `longest_first` starts the batches which are expected to take longest first, so that
+            they are less likely to hold up the end of the run.
+
+            `likely_failures_first` first starts batches for tests which failed in the last day,
+            or which depend on files with uncommitted changes, and then the rest longest-first.
+            Combine it with `--fail-fast` to see failures in the code you are working on sooner.
+
+            Run with `-ldebug` to see how long local slots sat idle at the end of the run, to
+            compare the orders on your own tests.
+            """
+        ),
+    )
+    fail_fast = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            Stop starting new test batches once one has failed.
+
+            Up to `[GLOBAL].process_execution_local_parallelism` batches run at a time, in the order
+            given by `--test-order`, and once any batch has failed no further batches are started:
+            those which are already running are allowed to complete, and those which were never
+            started are listed in the summary. As this limits the parallelism to that of the local
+            machine, it is mostly useful locally, in combination with
+            `--test-order=likely_failures_first`.
             """
         ),
     )
@@ -662,6 +796,24 @@ class TestSubsystem(GoalSubsystem):
             """
         ),
     )
+    batch_duration = FloatOption(
+        default=None,
+        advanced=True,
+        help=softwrap(
+            """
+            If set, the target duration (in seconds) of each run of batch-enabled test runners,
+            as estimated from `[test].timings_file` or the history recorded by
+            `[test].record_timings`.
+
+            Batches are then cut by their expected runtime rather than by number of files, so
+            that slow tests are spread across more batches, and fast tests are grouped into fewer.
+            Batches are still created at stable boundaries, and still contain at most twice
+            `[test].batch_size` files.
+
+            Has no effect until some test durations are known.
+            """
+        ),
+    )
 
     def report_dir(self, distdir: DistDir) -> PurePath:
         return PurePath(self._report_dir.format(distdir=distdir.relpath))
@@ -763,11 +915,70 @@ class TestsBatchCompatibilityTagField(StringField, metaclass=ABCMeta):
         """
 
 
+async def _find_likely_failures(
+    test_batches: Sequence[TestRequest.Batch], timing_store: TimingStore | None
+) -> set[int]:
+    """Find the batches which are most likely to fail: those which failed recently, or which
+    depend on files with uncommitted changes."""
+    suspects: set[str] = set()
+    if timing_store is not None:
+        suspects.update(timing_store.failed_since(time.time() - RECENT_FAILURE_SECONDS))
+
+    maybe_git_worktree = await Get(MaybeGitWorktree, GitWorktreeRequest())
+    git_worktree = maybe_git_worktree.git_worktree
+    changed_files = (
+        git_worktree.changed_files(
+            from_commit=git_worktree.current_rev_identifier,
+            include_untracked=True,
+            relative_to=get_buildroot(),
+        )
+        if git_worktree
+        else ()
+    )
+    if changed_files:
+        changed_addresses = await Get(
+            ChangedAddresses,
+            ChangedRequest(tuple(changed_files), DependentsOption.TRANSITIVE),
+        )
+        suspects.update(address.spec for address in changed_addresses)
+
+    return {
+        i
+        for i, batch in enumerate(test_batches)
+        if any(element.address.spec in suspects for element in batch.elements)
+    }
+
+
+def _default_test_duration(test_timings: Mapping[str, float]) -> float:
+    # Tests which have never run are assumed to take as long as a typical test.
+    return statistics.median(test_timings.values()) if test_timings else 1.0
+
+
+def _expected_test_duration(
+    element: Any, test_timings: Mapping[str, float], default_duration: float
+) -> float:
+    spec = element.address.spec if isinstance(element, FieldSet) else str(element)
+    return test_timings.get(spec, default_duration)
+
+
+def _expected_batch_duration(
+    batch: TestRequest.Batch, test_timings: Mapping[str, float], default_duration: float
+) -> float:
+    """Estimate how long a batch will take to run, falling back to its size if untimed."""
+    if not test_timings:
+        return float(len(batch.elements))
+    return sum(
+        _expected_test_duration(element, test_timings, default_duration)
+        for element in batch.elements
+    )
+
+
 async def _get_test_batches(
     core_request_types: Iterable[type[TestRequest]],
     targets_to_field_sets: TargetRootsToFieldSets,
     local_environment_name: ChosenLocalEnvironmentName,
     test_subsystem: TestSubsystem,
+    test_timings: Mapping[str, float],
 ) -> list[TestRequest.Batch]:
     def partitions_get(request_type: type[TestRequest]) -> Get[Partitions]:
         partition_type = cast(TestRequest, request_type)
@@ -790,18 +1001,33 @@ async def _get_test_batches(
         partitions_get(request_type) for request_type in core_request_types
     )
 
+    def element_key(element: Any) -> str:
+        return str(element.address) if isinstance(element, FieldSet) else str(element)
+
+    def partition_batches(elements: Iterable[Any]) -> Iterator[list[Any]]:
+        if test_subsystem.batch_duration is None or not test_timings:
+            return partition_sequentially(
+                elements,
+                key=element_key,
+                size_target=test_subsystem.batch_size,
+                size_max=2 * test_subsystem.batch_size,
+            )
+        default_duration = _default_test_duration(test_timings)
+        return partition_sequentially_by_weight(
+            elements,
+            key=element_key,
+            weight=lambda element: _expected_test_duration(element, test_timings, default_duration),
+            weight_target=test_subsystem.batch_duration,
+            size_max=2 * test_subsystem.batch_size,
+        )
+
     return [
         request_type.Batch(
             cast(TestRequest, request_type).tool_name, tuple(batch), partition.metadata
         )
         for request_type, partitions in zip(core_request_types, all_partitions)
         for partition in partitions
-        for batch in partition_sequentially(
-            partition.elements,
-            key=lambda x: str(x.address) if isinstance(x, FieldSet) else str(x),
-            size_target=test_subsystem.batch_size,
-            size_max=2 * test_subsystem.batch_size,
-        )
+        for batch in partition_batches(partition.elements)
     ]
 
 
@@ -859,6 +1085,7 @@ async def run_tests(
     distdir: DistDir,
     run_id: RunId,
     local_environment_name: ChosenLocalEnvironmentName,
+    global_options: GlobalOptions,
 ) -> Test:
     if test_subsystem.debug_adapter:
         goal_description = f"`{test_subsystem.name} --debug-adapter`"
@@ -871,6 +1098,31 @@ async def run_tests(
         no_applicable_targets_behavior = NoApplicableTargetsBehavior.warn
 
     shard, num_shards = parse_shard_spec(test_subsystem.shard, "the [test].shard option")
+    timing_store = (
+        TimingStore(
+            os.path.join(global_options.pants_workdir, TIMING_STORE_PATH),
+            max_entries=TIMING_STORE_MAX_ENTRIES,
+            max_age_days=TIMING_STORE_MAX_AGE_DAYS,
+        )
+        if test_subsystem.record_timings
+        else None
+    )
+    shard_timings: Mapping[str, float] = {}
+    if test_subsystem.timings_file:
+        timings_contents = await Get(
+            DigestContents,
+            PathGlobs(
+                [test_subsystem.timings_file],
+                glob_match_error_behavior=GlobMatchErrorBehavior.warn,
+                description_of_origin="the option `[test].timings_file`",
+            ),
+        )
+        if timings_contents:
+            shard_timings = _parse_test_timings(timings_contents[0])
+    if test_subsystem.timings_file or timing_store is None:
+        test_timings = shard_timings
+    else:
+        test_timings = timing_store.durations()
     targets_to_valid_field_sets = await Get(
         TargetRootsToFieldSets,
         TargetRootsToFieldSetsRequest(
@@ -879,6 +1131,7 @@ async def run_tests(
             no_applicable_targets_behavior=no_applicable_targets_behavior,
             shard=shard,
             num_shards=num_shards,
+            shard_weights=shard_timings,
         ),
     )
 
@@ -888,6 +1141,7 @@ async def run_tests(
         targets_to_valid_field_sets,
         local_environment_name,
         test_subsystem,
+        test_timings,
     )
 
     environment_names = await MultiGet(
@@ -905,16 +1159,67 @@ async def run_tests(
         )
 
     to_test = list(zip(test_batches, environment_names))
-    results = await MultiGet(
-        Get(
+    default_duration = _default_test_duration(test_timings)
+    likely_failures = (
+        await _find_likely_failures(test_batches, timing_store)
+        if test_subsystem.order == TestOrder.LIKELY_FAILURES_FIRST
+        else set()
+    )
+    submission_order = (
+        list(range(len(test_batches)))
+        if test_subsystem.order == TestOrder.AS_PARTITIONED
+        else order_longest_first(
+            [
+                _expected_batch_duration(batch, test_timings, default_duration)
+                for batch in test_batches
+            ],
+            first=likely_failures,
+        )
+    )
+
+    results_by_index: dict[int, TestResult] = {}
+    intervals: list[tuple[float, float]] = []
+
+    async def run_batch(i: int) -> TestResult:
+        start = time.time()
+        result = await Get(
             TestResult,
             {
-                batch: TestRequest.Batch,
-                environment_name: EnvironmentName,
+                to_test[i][0]: TestRequest.Batch,
+                to_test[i][1]: EnvironmentName,
             },
         )
-        for batch, environment_name in to_test
+        intervals.append((start, time.time()))
+        return result
+
+    pending = deque(submission_order)
+    if test_subsystem.fail_fast:
+        # Each lane runs batches in submission order, one at a time, and stops once any batch has
+        # failed: lanes don't wait for one another, so there is no barrier between batches.
+        async def run_until_failure() -> None:
+            while pending and not any(result.exit_code for result in results_by_index.values()):
+                i = pending.popleft()
+                result = await run_batch(i)  # noqa: PNT30: a lane starts nothing after a failure
+                results_by_index[i] = result
+
+        lanes = min(max(1, global_options.process_execution_local_parallelism), len(pending))
+        await MultiGet(run_until_failure() for _ in range(lanes))
+    else:
+        submitted_results = await MultiGet(run_batch(i) for i in submission_order)
+        results_by_index.update(zip(submission_order, submitted_results))
+        pending.clear()
+
+    # Restore the original order of the batches, which the rest of the goal relies on for stable
+    # output.
+    results = tuple(results_by_index[i] for i in sorted(results_by_index))
+    parallelism = global_options.process_execution_local_parallelism
+    logger.debug(
+        f"Local slots sat idle for {tail_idle_seconds(intervals, parallelism):.2f}s in total "
+        f"across {parallelism} slots at the end of the run, with `--test-order="
+        f"{test_subsystem.order.value}`."
     )
+    if timing_store is not None:
+        _record_test_timings(timing_store, results, run_id)
 
     # Print summary.
     exit_code = 0
@@ -943,11 +1248,21 @@ async def run_tests(
                     f"Wrote extra output from test `{result.addresses[0]}` to `{path_prefix}`."
                 )
 
+    # With `--fail-fast`, the batches which were never started.
+    for i in sorted(pending):
+        console.print_stderr(_format_not_run_summary(to_test[i][0], console))
+
     if test_subsystem.report:
         report_dir = test_subsystem.report_dir(distdir)
+        timings_digest = await Get(Digest, CreateDigest([_test_timings_file_content(results)]))
         merged_reports = await Get(
             Digest,
-            MergeDigests(result.xml_results.digest for result in results if result.xml_results),
+            MergeDigests(
+                [
+                    *(result.xml_results.digest for result in results if result.xml_results),
+                    timings_digest,
+                ]
+            ),
         )
         workspace.write_digest(merged_reports, path_prefix=str(report_dir))
         console.print_stderr(f"\nWrote test reports to {report_dir}")
@@ -1012,6 +1327,71 @@ async def run_tests(
     return Test(exit_code)
 
 
+def _ran_seconds(result: TestResult, run_id: RunId) -> float | None:
+    """How long the test process took, if it actually ran (rather than hitting a cache)."""
+    metadata = result.result_metadata
+    if (
+        metadata is None
+        or metadata.total_elapsed_ms is None
+        or metadata.source(run_id) != ProcessResultMetadata.Source.RAN
+    ):
+        return None
+    return metadata.total_elapsed_ms / 1000
+
+
+def _record_test_timings(
+    timing_store: TimingStore, results: Iterable[TestResult], run_id: RunId
+) -> None:
+    records = []
+    for result in results:
+        seconds = _ran_seconds(result, run_id)
+        if seconds is None or result.exit_code is None:
+            continue
+        records.append(
+            TimingRecord(
+                addresses=tuple(address.spec for address in result.addresses),
+                seconds=seconds,
+                succeeded=result.exit_code == 0,
+            )
+        )
+    timing_store.record(records)
+
+
+def _parse_test_timings(file_content: FileContent) -> dict[str, float]:
+    """Parse historical test durations, as written by `_test_timings_file_content`."""
+    path = file_content.path
+    try:
+        timings = json.loads(file_content.content)
+    except ValueError as e:
+        logger.warning(f"Failed to read test timings from `{path}`, ignoring them: {e}")
+        return {}
+    if not isinstance(timings, dict):
+        logger.warning(f"Expected a JSON object of test timings in `{path}`, ignoring it.")
+        return {}
+    return {
+        address: float(seconds)
+        for address, seconds in timings.items()
+        if isinstance(seconds, (int, float)) and seconds >= 0
+    }
+
+
+def _test_timings_file_content(results: Iterable[TestResult]) -> FileContent:
+    """Record the duration of each test, for use by `[test].timings_file`.
+
+    Batched results only record the duration of the whole batch, so it is split evenly between the
+    addresses in the batch.
+    """
+    timings: dict[str, float] = {}
+    for result in results:
+        if result.result_metadata is None or result.result_metadata.total_elapsed_ms is None:
+            continue
+        seconds = result.result_metadata.total_elapsed_ms / 1000 / len(result.addresses)
+        for address in result.addresses:
+            timings[address.spec] = round(seconds, 3)
+    content = json.dumps(dict(sorted(timings.items())), indent=2) + "\n"
+    return FileContent(TEST_TIMINGS_FILENAME, content.encode())
+
+
 _SOURCE_MAP = {
     ProcessResultMetadata.Source.MEMOIZED: "memoized",
     ProcessResultMetadata.Source.RAN: "ran",
@@ -1020,6 +1400,17 @@ _SOURCE_MAP = {
 }
 
 
+def _format_not_run_summary(batch: TestRequest.Batch, console: Console) -> str:
+    """Format the test summary printed to the console for a batch skipped by `--fail-fast`."""
+    addresses = [element.address for element in batch.elements]
+    description = (
+        addresses[0].spec
+        if len(addresses) == 1
+        else f"{addresses[0].spec} and {len(addresses)-1} other files"
+    )
+    return f"{console.sigil_skipped()} {description} not run, because `--fail-fast` is set."
+
+
 def _format_test_summary(result: TestResult, run_id: RunId, console: Console) -> str:
     """Format the test summary printed to the console."""
     assert (
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import json
 from abc import abstractmethod
 from dataclasses import dataclass
 from functools import partial
@@ -29,11 +30,14 @@ from pants.core.goals.test import (
     TestDebugAdapterRequest,
     TestDebugRequest,
     TestFieldSet,
+    TestOrder,
     TestRequest,
     TestResult,
     TestSubsystem,
     TestTimeoutField,
     _format_test_summary,
+    _parse_test_timings,
+    _test_timings_file_content,
     build_runtime_package_dependencies,
     run_tests,
 )
@@ -51,7 +55,9 @@ from pants.engine.environment import EnvironmentName
 from pants.engine.fs import (
     EMPTY_DIGEST,
     EMPTY_FILE_DIGEST,
+    CreateDigest,
     Digest,
+    FileContent,
     MergeDigests,
     Snapshot,
     Workspace,
@@ -73,6 +79,7 @@ from pants.engine.target import (
     TargetRootsToFieldSetsRequest,
 )
 from pants.engine.unions import UnionMembership
+from pants.option.global_options import GlobalOptions
 from pants.option.option_types import SkipOption
 from pants.option.subsystem import Subsystem
 from pants.testutil.option_util import create_goal_subsystem, create_subsystem
@@ -248,6 +255,7 @@ def run_test_rule(
     output: ShowOutput = ShowOutput.ALL,
     valid_targets: bool = True,
     run_id: RunId = RunId(999),
+    fail_fast: bool = False,
 ) -> tuple[int, str]:
     test_subsystem = create_goal_subsystem(
         TestSubsystem,
@@ -260,7 +268,12 @@ def run_test_rule(
         output=output,
         extra_env_vars=[],
         shard="",
+        timings_file=None,
+        record_timings=False,
         batch_size=1,
+        batch_duration=None,
+        order=TestOrder.AS_PARTITIONED,
+        fail_fast=fail_fast,
     )
     debug_adapter_subsystem = create_subsystem(
         DebugAdapterSubsystem,
@@ -327,6 +340,7 @@ def run_test_rule(
                 DistDir(relpath=Path("dist")),
                 run_id,
                 ChosenLocalEnvironmentName(EnvironmentName(None)),
+                create_subsystem(GlobalOptions, process_execution_local_parallelism=2),
             ],
             mock_gets=[
                 MockGet(
@@ -359,7 +373,12 @@ def run_test_rule(
                     input_types=(TestFieldSet,),
                     mock=mock_debug_adapter_request,
                 ),
-                # Merge XML results.
+                # Write test timings and merge XML results.
+                MockGet(
+                    output_type=Digest,
+                    input_types=(CreateDigest,),
+                    mock=lambda _: EMPTY_DIGEST,
+                ),
                 MockGet(
                     output_type=Digest,
                     input_types=(MergeDigests,),
@@ -428,6 +447,30 @@ def test_summary(rule_runner: PythonRuleRunner) -> None:
     )
 
 
+def test_fail_fast(rule_runner: PythonRuleRunner) -> None:
+    bad_address = Address("", target_name="bad")
+    good_address = Address("", target_name="good")
+    unrun_address = Address("", target_name="unrun")
+
+    # Batches are run by `process_execution_local_parallelism` (2) lanes, which start no more
+    # batches once one has failed.
+    exit_code, stderr = run_test_rule(
+        rule_runner,
+        request_type=ConditionallySucceedsRequest,
+        targets=[make_target(bad_address), make_target(good_address), make_target(unrun_address)],
+        fail_fast=True,
+    )
+    assert exit_code == ConditionallySucceedsRequest.exit_code((bad_address,))
+    assert stderr == dedent(
+        """\
+
+        ✓ //:good succeeded in 1.00s (memoized).
+        ✕ //:bad failed in 1.00s (memoized).
+        - //:unrun not run, because `--fail-fast` is set.
+        """
+    )
+
+
 def _assert_test_summary(
     expected: str,
     *,
@@ -531,6 +574,39 @@ def test_report_dir(rule_runner: PythonRuleRunner) -> None:
     assert f"Wrote test reports to {report_dir}" in stderr
 
 
+def test_timings_file_content() -> None:
+    def result(total_elapsed_ms: int, *target_names: str) -> TestResult:
+        return TestResult(
+            exit_code=0,
+            stdout_bytes=b"",
+            stdout_digest=EMPTY_FILE_DIGEST,
+            stderr_bytes=b"",
+            stderr_digest=EMPTY_FILE_DIGEST,
+            addresses=tuple(Address("", target_name=name) for name in target_names),
+            output_setting=ShowOutput.ALL,
+            result_metadata=make_process_result_metadata("ran", total_elapsed_ms=total_elapsed_ms),
+        )
+
+    file_content = _test_timings_file_content(
+        [result(1500, "slow"), result(300, "batch1", "batch2"), result(10, "fast")]
+    )
+    assert file_content.path == "timings.json"
+    assert json.loads(file_content.content) == {
+        "//:batch1": 0.15,
+        "//:batch2": 0.15,
+        "//:fast": 0.01,
+        "//:slow": 1.5,
+    }
+    assert _parse_test_timings(file_content) == json.loads(file_content.content)
+
+
+def test_parse_test_timings_ignores_invalid_durations() -> None:
+    file_content = FileContent("timings.json", b'{"//:a": 1, "//:b": "slow", "//:c": -1}')
+    assert _parse_test_timings(file_content) == {"//:a": 1.0}
+    assert _parse_test_timings(FileContent("timings.json", b"[1, 2]")) == {}
+    assert _parse_test_timings(FileContent("timings.json", b"{")) == {}
+
+
 def test_coverage(rule_runner: PythonRuleRunner) -> None:
     addr1 = Address("", target_name="t1")
     addr2 = Address("", target_name="t2")
@@ -0,0 +1,235 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from hashlib import sha256
+from typing import Callable, Iterable, Mapping, Sequence
+
+from pants.util.dirutil import safe_mkdir_for
+
+logger = logging.getLogger(__name__)
+
+# The directory under `pants_workdir` holding a `LintResultCache` per tool.
+LINT_RESULT_CACHE_DIR = "lint_results"
+
+
+def fingerprint(*parts: str) -> str:
+    """A cache key for the given parts, e.g. digest fingerprints, paths and arguments."""
+    return sha256("\0".join(parts).encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class FileLintResult:
+    """The diagnostics reported by a linter for a single file."""
+
+    exit_code: int
+    stdout: str
+
+
+class LintResultCache:
+    """A local cache of the `FileLintResult` of each file linted by a tool, keyed by fingerprint.
+
+    The key of a file must cover everything which can affect its diagnostics: its content, the
+    tool and its config, and whatever else the tool reads while linting it.
+
+    Each entry is a small file, which is touched when it is read, and entries which have not been
+    used in `max_age_days` are pruned when the cache is written to, at most once a day: the time of
+    the last pruning is recorded by the mtime of a marker file in the cache directory.
+    """
+
+    _PRUNED_MARKER = ".pruned"
+    _PRUNE_INTERVAL_SECONDS = 24 * 60 * 60
+
+    def __init__(
+        self, directory: str, *, max_age_days: float = 30, clock: Callable[[], float] = time.time
+    ) -> None:
+        self._directory = directory
+        self._max_age_seconds = max_age_days * 24 * 60 * 60
+        self._clock = clock
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, key[:2], key)
+
+    def get(self, key: str) -> FileLintResult | None:
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+            result = FileLintResult(exit_code=int(entry["exit_code"]), stdout=entry["stdout"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable lint result cache entry `{path}`: {e}")
+            return None
+        try:
+            now = self._clock()
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        return result
+
+    def lookup(self, keys: Mapping[str, str]) -> dict[str, FileLintResult]:
+        """The cached results for the given paths, by path, for those paths which have one."""
+        results = {}
+        for path, key in keys.items():
+            result = self.get(key)
+            if result is not None:
+                results[path] = result
+        return results
+
+    def splice(
+        self,
+        paths: Sequence[str],
+        keys: Mapping[str, str],
+        cached: Mapping[str, FileLintResult],
+        exit_code: int,
+        stdout: str,
+        *,
+        exit_code_for: Callable[[str], int],
+        is_header: Callable[[str], bool] = lambda _: False,
+    ) -> FileLintResult:
+        """Combine the `cached` results with the output of running the linter on the other paths.
+
+        The results of the run are cached under the given `keys`, for the paths which have one, if
+        they can be split by file (see `file_results_from_output`). Otherwise, the output of the
+        run is appended to the cached results.
+        """
+        fresh = file_results_from_output(
+            stdout,
+            exit_code,
+            [path for path in paths if path not in cached],
+            exit_code_for=exit_code_for,
+            is_header=is_header,
+        )
+        if fresh is None:
+            previous = combine_file_results([path for path in paths if path in cached], cached)
+            return FileLintResult(exit_code | previous.exit_code, previous.stdout + stdout)
+        self.put({keys[path]: result for path, result in fresh.items() if path in keys})
+        return combine_file_results(paths, {**cached, **fresh})
+
+    def put(self, results: Mapping[str, FileLintResult]) -> None:
+        """Store the given results, by key."""
+        if not results:
+            return
+        self._maybe_prune()
+        for key, result in results.items():
+            path = self._path(key)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                safe_mkdir_for(path)
+                with open(tmp_path, "w") as f:
+                    json.dump({"exit_code": result.exit_code, "stdout": result.stdout}, f)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Failed to write to the lint result cache `{self._directory}`: {e}")
+                return
+
+    def _maybe_prune(self) -> None:
+        now = self._clock()
+        marker = os.path.join(self._directory, self._PRUNED_MARKER)
+        try:
+            if os.stat(marker).st_mtime > now - self._PRUNE_INTERVAL_SECONDS:
+                return
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return
+        cutoff = now - self._max_age_seconds
+        for root, _, files in os.walk(self._directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    if os.stat(path).st_mtime < cutoff:
+                        os.unlink(path)
+                except OSError:
+                    continue
+        try:
+            safe_mkdir_for(marker)
+            with open(marker, "w"):
+                pass
+            os.utime(marker, (now, now))
+        except OSError as e:
+            logger.debug(f"Failed to record the pruning of the lint result cache: {e}")
+
+
+def split_output_by_file(
+    stdout: str, paths: Iterable[str], *, is_header: Callable[[str], bool] = lambda _: False
+) -> dict[str, str] | None:
+    """Attribute each line of a linter's output to one of the linted files.
+
+    A line belongs to the file whose path it starts with (followed by a `:`). Lines for which
+    `is_header` is true belong to the file of the next such line, and any other line belongs to
+    the file of the previous one, e.g. a snippet of the offending source.
+
+    Returns None if some line can't be attributed to a file, in which case the output should not
+    be split. Every path has an entry, empty if the linter had nothing to say about it.
+    """
+    by_path: dict[str, list[str]] = {path: [] for path in paths}
+    prefixes = tuple(f"{path}:" for path in by_path)
+    current: str | None = None
+    pending_headers: list[str] = []
+    for line in stdout.splitlines(keepends=True):
+        if line.startswith(prefixes):
+            current = line.partition(":")[0]
+            if current not in by_path:
+                # A path containing a `:`.
+                current = next(path for path in by_path if line.startswith(f"{path}:"))
+            by_path[current].extend(pending_headers)
+            pending_headers = []
+            by_path[current].append(line)
+        elif is_header(line):
+            pending_headers.append(line)
+        elif current is not None:
+            by_path[current].append(line)
+        elif line.strip():
+            return None
+    if pending_headers:
+        return None
+    return {path: "".join(lines) for path, lines in by_path.items()}
+
+
+def file_results_from_output(
+    stdout: str,
+    exit_code: int,
+    paths: Sequence[str],
+    *,
+    exit_code_for: Callable[[str], int],
+    is_header: Callable[[str], bool] = lambda _: False,
+) -> dict[str, FileLintResult] | None:
+    """Split the output of a linter run over the given paths into a result per path.
+
+    `exit_code_for` computes the exit code the linter would have had for a file from its output.
+    Returns None if the output can't be split, or if the per-file exit codes don't combine into the
+    actual exit code of the run (e.g. because the linter was told to ignore some issues), in which
+    case the results must not be cached.
+    """
+    split = split_output_by_file(stdout, paths, is_header=is_header)
+    if split is None:
+        return None
+    results = {
+        path: FileLintResult(exit_code=exit_code_for(output), stdout=output)
+        for path, output in split.items()
+    }
+    if combine_file_results(paths, results).exit_code != exit_code:
+        return None
+    return results
+
+
+def combine_file_results(
+    paths: Sequence[str], results: Mapping[str, FileLintResult]
+) -> FileLintResult:
+    """Splice the results of each file, in the given order, into a result for all of them.
+
+    Exit codes are combined with a bitwise or, which is correct for tools that exit with 0 or 1,
+    and for tools that exit with a bitmask of the kinds of issues found.
+    """
+    exit_code = 0
+    for path in paths:
+        exit_code |= results[path].exit_code
+    return FileLintResult(exit_code, "".join(results[path].stdout for path in paths))
@@ -0,0 +1,104 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from pants.core.util_rules.lint_result_cache import (
+    FileLintResult,
+    LintResultCache,
+    file_results_from_output,
+    fingerprint,
+    split_output_by_file,
+)
+
+
+def _is_header(line: str) -> bool:
+    return line.startswith("*** ")
+
+
+def _exit_code_for(output: str) -> int:
+    return 1 if output else 0
+
+
+def test_split_output_by_file() -> None:
+    output = "*** a\na.py:1: bad\n  snippet\n*** b\nb.py:2: worse\n"
+    assert split_output_by_file(output, ["a.py", "b.py", "c.py"], is_header=_is_header) == {
+        "a.py": "*** a\na.py:1: bad\n  snippet\n",
+        "b.py": "*** b\nb.py:2: worse\n",
+        "c.py": "",
+    }
+    assert split_output_by_file("", ["a.py"]) == {"a.py": ""}
+    # Lines which can't be attributed to a file.
+    assert split_output_by_file("Summary\na.py:1: bad\n", ["a.py"]) is None
+    assert split_output_by_file("a.py:1: bad\n*** b\n", ["a.py"], is_header=_is_header) is None
+
+
+def test_file_results_from_output() -> None:
+    output = "a.py:1: bad\n"
+    assert file_results_from_output(output, 1, ["a.py", "b.py"], exit_code_for=_exit_code_for) == {
+        "a.py": FileLintResult(1, output),
+        "b.py": FileLintResult(0, ""),
+    }
+    # The exit code of the run doesn't match its output, e.g. because of `--exit-zero`.
+    assert file_results_from_output(output, 0, ["a.py"], exit_code_for=_exit_code_for) is None
+
+
+def test_cache(tmp_path: Path) -> None:
+    cache = LintResultCache(str(tmp_path))
+    keys = {path: fingerprint("tool", path) for path in ("a.py", "b.py", "c.py")}
+    assert cache.lookup(keys) == {}
+
+    result = cache.splice(
+        ["a.py", "b.py"],
+        keys,
+        {},
+        1,
+        "a.py:1: bad\n",
+        exit_code_for=_exit_code_for,
+    )
+    assert result == FileLintResult(1, "a.py:1: bad\n")
+    cached = cache.lookup(keys)
+    assert cached == {"a.py": FileLintResult(1, "a.py:1: bad\n"), "b.py": FileLintResult(0, "")}
+
+    # Cached results are spliced in the order of the paths, around the results of the run.
+    result = cache.splice(
+        ["c.py", "b.py", "a.py"], keys, cached, 1, "c.py:2: worse\n", exit_code_for=_exit_code_for
+    )
+    assert result == FileLintResult(1, "c.py:2: worse\na.py:1: bad\n")
+    assert cache.lookup(keys)["c.py"] == FileLintResult(1, "c.py:2: worse\n")
+
+    # Output which can't be split is not cached, but is still reported.
+    other_keys = {"d.py": fingerprint("tool", "d.py"), "a.py": keys["a.py"]}
+    result = cache.splice(
+        ["d.py", "a.py"],
+        other_keys,
+        {"a.py": cached["a.py"]},
+        2,
+        "Crashed!\n",
+        exit_code_for=_exit_code_for,
+    )
+    assert result == FileLintResult(3, "a.py:1: bad\nCrashed!\n")
+    assert "d.py" not in cache.lookup(other_keys)
+
+
+def test_cache_pruning(tmp_path: Path) -> None:
+    day = 24 * 60 * 60
+    now = 1_000_000_000.0
+    cache = LintResultCache(str(tmp_path / "cache"), max_age_days=2, clock=lambda: now)
+    cache.put({fingerprint("old"): FileLintResult(0, "")})
+    os.utime(cache._path(fingerprint("old")), (now - 3 * day,) * 2)
+
+    # The cache was pruned by the first write, and isn't pruned again within a day.
+    cache = LintResultCache(str(tmp_path / "cache"), max_age_days=2, clock=lambda: now)
+    cache.put({fingerprint("new"): FileLintResult(0, "")})
+    assert os.path.exists(cache._path(fingerprint("old")))
+
+    later = now + day + 1
+    cache = LintResultCache(str(tmp_path / "cache"), max_age_days=2, clock=lambda: later)
+    cache.put({fingerprint("newer"): FileLintResult(0, "")})
+    assert cache.get(fingerprint("old")) is None
+    assert cache.get(fingerprint("new")) == FileLintResult(0, "")
+    assert cache.get(fingerprint("newer")) == FileLintResult(0, "")
@@ -0,0 +1,242 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Mapping
+
+from pants.util.dirutil import safe_mkdir_for
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TimingStats:
+    """Rolling statistics for the runs of a single address, or of a single batch of addresses."""
+
+    # An exponentially weighted moving average of the duration of recent runs, in seconds.
+    mean_seconds: float
+    last_seconds: float
+    runs: int
+    # Unix timestamps.
+    last_run: float
+    last_failure: float | None = None
+
+    # The weight of the most recent run in `mean_seconds`.
+    SMOOTHING = 0.3
+
+    def observe(self, seconds: float, timestamp: float, succeeded: bool) -> TimingStats:
+        return TimingStats(
+            mean_seconds=self.mean_seconds + self.SMOOTHING * (seconds - self.mean_seconds),
+            last_seconds=seconds,
+            runs=self.runs + 1,
+            last_run=max(self.last_run, timestamp),
+            last_failure=self.last_failure if succeeded else timestamp,
+        )
+
+    @classmethod
+    def first(cls, seconds: float, timestamp: float, succeeded: bool) -> TimingStats:
+        return cls(
+            mean_seconds=seconds,
+            last_seconds=seconds,
+            runs=1,
+            last_run=timestamp,
+            last_failure=None if succeeded else timestamp,
+        )
+
+
+@dataclass(frozen=True)
+class TimingRecord:
+    """A single run of a batch of addresses, as recorded in a `TimingStore`."""
+
+    addresses: tuple[str, ...]
+    seconds: float
+    succeeded: bool
+
+
+class TimingStore:
+    """A local, append-only history of how long each address took to run, and whether it failed.
+
+    Each run appends one JSON line per batch to the store's file. When the file has grown to many
+    times the number of live entries, it is compacted into one line of rolling statistics per
+    address and per batch, and entries which have not run in `max_age_days`, or which exceed
+    `max_entries`, are evicted.
+
+    Batches are recorded as a whole, and each of their addresses is credited with an equal share
+    of the batch's duration.
+    """
+
+    _COMPACT_MIN_LINES = 1000
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_entries: int = 20000,
+        max_age_days: float = 30,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._path = path
+        self._max_entries = max_entries
+        self._max_age_seconds = max_age_days * 24 * 60 * 60
+        self._clock = clock
+        self._loaded = False
+        self._lines = 0
+        self._by_address: dict[str, TimingStats] = {}
+        self._by_batch: dict[tuple[str, ...], TimingStats] = {}
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self._path) as f:
+                for line in f:
+                    self._lines += 1
+                    try:
+                        self._apply(json.loads(line))
+                    except (ValueError, KeyError, TypeError):
+                        # Partially written or otherwise corrupt lines are skipped.
+                        continue
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to read test timings from `{self._path}`, ignoring them: {e}")
+
+    def _apply(self, entry: Mapping) -> None:
+        addresses = tuple(entry["a"])
+        seconds = float(entry["s"])
+        timestamp = float(entry["t"])
+        if "n" in entry:
+            # A compacted line, which replaces any earlier statistics for the same key.
+            stats = TimingStats(
+                mean_seconds=seconds,
+                last_seconds=float(entry.get("l", seconds)),
+                runs=int(entry["n"]),
+                last_run=timestamp,
+                last_failure=entry.get("f"),
+            )
+            if entry.get("b"):
+                self._by_batch[addresses] = stats
+            else:
+                self._by_address[addresses[0]] = stats
+            return
+
+        succeeded = bool(entry.get("ok", True))
+        if len(addresses) > 1:
+            self._observe(self._by_batch, addresses, seconds, timestamp, succeeded)
+        for address in addresses:
+            self._observe(self._by_address, address, seconds / len(addresses), timestamp, succeeded)
+
+    @staticmethod
+    def _observe(
+        stats_by_key: dict, key: object, seconds: float, timestamp: float, succeeded: bool
+    ) -> None:
+        stats = stats_by_key.get(key)
+        stats_by_key[key] = (
+            TimingStats.first(seconds, timestamp, succeeded)
+            if stats is None
+            else stats.observe(seconds, timestamp, succeeded)
+        )
+
+    def get(self, address: str) -> TimingStats | None:
+        self._load()
+        return self._by_address.get(address)
+
+    def get_batch(self, addresses: Iterable[str]) -> TimingStats | None:
+        self._load()
+        return self._by_batch.get(tuple(sorted(addresses)))
+
+    def durations(self) -> dict[str, float]:
+        """The typical duration of each known address, in seconds."""
+        self._load()
+        return {address: stats.mean_seconds for address, stats in self._by_address.items()}
+
+    def failed_since(self, timestamp: float) -> set[str]:
+        """The addresses which have failed at or after the given Unix timestamp."""
+        self._load()
+        return {
+            address
+            for address, stats in self._by_address.items()
+            if stats.last_failure is not None and stats.last_failure >= timestamp
+        }
+
+    def record(self, records: Iterable[TimingRecord]) -> None:
+        """Append the given runs to the store, compacting it if it has grown too large."""
+        self._load()
+        timestamp = self._clock()
+        lines = []
+        for record in records:
+            entry = {
+                "t": timestamp,
+                "a": sorted(record.addresses),
+                "s": round(record.seconds, 3),
+                "ok": record.succeeded,
+            }
+            self._apply(entry)
+            lines.append(json.dumps(entry, separators=(",", ":")))
+        if not lines:
+            return
+        try:
+            safe_mkdir_for(self._path)
+            with open(self._path, "a") as f:
+                f.write("".join(f"{line}\n" for line in lines))
+        except OSError as e:
+            logger.warning(f"Failed to record test timings to `{self._path}`: {e}")
+            return
+        self._lines += len(lines)
+
+        live_entries = len(self._by_address) + len(self._by_batch)
+        if self._lines > max(self._COMPACT_MIN_LINES, 4 * live_entries):
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the store as one line per entry, evicting stale and excess entries."""
+        self._load()
+        cutoff = self._clock() - self._max_age_seconds
+
+        def evict(stats_by_key: dict) -> dict:
+            live = [(key, stats) for key, stats in stats_by_key.items() if stats.last_run >= cutoff]
+            live.sort(key=lambda key_and_stats: key_and_stats[1].last_run, reverse=True)
+            return dict(live[: self._max_entries])
+
+        self._by_address = evict(self._by_address)
+        self._by_batch = evict(self._by_batch)
+
+        def compacted_line(addresses: Iterable[str], stats: TimingStats, batch: bool) -> str:
+            entry: dict = {
+                "t": stats.last_run,
+                "a": list(addresses),
+                "s": round(stats.mean_seconds, 3),
+                "l": round(stats.last_seconds, 3),
+                "n": stats.runs,
+            }
+            if stats.last_failure is not None:
+                entry["f"] = stats.last_failure
+            if batch:
+                entry["b"] = 1
+            return json.dumps(entry, separators=(",", ":"))
+
+        lines = [
+            *(compacted_line((a,), stats, False) for a, stats in self._by_address.items()),
+            *(compacted_line(b, stats, True) for b, stats in self._by_batch.items()),
+        ]
+        tmp_path = f"{self._path}.{os.getpid()}.tmp"
+        try:
+            safe_mkdir_for(self._path)
+            with open(tmp_path, "w") as f:
+                f.write("".join(f"{line}\n" for line in lines))
+            os.replace(tmp_path, self._path)
+        except OSError as e:
+            logger.warning(f"Failed to compact test timings in `{self._path}`: {e}")
+            return
+        self._lines = len(lines)
@@ -0,0 +1,83 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pants.core.util_rules.timing_store import TimingRecord, TimingStore
+
+DAY = 24 * 60 * 60
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_record_and_query(tmp_path: Path) -> None:
+    path = str(tmp_path / "timings.jsonl")
+    clock = FakeClock()
+    store = TimingStore(path, clock=clock)
+    store.record(
+        [
+            TimingRecord(("src:a",), 10.0, succeeded=True),
+            TimingRecord(("src:b", "src:c"), 4.0, succeeded=False),
+        ]
+    )
+    clock.now += 60
+    store.record([TimingRecord(("src:a",), 20.0, succeeded=True)])
+
+    # A fresh store reads the same history back from disk.
+    reloaded = TimingStore(path, clock=clock)
+    for s in (store, reloaded):
+        a = s.get("src:a")
+        assert a is not None
+        assert a.runs == 2
+        assert a.last_seconds == 20.0
+        assert a.mean_seconds == pytest.approx(13.0)
+        assert s.durations() == {"src:a": pytest.approx(13.0), "src:b": 2.0, "src:c": 2.0}
+        batch = s.get_batch(["src:c", "src:b"])
+        assert batch is not None and batch.mean_seconds == 4.0
+        assert s.failed_since(clock.now - 3600) == {"src:b", "src:c"}
+        assert s.failed_since(clock.now) == set()
+
+
+def test_corrupt_lines_are_skipped(tmp_path: Path) -> None:
+    path = tmp_path / "timings.jsonl"
+    path.write_text('{"t": 1, "a": ["src:a"], "s": 1.5}\n{"t": 2, "a": [\n')
+    assert TimingStore(str(path)).durations() == {"src:a": 1.5}
+
+
+def test_compaction_and_eviction(tmp_path: Path) -> None:
+    path = tmp_path / "timings.jsonl"
+    clock = FakeClock()
+    store = TimingStore(str(path), max_entries=2, max_age_days=1, clock=clock)
+    for address in ("src:old", "src:a", "src:b", "src:c"):
+        store.record([TimingRecord((address,), 1.0, succeeded=address != "src:a")])
+        clock.now += DAY / 4
+    store.record([TimingRecord(("src:c",), 3.0, succeeded=True)])
+    assert len(path.read_text().splitlines()) == 5
+
+    clock.now += DAY / 2
+    store.compact()
+    # `src:old` is more than a day old, and only the two most recently run entries are kept.
+    assert set(store.durations()) == {"src:b", "src:c"}
+    assert len(path.read_text().splitlines()) == 2
+
+    reloaded = TimingStore(str(path), clock=clock)
+    c = reloaded.get("src:c")
+    assert c is not None
+    assert c.runs == 2
+    assert c.last_seconds == 3.0
+    assert c.mean_seconds == pytest.approx(1.6)
+    assert reloaded.durations() == store.durations()
+
+    # New runs are appended after the compacted lines.
+    reloaded.record([TimingRecord(("src:b",), 2.0, succeeded=False)])
+    assert TimingStore(str(path), clock=clock).failed_since(clock.now) == {"src:b"}
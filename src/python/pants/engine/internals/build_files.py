@@ -3,15 +3,16 @@
 
 from __future__ import annotations
 
-import ast
 import builtins
+import dataclasses
+import hashlib
 import itertools
 import logging
 import os.path
-import sys
+import re
 import typing
 from dataclasses import dataclass
-from pathlib import PurePath
+from enum import Enum
 from typing import Any, Sequence, cast
 
 from pants.build_graph.address import (
@@ -32,12 +33,12 @@ from pants.engine.internals.dep_rules import (
     MaybeBuildFileDependencyRulesImplementation,
 )
 from pants.engine.internals.mapper import AddressFamily, AddressMap
-from pants.engine.internals.parser import (
-    BuildFilePreludeSymbols,
-    BuildFileSymbolsInfo,
-    Parser,
-    error_on_imports,
+from pants.engine.internals.parser import (  # noqa: F401
+    BUILDFileEnvVarExtractor as BUILDFileEnvVarExtractor,
 )
+from pants.engine.internals.parser import BuildFilePreludeSymbols, BuildFileSymbolsInfo
+from pants.engine.internals.parser import BuildFileSyntaxError as BuildFileSyntaxError  # noqa: F401
+from pants.engine.internals.parser import CompiledBuildFile, ParsedAddressFamilyCache, Parser
 from pants.engine.internals.session import SessionValues
 from pants.engine.internals.synthetic_targets import (
     SyntheticAddressMaps,
@@ -59,31 +60,6 @@ from pants.util.strutil import softwrap
 logger = logging.getLogger(__name__)
 
 
-class BuildFileSyntaxError(SyntaxError):
-    """An error parsing a BUILD file."""
-
-    def from_syntax_error(error: SyntaxError) -> BuildFileSyntaxError:
-        return BuildFileSyntaxError(
-            error.msg,
-            (
-                error.filename,
-                error.lineno,
-                error.offset,
-                error.text,
-            ),
-        )
-
-    def __str__(self) -> str:
-        first_line = f"Error parsing BUILD file {self.filename}:{self.lineno}: {self.msg}"
-        # These two fields are optional per the spec, so we can't rely on them being set.
-        if self.text is not None and self.offset is not None:
-            second_line = f"  {self.text.rstrip()}"
-            third_line = f"  {' ' * (self.offset - 1)}^"
-            return f"{first_line}\n{second_line}\n{third_line}"
-
-        return first_line
-
-
 @dataclass(frozen=True)
 class BuildFileOptions:
     patterns: tuple[str, ...]
@@ -126,15 +102,18 @@ async def evaluate_preludes(
     }
     locals: dict[str, Any] = {}
     env_vars: set[str] = set()
+    fingerprint = hashlib.sha256()
     for file_content in prelude_digest_contents:
+        fingerprint.update(f"{file_content.path}\0".encode())
+        fingerprint.update(hashlib.sha256(file_content.content).digest())
         try:
-            file_content_str = file_content.content.decode()
-            content = compile(file_content_str, file_content.path, "exec", dont_inherit=True)
-            exec(content, globals, locals)
+            compiled = parser.compile(file_content.path, file_content.content.decode())
+            exec(compiled.code, globals, locals)
         except Exception as e:
             raise Exception(f"Error parsing prelude file {file_content.path}: {e}")
-        error_on_imports(file_content_str, file_content.path)
-        env_vars.update(BUILDFileEnvVarExtractor.get_env_vars(file_content))
+        compiled.error_on_imports(file_content.path)
+        compiled.warn_on_non_constant_env_vars(file_content.path)
+        env_vars.update(compiled.referenced_env_vars)
     # __builtins__ is a dict, so isn't hashable, and can't be put in a FrozenDict.
     # Fortunately, we don't care about it - preludes should not be able to override builtins, so we just pop it out.
     # TODO: Give a nice error message if a prelude tries to set a expose a non-hashable value.
@@ -142,7 +121,7 @@ async def evaluate_preludes(
     # Ensure preludes can reference each other by populating the shared globals object with references
     # to the other symbols
     globals.update(locals)
-    return BuildFilePreludeSymbols.create(locals, env_vars)
+    return BuildFilePreludeSymbols.create(locals, env_vars, fingerprint.hexdigest())
 
 
 @rule
@@ -220,49 +199,181 @@ async def ensure_address_family(request: OptionalAddressFamily) -> AddressFamily
     return request.ensure()
 
 
-class BUILDFileEnvVarExtractor(ast.NodeVisitor):
-    def __init__(self, filename: str):
-        super().__init__()
-        self.env_vars: set[str] = set()
-        self.filename = filename
+@dataclass(frozen=True)
+class InheritedBuildFileState:
+    """The BUILD file state that a directory inherits from its nearest ancestor with BUILD files.
+
+    If the directory has BUILD files, this is their defaults and dependency rules, and otherwise it
+    is the state of the parent directory. Each directory only ever depends on its immediate parent,
+    so parsing a directory adds O(1) edges to the graph rather than one per ancestor.
+    """
+
+    defaults: BuildFileDefaults
+    dependents_rules: BuildFileDependencyRules | None
+    dependencies_rules: BuildFileDependencyRules | None
 
-    @classmethod
-    def get_env_vars(cls, file_content: FileContent) -> Sequence[str]:
-        obj = cls(file_content.path)
-        try:
-            obj.visit(ast.parse(file_content.content, file_content.path))
-        except SyntaxError as e:
-            raise BuildFileSyntaxError.from_syntax_error(e).with_traceback(e.__traceback__)
-
-        return tuple(obj.env_vars)
-
-    def visit_Call(self, node: ast.Call):
-        is_env = isinstance(node.func, ast.Name) and node.func.id == "env"
-        for arg in node.args:
-            if not is_env:
-                self.visit(arg)
-                continue
-
-            # Only first arg may be checked as env name
-            is_env = False
-
-            if sys.version_info[0:2] < (3, 8):
-                value = arg.s if isinstance(arg, ast.Str) else None
-            else:
-                value = arg.value if isinstance(arg, ast.Constant) else None
-            if value:
-                # Found env name in this call, we're done here.
-                self.env_vars.add(value)
-                return
-            else:
-                logger.warning(
-                    f"{self.filename}:{arg.lineno}: Only constant string values as variable name to "
-                    f"`env()` is currently supported. This `env()` call will always result in "
-                    "the default value only."
-                )
 
-        for kwarg in node.keywords:
-            self.visit(kwarg)
+def _parent_dir(path: str) -> str | None:
+    if path in ("", "."):
+        return None
+    return os.path.dirname(path)
+
+
+@rule
+async def find_inherited_build_file_state(directory: AddressFamilyDir) -> InheritedBuildFileState:
+    maybe_family = await Get(OptionalAddressFamily, AddressFamilyDir, directory)
+    family = maybe_family.address_family
+    if family is not None:
+        return InheritedBuildFileState(
+            defaults=family.defaults,
+            dependents_rules=family.dependents_rules,
+            dependencies_rules=family.dependencies_rules,
+        )
+    parent_dir = _parent_dir(directory.path)
+    if parent_dir is None:
+        return InheritedBuildFileState(BuildFileDefaults({}), None, None)
+    return await Get(InheritedBuildFileState, AddressFamilyDir(parent_dir))
+
+
+@dataclass(frozen=True)
+class _ParsedBuildFiles:
+    """The result of parsing the BUILD files of a directory, before synthetic targets are added."""
+
+    address_maps: tuple[AddressMap, ...]
+    defaults: BuildFileDefaults
+    dependents_rules: BuildFileDependencyRules | None
+    dependencies_rules: BuildFileDependencyRules | None
+
+
+def _parse_build_files(
+    path: str,
+    digest_contents: DigestContents,
+    all_env_vars: Sequence[EnvironmentVars],
+    parser: Parser,
+    prelude_symbols: BuildFilePreludeSymbols,
+    is_bootstrap: bool,
+    inherited: InheritedBuildFileState,
+    registered_target_types: RegisteredTargetTypes,
+    union_membership: UnionMembership,
+    build_file_dependency_rules_class: type[BuildFileDependencyRules] | None,
+) -> _ParsedBuildFiles:
+    defaults_parser_state = BuildFileDefaultsParserState.create(
+        path, inherited.defaults, registered_target_types, union_membership
+    )
+    if build_file_dependency_rules_class is not None:
+        dependents_rules_parser_state = build_file_dependency_rules_class.create_parser_state(
+            path,
+            inherited.dependents_rules,
+        )
+        dependencies_rules_parser_state = build_file_dependency_rules_class.create_parser_state(
+            path,
+            inherited.dependencies_rules,
+        )
+    else:
+        dependents_rules_parser_state = None
+        dependencies_rules_parser_state = None
+
+    # NB: Parsing reuses the cached compilation of each BUILD file, keyed by its content.
+    address_maps = tuple(
+        AddressMap.parse(
+            fc.path,
+            fc.content.decode(),
+            parser,
+            prelude_symbols,
+            env_vars,
+            is_bootstrap,
+            defaults_parser_state,
+            dependents_rules_parser_state,
+            dependencies_rules_parser_state,
+        )
+        for fc, env_vars in zip(digest_contents, all_env_vars)
+    )
+
+    # Freeze defaults and dependency rules
+    return _ParsedBuildFiles(
+        address_maps=address_maps,
+        defaults=defaults_parser_state.get_frozen_defaults(),
+        dependents_rules=cast(
+            "BuildFileDependencyRules | None",
+            dependents_rules_parser_state
+            and dependents_rules_parser_state.get_frozen_dependency_rules(),
+        ),
+        dependencies_rules=cast(
+            "BuildFileDependencyRules | None",
+            dependencies_rules_parser_state
+            and dependencies_rules_parser_state.get_frozen_dependency_rules(),
+        ),
+    )
+
+
+def _stable_repr(value: Any) -> str:
+    """A representation of the given BUILD file state which is the same in every process.
+
+    Raises a TypeError for values of types that have none, such as objects which are only
+    represented by their identity.
+    """
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return repr(value)
+    if isinstance(value, Enum):
+        return f"{type(value).__qualname__}.{value.name}"
+    if isinstance(value, re.Pattern):
+        return f"re.compile({value.pattern!r}, {value.flags})"
+    if isinstance(value, (tuple, list)):
+        return f"{type(value).__name__}({', '.join(_stable_repr(v) for v in value)})"
+    if isinstance(value, (set, frozenset)):
+        return f"{type(value).__name__}({', '.join(sorted(_stable_repr(v) for v in value))})"
+    if isinstance(value, (dict, FrozenDict)):
+        items = ", ".join(f"{_stable_repr(k)}: {_stable_repr(v)}" for k, v in value.items())
+        return f"{type(value).__name__}({{{items}}})"
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        fields = ", ".join(
+            f"{f.name}={_stable_repr(getattr(value, f.name))}" for f in dataclasses.fields(value)
+        )
+        return f"{type(value).__module__}.{type(value).__qualname__}({fields})"
+    raise TypeError(f"No stable representation for a value of type {type(value).__name__}.")
+
+
+def _parsed_build_files_cache_key(
+    cache: ParsedAddressFamilyCache,
+    path: str,
+    digest_contents: DigestContents,
+    all_env_vars: Sequence[EnvironmentVars],
+    prelude_symbols: BuildFilePreludeSymbols,
+    is_bootstrap: bool,
+    inherited: InheritedBuildFileState,
+    build_file_dependency_rules_class: type[BuildFileDependencyRules] | None,
+) -> str | None:
+    """The key of everything that parsing the BUILD files of a directory depends on, if any.
+
+    Returns None if the inherited defaults or dependency rules have no stable representation, and
+    so can't be fingerprinted.
+    """
+    try:
+        inherited_state = "\n".join(
+            (
+                _stable_repr(inherited.defaults),
+                _stable_repr(inherited.dependents_rules),
+                _stable_repr(inherited.dependencies_rules),
+            )
+        )
+    except TypeError:
+        return None
+    rules_class = build_file_dependency_rules_class
+    return cache.key(
+        path,
+        prelude_symbols.fingerprint,
+        str(is_bootstrap),
+        f"{rules_class.__module__}.{rules_class.__qualname__}" if rules_class else "",
+        inherited_state,
+        *itertools.chain.from_iterable(
+            (
+                fc.path,
+                hashlib.sha256(fc.content).digest(),
+                repr(sorted(env_vars.items())),
+            )
+            for fc, env_vars in zip(digest_contents, all_env_vars)
+        ),
+    )
 
 
 @rule(desc="Search for addresses in BUILD files")
@@ -297,47 +408,23 @@ async def parse_address_family(
     if not digest_contents and not synthetic_address_maps:
         return OptionalAddressFamily(directory.path)
 
-    defaults = BuildFileDefaults({})
-    dependents_rules: BuildFileDependencyRules | None = None
-    dependencies_rules: BuildFileDependencyRules | None = None
-    parent_dirs = tuple(PurePath(directory.path).parents)
-    if parent_dirs:
-        maybe_parents = await MultiGet(
-            Get(OptionalAddressFamily, AddressFamilyDir(str(parent_dir)))
-            for parent_dir in parent_dirs
-        )
-        for maybe_parent in maybe_parents:
-            if maybe_parent.address_family is not None:
-                family = maybe_parent.address_family
-                defaults = family.defaults
-                dependents_rules = family.dependents_rules
-                dependencies_rules = family.dependencies_rules
-                break
+    inherited = InheritedBuildFileState(BuildFileDefaults({}), None, None)
+    parent_dir = _parent_dir(directory.path)
+    if parent_dir is not None:
+        inherited = await Get(InheritedBuildFileState, AddressFamilyDir(parent_dir))
 
-    defaults_parser_state = BuildFileDefaultsParserState.create(
-        directory.path, defaults, registered_target_types, union_membership
-    )
-    build_file_dependency_rules_class = (
-        maybe_build_file_dependency_rules_implementation.build_file_dependency_rules_class
-    )
-    if build_file_dependency_rules_class is not None:
-        dependents_rules_parser_state = build_file_dependency_rules_class.create_parser_state(
-            directory.path,
-            dependents_rules,
-        )
-        dependencies_rules_parser_state = build_file_dependency_rules_class.create_parser_state(
-            directory.path,
-            dependencies_rules,
-        )
-    else:
-        dependents_rules_parser_state = None
-        dependencies_rules_parser_state = None
+    # Each BUILD file is analyzed (and compiled) exactly once, yielding everything we need below.
+    compiled_build_files = [parser.compile(fc.path, fc.content.decode()) for fc in digest_contents]
 
     def _extract_env_vars(
-        file_content: FileContent, extra_env: Sequence[str], env: CompleteEnvironmentVars
+        fc: FileContent,
+        compiled: CompiledBuildFile,
+        extra_env: Sequence[str],
+        env: CompleteEnvironmentVars,
     ) -> Get[EnvironmentVars]:
         """For BUILD file env vars, we only ever consult the local systems env."""
-        env_vars = (*BUILDFileEnvVarExtractor.get_env_vars(file_content), *extra_env)
+        compiled.warn_on_non_constant_env_vars(fc.path)
+        env_vars = (*compiled.referenced_env_vars, *extra_env)
         return Get(
             EnvironmentVars,
             {
@@ -348,38 +435,52 @@ async def parse_address_family(
 
     all_env_vars = await MultiGet(
         _extract_env_vars(
-            fc, prelude_symbols.referenced_env_vars, session_values[CompleteEnvironmentVars]
+            fc,
+            compiled,
+            prelude_symbols.referenced_env_vars,
+            session_values[CompleteEnvironmentVars],
         )
-        for fc in digest_contents
+        for fc, compiled in zip(digest_contents, compiled_build_files)
     )
 
-    address_maps = [
-        AddressMap.parse(
-            fc.path,
-            fc.content.decode(),
-            parser,
+    build_file_dependency_rules_class = (
+        maybe_build_file_dependency_rules_implementation.build_file_dependency_rules_class
+    )
+    cache = parser.parsed_address_families
+    cache_key = (
+        _parsed_build_files_cache_key(
+            cache,
+            directory.path,
+            digest_contents,
+            all_env_vars,
             prelude_symbols,
-            env_vars,
             bootstrap_status.in_progress,
-            defaults_parser_state,
-            dependents_rules_parser_state,
-            dependencies_rules_parser_state,
+            inherited,
+            build_file_dependency_rules_class,
         )
-        for fc, env_vars in zip(digest_contents, all_env_vars)
-    ]
-
-    # Freeze defaults and dependency rules
-    frozen_defaults = defaults_parser_state.get_frozen_defaults()
-    frozen_dependents_rules = cast(
-        "BuildFileDependencyRules | None",
-        dependents_rules_parser_state
-        and dependents_rules_parser_state.get_frozen_dependency_rules(),
-    )
-    frozen_dependencies_rules = cast(
-        "BuildFileDependencyRules | None",
-        dependencies_rules_parser_state
-        and dependencies_rules_parser_state.get_frozen_dependency_rules(),
+        if cache is not None and digest_contents
+        else None
     )
+    parsed = cache.get(cache_key) if cache and cache_key else None
+    if not isinstance(parsed, _ParsedBuildFiles):
+        parsed = _parse_build_files(
+            directory.path,
+            digest_contents,
+            all_env_vars,
+            parser,
+            prelude_symbols,
+            bootstrap_status.in_progress,
+            inherited,
+            registered_target_types,
+            union_membership,
+            build_file_dependency_rules_class,
+        )
+        # NB: The result is pickled right away, before the synthetic targets below modify its
+        # target adaptors in place.
+        if cache and cache_key:
+            cache.put(cache_key, parsed)
+    address_maps = parsed.address_maps
+    frozen_defaults = parsed.defaults
 
     # Process synthetic targets.
     for address_map in address_maps:
@@ -393,8 +494,8 @@ async def parse_address_family(
             spec_path=directory.path,
             address_maps=(*address_maps, *synthetic_address_maps),
             defaults=frozen_defaults,
-            dependents_rules=frozen_dependents_rules,
-            dependencies_rules=frozen_dependencies_rules,
+            dependents_rules=parsed.dependents_rules,
+            dependencies_rules=parsed.dependencies_rules,
         ),
     )
 
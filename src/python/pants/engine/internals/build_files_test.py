@@ -21,11 +21,13 @@ from pants.engine.internals.build_files import (
     BUILDFileEnvVarExtractor,
     BuildFileOptions,
     BuildFileSyntaxError,
+    InheritedBuildFileState,
     OptionalAddressFamily,
+    _stable_repr,
     evaluate_preludes,
     parse_address_family,
 )
-from pants.engine.internals.defaults import ParametrizeDefault
+from pants.engine.internals.defaults import BuildFileDefaults, ParametrizeDefault
 from pants.engine.internals.dep_rules import MaybeBuildFileDependencyRulesImplementation
 from pants.engine.internals.mapper import AddressFamily
 from pants.engine.internals.parametrize import Parametrize
@@ -59,49 +61,60 @@ from pants.util.frozendict import FrozenDict
 from pants.util.strutil import softwrap
 
 
+def run_parse_address_family(parser: Parser, build_file_content: str = "") -> OptionalAddressFamily:
+    return cast(
+        OptionalAddressFamily,
+        run_rule_with_mocks(
+            parse_address_family,
+            rule_args=[
+                parser,
+                BootstrapStatus(in_progress=False),
+                BuildFileOptions(("BUILD",)),
+                BuildFilePreludeSymbols(FrozenDict(), ()),
+                AddressFamilyDir("/dev/null"),
+                RegisteredTargetTypes({}),
+                UnionMembership({}),
+                MaybeBuildFileDependencyRulesImplementation(None),
+                SessionValues({CompleteEnvironmentVars: CompleteEnvironmentVars({})}),
+            ],
+            mock_gets=[
+                MockGet(
+                    output_type=DigestContents,
+                    input_types=(PathGlobs,),
+                    mock=lambda _: DigestContents(
+                        [FileContent(path="/dev/null/BUILD", content=build_file_content.encode())]
+                    ),
+                ),
+                MockGet(
+                    output_type=InheritedBuildFileState,
+                    input_types=(AddressFamilyDir,),
+                    mock=lambda _: InheritedBuildFileState(BuildFileDefaults({}), None, None),
+                ),
+                MockGet(
+                    output_type=SyntheticAddressMaps,
+                    input_types=(SyntheticAddressMapsRequest,),
+                    mock=lambda _: SyntheticAddressMaps(),
+                ),
+                MockGet(
+                    output_type=EnvironmentVars,
+                    input_types=(EnvironmentVarsRequest, CompleteEnvironmentVars),
+                    mock=lambda _1, _2: EnvironmentVars({}),
+                ),
+            ],
+        ),
+    )
+
+
 def test_parse_address_family_empty() -> None:
     """Test that parsing an empty BUILD file results in an empty AddressFamily."""
-    optional_af = run_rule_with_mocks(
-        parse_address_family,
-        rule_args=[
-            Parser(
-                build_root="",
-                registered_target_types=RegisteredTargetTypes({}),
-                union_membership=UnionMembership({}),
-                object_aliases=BuildFileAliases(),
-                ignore_unrecognized_symbols=False,
-            ),
-            BootstrapStatus(in_progress=False),
-            BuildFileOptions(("BUILD",)),
-            BuildFilePreludeSymbols(FrozenDict(), ()),
-            AddressFamilyDir("/dev/null"),
-            RegisteredTargetTypes({}),
-            UnionMembership({}),
-            MaybeBuildFileDependencyRulesImplementation(None),
-            SessionValues({CompleteEnvironmentVars: CompleteEnvironmentVars({})}),
-        ],
-        mock_gets=[
-            MockGet(
-                output_type=DigestContents,
-                input_types=(PathGlobs,),
-                mock=lambda _: DigestContents([FileContent(path="/dev/null/BUILD", content=b"")]),
-            ),
-            MockGet(
-                output_type=OptionalAddressFamily,
-                input_types=(AddressFamilyDir,),
-                mock=lambda _: OptionalAddressFamily("/dev"),
-            ),
-            MockGet(
-                output_type=SyntheticAddressMaps,
-                input_types=(SyntheticAddressMapsRequest,),
-                mock=lambda _: SyntheticAddressMaps(),
-            ),
-            MockGet(
-                output_type=EnvironmentVars,
-                input_types=(EnvironmentVarsRequest, CompleteEnvironmentVars),
-                mock=lambda _1, _2: EnvironmentVars({}),
-            ),
-        ],
+    optional_af = run_parse_address_family(
+        Parser(
+            build_root="",
+            registered_target_types=RegisteredTargetTypes({}),
+            union_membership=UnionMembership({}),
+            object_aliases=BuildFileAliases(),
+            ignore_unrecognized_symbols=False,
+        )
     )
     assert optional_af.path == "/dev/null"
     assert optional_af.address_family is not None
@@ -110,6 +123,43 @@ def test_parse_address_family_empty() -> None:
     assert len(af.name_to_target_adaptors) == 0
 
 
+def test_parse_address_family_persistent_cache(tmp_path) -> None:
+    evaluations = []
+
+    def evaluated() -> str:
+        evaluations.append(1)
+        return "t"
+
+    def run(build_file_content: str) -> OptionalAddressFamily:
+        # A new Parser for each run, as for a new pantsd.
+        return run_parse_address_family(
+            Parser(
+                build_root="",
+                registered_target_types=RegisteredTargetTypes({"target": GenericTarget}),
+                union_membership=UnionMembership({}),
+                object_aliases=BuildFileAliases(objects={"evaluated": evaluated}),
+                ignore_unrecognized_symbols=False,
+                build_file_cache_dir=str(tmp_path),
+            ),
+            build_file_content,
+        )
+
+    def target_names(optional_af: OptionalAddressFamily) -> list[str]:
+        assert optional_af.address_family is not None
+        return sorted(optional_af.address_family.name_to_target_adaptors)
+
+    assert target_names(run("target(name=evaluated())")) == ["t"]
+    assert len(evaluations) == 1
+
+    # The BUILD file is not evaluated again, but its targets are read from the cache.
+    assert target_names(run("target(name=evaluated())")) == ["t"]
+    assert len(evaluations) == 1
+
+    # Until it changes.
+    assert target_names(run("target(name=evaluated())\ntarget(name='u')")) == ["t", "u"]
+    assert len(evaluations) == 2
+
+
 def run_prelude_parsing_rule(prelude_content: str) -> BuildFilePreludeSymbols:
     symbols = run_rule_with_mocks(
         evaluate_preludes,
@@ -982,3 +1032,20 @@ def test_build_file_syntax_error(filename, contents, expect_failure, expected_me
 
     else:
         BUILDFileEnvVarExtractor.get_env_vars(MockFileContent(filename, contents))
+
+
+def test_stable_repr_of_inherited_state() -> None:
+    def defaults(**kwargs) -> BuildFileDefaults:
+        return BuildFileDefaults({"python_sources": FrozenDict(kwargs)})
+
+    # Equal state built separately has the same representation, which doesn't depend on hashing or
+    # on the identity of objects, and so is the same in every process.
+    assert _stable_repr(defaults(tags=("a",), skip_black=True)) == _stable_repr(
+        defaults(tags=("a",), skip_black=True)
+    )
+    assert _stable_repr(defaults(tags=("a",))) != _stable_repr(defaults(tags=("b",)))
+    assert _stable_repr(defaults(resolve=ParametrizeDefault("a", "b"))) != _stable_repr(
+        defaults(resolve=ParametrizeDefault("a", "c"))
+    )
+    with pytest.raises(TypeError):
+        _stable_repr(defaults(description=object()))
@@ -9,12 +9,18 @@ import itertools
 import json
 import logging
 import os.path
+from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import PurePath
 from typing import Any, Iterable, Iterator, NamedTuple, Sequence, Type, TypeVar, cast
 
 from pants.base.deprecated import warn_or_error
-from pants.base.specs import AncestorGlobSpec, RawSpecsWithoutFileOwners, RecursiveGlobSpec
+from pants.base.specs import (
+    AncestorGlobSpec,
+    DirGlobSpec,
+    RawSpecsWithoutFileOwners,
+    RecursiveGlobSpec,
+)
 from pants.build_graph.address import BuildFileAddressRequest, MaybeAddress, ResolveError
 from pants.engine.addresses import (
     Address,
@@ -93,6 +99,7 @@ from pants.engine.target import (
 )
 from pants.engine.unions import UnionMembership, UnionRule
 from pants.option.global_options import GlobalOptions, UnmatchedBuildFileGlobs
+from pants.util.dirutil import recursive_dirname
 from pants.util.docutil import bin_name, doc_url
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
@@ -992,6 +999,77 @@ class Owners(FrozenOrderedSet[Address]):
     pass
 
 
+_GLOB_CHARS = frozenset("*?[")
+
+
+def _literal_source_paths(sources_field: SourcesField) -> tuple[str, ...] | None:
+    """Return the exact paths owned by the field, or None if it uses globs or excludes."""
+    filespec = sources_field.filespec
+    if filespec.get("excludes"):
+        return None
+    includes = filespec["includes"]
+    for path in includes:
+        if not _GLOB_CHARS.isdisjoint(path) or os.path.normpath(path) != path:
+            return None
+    return tuple(includes)
+
+
+@dataclass(frozen=True)
+class _OwnersIndexRequest:
+    directory: str
+    filter_by_global_options: bool
+
+
+@dataclass(frozen=True)
+class _OwnersIndex:
+    """The (expanded) targets declared in a single directory, indexed by the files they own.
+
+    Targets whose sources are plain file paths (which includes almost all generated file-level
+    targets) are looked up by path, and only the remaining targets with globs need to be matched.
+
+    Because the index is requested per-directory, the engine memoizes it for the lifetime of the
+    session (or of pantsd), and only recomputes it when that directory's BUILD files change.
+    """
+
+    targets: tuple[Target, ...]
+    targets_by_path: FrozenDict[str, tuple[Target, ...]]
+    targets_with_globs: tuple[Target, ...]
+
+
+@rule(_masked_types=[EnvironmentName])
+async def build_owners_index(request: _OwnersIndexRequest) -> _OwnersIndex:
+    raw_specs = RawSpecsWithoutFileOwners(
+        dir_globs=(DirGlobSpec(request.directory),),
+        filter_by_global_options=request.filter_by_global_options,
+        description_of_origin="<owners rule - unused>",
+        unmatched_glob_behavior=GlobMatchErrorBehavior.ignore,
+    )
+    targets_get: Get[FilteredTargets | Targets] = (
+        Get(FilteredTargets, RawSpecsWithoutFileOwners, raw_specs)
+        if request.filter_by_global_options
+        else Get(Targets, RawSpecsWithoutFileOwners, raw_specs)
+    )
+    targets = await targets_get
+
+    targets_by_path: defaultdict[str, list[Target]] = defaultdict(list)
+    targets_with_globs = []
+    for tgt in targets:
+        paths = _literal_source_paths(tgt.get(SourcesField))
+        if paths is None:
+            targets_with_globs.append(tgt)
+            continue
+        for path in paths:
+            targets_by_path[path].append(tgt)
+
+    return _OwnersIndex(
+        targets=tuple(targets),
+        targets_by_path=FrozenDict(
+            (path, tuple(tgts)) for path, tgts in sorted(targets_by_path.items())
+        ),
+        targets_with_globs=tuple(targets_with_globs),
+    )
+
+
 @rule(desc="Find which targets own certain files", _masked_types=[EnvironmentName])
 async def find_owners(
     owners_request: OwnersRequest,
@@ -1005,74 +1083,104 @@ async def find_owners(
     live_dirs = FrozenOrderedSet(os.path.dirname(s) for s in live_files)
     deleted_dirs = FrozenOrderedSet(os.path.dirname(s) for s in deleted_files)
 
-    def create_live_and_deleted_gets(
-        *, filter_by_global_options: bool
-    ) -> tuple[Get[FilteredTargets | Targets], Get[UnexpandedTargets],]:
-        """Walk up the buildroot looking for targets that would conceivably claim changed sources.
-
-        For live files, we use Targets, which causes generated targets to be used rather than their
-        target generators. For deleted files we use UnexpandedTargets, which have the original
-        declared `sources` globs from target generators.
-
-        We ignore unrecognized files, which can happen e.g. when finding owners for deleted files.
-        """
-        live_raw_specs = RawSpecsWithoutFileOwners(
-            ancestor_globs=tuple(AncestorGlobSpec(directory=d) for d in live_dirs),
-            filter_by_global_options=filter_by_global_options,
-            description_of_origin="<owners rule - unused>",
-            unmatched_glob_behavior=GlobMatchErrorBehavior.ignore,
-        )
-        live_get: Get[FilteredTargets | Targets] = (
-            Get(FilteredTargets, RawSpecsWithoutFileOwners, live_raw_specs)
-            if filter_by_global_options
-            else Get(Targets, RawSpecsWithoutFileOwners, live_raw_specs)
-        )
-        deleted_get = Get(
-            UnexpandedTargets,
-            RawSpecsWithoutFileOwners(
-                ancestor_globs=tuple(AncestorGlobSpec(directory=d) for d in deleted_dirs),
-                filter_by_global_options=filter_by_global_options,
-                description_of_origin="<owners rule - unused>",
-                unmatched_glob_behavior=GlobMatchErrorBehavior.ignore,
+    result: set[Address] = set()
+    unmatched_sources = set(owners_request.sources)
+
+    # For live files, we consult the owners index of each of their ancestor directories. The index
+    # uses Targets, which causes generated targets to be used rather than their target generators.
+    live_files_by_dir: defaultdict[str, list[str]] = defaultdict(list)
+    for file in live_files:
+        live_files_by_dir[os.path.dirname(file)].append(file)
+    live_files_by_ancestor_dir: defaultdict[str, list[str]] = defaultdict(list)
+    for live_dir, files in live_files_by_dir.items():
+        for ancestor_dir in set(recursive_dirname(live_dir)):
+            live_files_by_ancestor_dir[ancestor_dir].extend(files)
+
+    owners_indexes = await MultiGet(
+        Get(
+            _OwnersIndex,
+            _OwnersIndexRequest(
+                ancestor_dir, filter_by_global_options=owners_request.filter_by_global_options
             ),
         )
-        return live_get, deleted_get
-
-    live_get, deleted_get = create_live_and_deleted_gets(
-        filter_by_global_options=owners_request.filter_by_global_options
+        for ancestor_dir in live_files_by_ancestor_dir
     )
-    live_candidate_tgts, deleted_candidate_tgts = await MultiGet(live_get, deleted_get)
-
-    result = set()
-    unmatched_sources = set(owners_request.sources)
-    for live in (True, False):
-        candidate_tgts: Sequence[Target]
-        if live:
-            candidate_tgts = live_candidate_tgts
-            sources_set = live_files
-        else:
-            candidate_tgts = deleted_candidate_tgts
-            sources_set = deleted_files
 
-        build_file_addresses = await MultiGet(  # noqa: PNT30: requires triage
+    for files, owners_index in zip(live_files_by_ancestor_dir.values(), owners_indexes):
+        for file in files:
+            owning_tgts = owners_index.targets_by_path.get(file)
+            if owning_tgts:
+                unmatched_sources.discard(file)
+                result.update(tgt.address for tgt in owning_tgts)
+        for tgt in owners_index.targets_with_globs:
+            matching_files = tgt.get(SourcesField).filespec_matcher.matches(files)
+            if matching_files:
+                unmatched_sources.difference_update(matching_files)
+                result.add(tgt.address)
+
+    if owners_request.match_if_owning_build_file_included_in_sources and live_files:
+        # A BUILD file can only declare targets in its own directory.
+        build_file_candidate_tgts = [
+            tgt
+            for ancestor_dir, owners_index in zip(live_files_by_ancestor_dir, owners_indexes)
+            if ancestor_dir in live_dirs
+            for tgt in owners_index.targets
+        ]
+        build_file_addresses = await MultiGet(
             Get(
                 BuildFileAddress,
                 BuildFileAddressRequest(
                     tgt.address, description_of_origin="<owners rule - cannot trigger>"
                 ),
             )
-            for tgt in candidate_tgts
+            for tgt in build_file_candidate_tgts
+        )
+        result.update(
+            tgt.address
+            for tgt, bfa in zip(build_file_candidate_tgts, build_file_addresses)
+            if bfa.rel_path in live_files
         )
 
-        for candidate_tgt, bfa in zip(candidate_tgts, build_file_addresses):
+    if deleted_files:
+        # For deleted files, we walk up the buildroot looking for targets that would conceivably
+        # claim them. We use UnexpandedTargets, which have the original declared `sources` globs
+        # from target generators.
+        #
+        # We ignore unrecognized files, which can happen e.g. when finding owners for deleted files.
+        deleted_candidate_tgts = await Get(
+            UnexpandedTargets,
+            RawSpecsWithoutFileOwners(
+                ancestor_globs=tuple(AncestorGlobSpec(directory=d) for d in deleted_dirs),
+                filter_by_global_options=owners_request.filter_by_global_options,
+                description_of_origin="<owners rule - unused>",
+                unmatched_glob_behavior=GlobMatchErrorBehavior.ignore,
+            ),
+        )
+        # BuildFileAddresses are only needed if the caller wants BUILD files to claim targets.
+        deleted_tgts_owned_by_build_file: set[Address] = set()
+        if owners_request.match_if_owning_build_file_included_in_sources:
+            deleted_build_file_addresses = await MultiGet(
+                Get(
+                    BuildFileAddress,
+                    BuildFileAddressRequest(
+                        tgt.address, description_of_origin="<owners rule - cannot trigger>"
+                    ),
+                )
+                for tgt in deleted_candidate_tgts
+            )
+            deleted_tgts_owned_by_build_file.update(
+                tgt.address
+                for tgt, bfa in zip(deleted_candidate_tgts, deleted_build_file_addresses)
+                if bfa.rel_path in deleted_files
+            )
+
+        deleted_files_list = list(deleted_files)
+        for candidate_tgt in deleted_candidate_tgts:
             matching_files = set(
-                candidate_tgt.get(SourcesField).filespec_matcher.matches(list(sources_set))
+                candidate_tgt.get(SourcesField).filespec_matcher.matches(deleted_files_list)
             )
 
-            if not matching_files and not (
-                owners_request.match_if_owning_build_file_included_in_sources
-                and bfa.rel_path in sources_set
-            ):
+            if not matching_files and candidate_tgt.address not in deleted_tgts_owned_by_build_file:
                 continue
 
             unmatched_sources -= matching_files
@@ -980,6 +980,41 @@ def test_owners_build_file(owners_rule_runner: RuleRunner) -> None:
     )
 
 
+def test_owners_nested_directories(owners_rule_runner: RuleRunner) -> None:
+    """Targets declared in ancestor directories may own files in subdirectories."""
+    owners_rule_runner.write_files(
+        {
+            "demo/f.txt": "",
+            "demo/sub/f.txt": "",
+            "demo/sub/g.txt": "",
+            "demo/BUILD": dedent(
+                """\
+                target(name='recursive', sources=['**/*.txt'])
+                target(name='literal', sources=['sub/g.txt'])
+                generator(name='generator', sources=['sub/*.txt'])
+                """
+            ),
+            "demo/sub/BUILD": "target(name='local', sources=['f.txt'])",
+        }
+    )
+    assert_owners(
+        owners_rule_runner,
+        ["demo/f.txt"],
+        expected={Address("demo", target_name="recursive")},
+    )
+    assert_owners(
+        owners_rule_runner,
+        ["demo/sub/f.txt", "demo/sub/g.txt"],
+        expected={
+            Address("demo", target_name="recursive"),
+            Address("demo", target_name="literal"),
+            Address("demo", target_name="generator", relative_file_path="sub/f.txt"),
+            Address("demo", target_name="generator", relative_file_path="sub/g.txt"),
+            Address("demo/sub", target_name="local"),
+        },
+    )
+
+
 # -----------------------------------------------------------------------------------------------
 # Test file-level target generation and parameterization.
 # -----------------------------------------------------------------------------------------------
@@ -694,6 +694,11 @@ def scheduler_live_items(
     scheduler: PyScheduler, session: PySession
 ) -> tuple[list[Any], dict[str, tuple[int, int]]]: ...
 def scheduler_shutdown(scheduler: PyScheduler, timeout_secs: int) -> None: ...
+def scheduler_update_remoting(
+    scheduler: PyScheduler,
+    remoting_options: PyRemotingOptions,
+    exec_strategy_opts: PyExecutionStrategyOptions,
+) -> None: ...
 def session_new_run_id(session: PySession) -> None: ...
 def session_poll_workunits(
     scheduler: PyScheduler, session: PySession, max_log_verbosity_level: int
@@ -717,6 +722,7 @@ def graph_visualize(scheduler: PyScheduler, session: PySession, path: str) -> No
 def graph_invalidate_paths(scheduler: PyScheduler, paths: Iterable[str]) -> int: ...
 def graph_invalidate_all_paths(scheduler: PyScheduler) -> int: ...
 def graph_invalidate_all(scheduler: PyScheduler) -> None: ...
+def graph_evict_all(scheduler: PyScheduler) -> None: ...
 def check_invalidation_watcher_liveness(scheduler: PyScheduler) -> None: ...
 def validate_reachability(scheduler: PyScheduler) -> None: ...
 def rule_graph_consumed_types(
@@ -3,33 +3,44 @@
 
 from __future__ import annotations
 
+import ast
+import dataclasses
+import hashlib
 import inspect
 import itertools
 import logging
+import marshal
+import os
+import pickle
 import re
+import sys
 import threading
-import tokenize
+import time
 import traceback
+from collections import OrderedDict
 from dataclasses import dataclass
 from difflib import get_close_matches
-from io import StringIO
 from pathlib import PurePath
-from typing import Any, Callable, Iterable, Mapping, TypeVar
+from types import CodeType
+from typing import Any, Callable, Container, Iterable, Mapping, Sequence, TypeVar
 
 from pants.base.deprecated import warn_or_error
 from pants.base.exceptions import MappingError
 from pants.base.parse_context import ParseContext
 from pants.build_graph.build_file_aliases import BuildFileAliases
 from pants.engine.env_vars import EnvironmentVars
+from pants.engine.fs import FileContent
 from pants.engine.internals.defaults import BuildFileDefaultsParserState, SetDefaultsT
 from pants.engine.internals.dep_rules import BuildFileDependencyRulesParserState
 from pants.engine.internals.target_adaptor import TargetAdaptor
 from pants.engine.target import Field, ImmutableValue, RegisteredTargetTypes
 from pants.engine.unions import UnionMembership
+from pants.util.dirutil import safe_mkdir_for
 from pants.util.docutil import doc_url
 from pants.util.frozendict import FrozenDict
 from pants.util.memo import memoized_property
 from pants.util.strutil import docstring, softwrap
+from pants.version import VERSION
 
 logger = logging.getLogger(__name__)
 T = TypeVar("T")
@@ -60,13 +71,21 @@ class BuildFileSymbolsInfo:
 @dataclass(frozen=True)
 class BuildFilePreludeSymbols(BuildFileSymbolsInfo):
     referenced_env_vars: tuple[str, ...]
+    # A hash of the paths and content of the prelude files that defined these symbols.
+    fingerprint: str = ""
 
     @classmethod
-    def create(cls, ns: Mapping[str, Any], env_vars: Iterable[str]) -> BuildFilePreludeSymbols:
+    def create(
+        cls, ns: Mapping[str, Any], env_vars: Iterable[str], fingerprint: str = ""
+    ) -> BuildFilePreludeSymbols:
         info = {}
         for name, symb in ns.items():
             info[name] = BuildFileSymbolInfo(name, symb)
-        return cls(info=FrozenDict(info), referenced_env_vars=tuple(sorted(env_vars)))
+        return cls(
+            info=FrozenDict(info),
+            referenced_env_vars=tuple(sorted(env_vars)),
+            fingerprint=fingerprint,
+        )
 
 
 @dataclass(frozen=True)
@@ -306,6 +325,428 @@ class Registrar:
         return resolve_field_default
 
 
+class BuildFileSyntaxError(SyntaxError):
+    """An error parsing a BUILD file."""
+
+    def from_syntax_error(error: SyntaxError) -> BuildFileSyntaxError:
+        return BuildFileSyntaxError(
+            error.msg,
+            (
+                error.filename,
+                error.lineno,
+                error.offset,
+                error.text,
+            ),
+        )
+
+    def __str__(self) -> str:
+        first_line = f"Error parsing BUILD file {self.filename}:{self.lineno}: {self.msg}"
+        # These two fields are optional per the spec, so we can't rely on them being set.
+        if self.text is not None and self.offset is not None:
+            second_line = f"  {self.text.rstrip()}"
+            third_line = f"  {' ' * (self.offset - 1)}^"
+            return f"{first_line}\n{second_line}\n{third_line}"
+
+        return first_line
+
+
+class BuildFileAnalyzer(ast.NodeVisitor):
+    """Collects everything we need to know about a BUILD file's source in a single AST walk."""
+
+    def __init__(self, filename: str):
+        super().__init__()
+        self.env_vars: set[str] = set()
+        self.non_constant_env_var_linenos: list[int] = []
+        self.import_linenos: list[int] = []
+        self.filename = filename
+
+    @classmethod
+    def analyze(cls, tree: ast.AST, filename: str) -> BuildFileAnalyzer:
+        obj = cls(filename)
+        obj.visit(tree)
+        return obj
+
+    def warn_on_non_constant_env_vars(self, filepath: str) -> None:
+        _warn_on_non_constant_env_vars(filepath, self.non_constant_env_var_linenos)
+
+    def visit_Import(self, node: ast.Import):
+        self.import_linenos.append(node.lineno)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        self.import_linenos.append(node.lineno)
+
+    def visit_Call(self, node: ast.Call):
+        is_env = isinstance(node.func, ast.Name) and node.func.id == "env"
+        for arg in node.args:
+            if not is_env:
+                self.visit(arg)
+                continue
+
+            # Only first arg may be checked as env name
+            is_env = False
+
+            if sys.version_info[0:2] < (3, 8):
+                value = arg.s if isinstance(arg, ast.Str) else None
+            else:
+                value = arg.value if isinstance(arg, ast.Constant) else None
+            if value:
+                # Found env name in this call, we're done here.
+                self.env_vars.add(value)
+                return
+            else:
+                self.non_constant_env_var_linenos.append(arg.lineno)
+
+        for kwarg in node.keywords:
+            self.visit(kwarg)
+
+
+class BUILDFileEnvVarExtractor(BuildFileAnalyzer):
+    @classmethod
+    def get_env_vars(cls, file_content: FileContent) -> Sequence[str]:
+        obj = cls.analyze(
+            _parse_build_file(file_content.content, file_content.path), file_content.path
+        )
+        obj.warn_on_non_constant_env_vars(file_content.path)
+        return tuple(obj.env_vars)
+
+
+def _parse_build_file(build_file_content: str | bytes, filepath: str) -> ast.Module:
+    try:
+        return ast.parse(build_file_content, filepath)
+    except SyntaxError as e:
+        raise BuildFileSyntaxError.from_syntax_error(e).with_traceback(e.__traceback__)
+
+
+def _warn_on_non_constant_env_vars(filepath: str, linenos: Iterable[int]) -> None:
+    for lineno in linenos:
+        logger.warning(
+            f"{filepath}:{lineno}: Only constant string values as variable name to "
+            f"`env()` is currently supported. This `env()` call will always result in "
+            "the default value only."
+        )
+
+
+@dataclass(frozen=True)
+class CompiledBuildFile:
+    """A compiled BUILD file, along with the facts that we derive from its source."""
+
+    code: CodeType
+    referenced_env_vars: tuple[str, ...]
+    non_constant_env_var_linenos: tuple[int, ...]
+    import_lineno: int | None
+
+    @classmethod
+    def create(cls, filepath: str, build_file_content: str) -> CompiledBuildFile:
+        # The source is only parsed once: the resulting AST is both analyzed and compiled.
+        tree = _parse_build_file(build_file_content, filepath)
+        analysis = BuildFileAnalyzer.analyze(tree, filepath)
+        return cls(
+            code=compile(tree, filepath, "exec", dont_inherit=True),
+            referenced_env_vars=tuple(sorted(analysis.env_vars)),
+            non_constant_env_var_linenos=tuple(analysis.non_constant_env_var_linenos),
+            import_lineno=min(analysis.import_linenos, default=None),
+        )
+
+    def for_filepath(self, filepath: str) -> CompiledBuildFile:
+        """Return this compiled BUILD file as if it had been compiled from the given path.
+
+        BUILD files with identical content share a cache entry, but the filename embedded in their
+        code objects is what tracebacks and error messages report.
+        """
+        if self.code.co_filename == filepath:
+            return self
+        return dataclasses.replace(self, code=_replace_code_filename(self.code, filepath))
+
+    def warn_on_non_constant_env_vars(self, filepath: str) -> None:
+        _warn_on_non_constant_env_vars(filepath, self.non_constant_env_var_linenos)
+
+    def error_on_imports(self, filepath: str) -> None:
+        # This is poor sandboxing; there are many ways to get around this. But it's sufficient to
+        # tell users who aren't malicious that they're doing something wrong, and it has a low
+        # performance overhead.
+        if self.import_lineno is not None:
+            raise _import_error(filepath, self.import_lineno)
+
+
+def _replace_code_filename(code: CodeType, filepath: str) -> CodeType:
+    return code.replace(
+        co_filename=filepath,
+        co_consts=tuple(
+            _replace_code_filename(const, filepath) if isinstance(const, CodeType) else const
+            for const in code.co_consts
+        ),
+    )
+
+
+_PRUNED_MARKER = ".pruned"
+_PRUNE_INTERVAL_SECONDS = 24 * 60 * 60
+
+
+def _maybe_prune_persisted_entries(
+    directory: str, max_age_days: float, now: float, *, skip: Container[str] = ()
+) -> None:
+    """Delete the files under `directory` which have not been used in `max_age_days`.
+
+    This happens at most once a day: the time of the last pruning is recorded by the mtime of a
+    marker file in the directory. Subdirectories of `directory` named in `skip` are left alone.
+    """
+    marker = os.path.join(directory, _PRUNED_MARKER)
+    try:
+        if os.stat(marker).st_mtime > now - _PRUNE_INTERVAL_SECONDS:
+            return
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return
+    cutoff = now - max_age_days * 24 * 60 * 60
+    for root, dirs, files in os.walk(directory):
+        if root == directory:
+            dirs[:] = [name for name in dirs if name not in skip]
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                if os.stat(path).st_mtime < cutoff:
+                    os.unlink(path)
+            except OSError:
+                continue
+    try:
+        safe_mkdir_for(marker)
+        with open(marker, "w"):
+            pass
+        os.utime(marker, (now, now))
+    except OSError as e:
+        logger.debug(f"Failed to record the pruning of {directory}: {e}")
+
+
+def _touch(path: str, now: float) -> None:
+    try:
+        os.utime(path, (now, now))
+    except OSError:
+        pass
+
+
+class CompiledBuildFileCache:
+    """Caches compiled BUILD files by the hash of their content.
+
+    Entries are kept in memory (evicting the least recently used beyond `max_entries`), and if a
+    `persist_dir` is given, they are also written to disk so that later runs need not parse the
+    BUILD file again. Code objects are persisted with `marshal`, which is specific to the Python
+    version, so entries are stored under a version-specific subdirectory.
+
+    Persisted entries are touched when they are read, and entries (for any Python version) which
+    have not been used in `max_age_days` are pruned when an entry is persisted, at most once a day.
+    """
+
+    _FORMAT_VERSION = 2
+
+    def __init__(
+        self,
+        persist_dir: str | None = None,
+        max_entries: int = 10000,
+        *,
+        max_age_days: float = 30,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._persist_dir = (
+            os.path.join(persist_dir, sys.implementation.cache_tag) if persist_dir else None
+        )
+        self._max_entries = max_entries
+        self._max_age_days = max_age_days
+        self._clock = clock
+        self._entries: OrderedDict[str, CompiledBuildFile] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, filepath: str, build_file_content: str) -> CompiledBuildFile:
+        key = hashlib.sha256(build_file_content.encode()).hexdigest()
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                return compiled.for_filepath(filepath)
+
+        compiled = self._load(key)
+        if compiled is None:
+            compiled = CompiledBuildFile.create(filepath, build_file_content)
+            self._persist(key, compiled)
+
+        with self._lock:
+            self._entries[key] = compiled
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return compiled.for_filepath(filepath)
+
+    def _path(self, key: str) -> str | None:
+        if self._persist_dir is None:
+            return None
+        return os.path.join(self._persist_dir, key[:2], key)
+
+    def _load(self, key: str) -> CompiledBuildFile | None:
+        path = self._path(key)
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                version, *fields = marshal.load(f)
+            if version != self._FORMAT_VERSION:
+                return None
+            code, referenced_env_vars, non_constant_env_var_linenos, import_lineno = fields
+            compiled = CompiledBuildFile(
+                code, referenced_env_vars, non_constant_env_var_linenos, import_lineno
+            )
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable compiled BUILD file cache entry {path}: {e}")
+            return None
+        _touch(path, self._clock())
+        return compiled
+
+    def _persist(self, key: str, compiled: CompiledBuildFile) -> None:
+        path = self._path(key)
+        if path is None or self._persist_dir is None:
+            return
+        # The parsed address families are persisted alongside, and prune themselves.
+        _maybe_prune_persisted_entries(
+            os.path.dirname(self._persist_dir),
+            self._max_age_days,
+            self._clock(),
+            skip={ParsedAddressFamilyCache.SUBDIR},
+        )
+        payload = (
+            self._FORMAT_VERSION,
+            compiled.code,
+            compiled.referenced_env_vars,
+            compiled.non_constant_env_var_linenos,
+            compiled.import_lineno,
+        )
+        # Write to a temporary file and rename, so that concurrent readers never observe a
+        # partially written entry.
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            safe_mkdir_for(path)
+            with open(tmp_path, "wb") as f:
+                marshal.dump(payload, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Failed to persist compiled BUILD file cache entry {path}: {e}")
+
+
+class ParsedAddressFamilyCache:
+    """Persists the results of parsing the BUILD files of a directory across runs.
+
+    Entries are keyed by a fingerprint of everything that parsing depends on: the Parser's symbols
+    and the code that defines them, the preludes, the content of the BUILD files, the values of the
+    environment variables that they read, and the state that the directory inherits from its
+    parent. So an entry is only ever reused when parsing would have produced the same result, and
+    entries for stale content are simply never looked up again. Results are persisted with
+    `pickle`, and results that can't be pickled are not persisted.
+
+    Entries are touched when they are read, and entries (for any Python version) which have not
+    been used in `max_age_days` are pruned when an entry is persisted, at most once a day.
+    """
+
+    SUBDIR = "address_families"
+    _FORMAT_VERSION = 1
+
+    def __init__(
+        self,
+        persist_dir: str,
+        fingerprint: str,
+        *,
+        max_age_days: float = 30,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._persist_dir = os.path.join(persist_dir, self.SUBDIR, sys.implementation.cache_tag)
+        self._fingerprint = fingerprint
+        self._max_age_days = max_age_days
+        self._clock = clock
+
+    def key(self, *parts: str | bytes) -> str:
+        hasher = hashlib.sha256()
+        for part in (str(self._FORMAT_VERSION), self._fingerprint, *parts):
+            data = part.encode() if isinstance(part, str) else part
+            # Length-prefixed, so that different sequences of parts never hash the same.
+            hasher.update(len(data).to_bytes(8, "big"))
+            hasher.update(data)
+        return hasher.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._persist_dir, key[:2], key)
+
+    def get(self, key: str) -> Any | None:
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError) as e:
+            logger.debug(f"Ignoring unreadable parsed BUILD file cache entry {path}: {e}")
+            return None
+        _touch(path, self._clock())
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        path = self._path(key)
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            logger.debug(f"Not persisting parsed BUILD files which can't be pickled: {e}")
+            return
+        _maybe_prune_persisted_entries(
+            os.path.dirname(self._persist_dir), self._max_age_days, self._clock()
+        )
+        # Write to a temporary file and rename, so that concurrent readers never observe a
+        # partially written entry.
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            safe_mkdir_for(path)
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Failed to persist parsed BUILD file cache entry {path}: {e}")
+
+
+def _symbols_fingerprint(
+    build_root: str,
+    ignore_unrecognized_symbols: bool,
+    registered_target_types: RegisteredTargetTypes,
+    union_membership: UnionMembership,
+    object_aliases: BuildFileAliases,
+) -> str:
+    """Fingerprint the symbols that a Parser exposes, along with the source of their modules.
+
+    Plugins may change without the Pants version changing, so the source of every module which
+    defines a target type, field, or BUILD file alias is part of the fingerprint.
+    """
+
+    def describe(value: Any) -> str:
+        module = getattr(value, "__module__", None) or type(value).__module__
+        qualname = getattr(value, "__qualname__", None) or type(value).__qualname__
+        modules.add(module)
+        return f"{module}.{qualname}"
+
+    modules: set[str] = set()
+    lines = [repr((VERSION, build_root, ignore_unrecognized_symbols))]
+    for alias, target_type in sorted(registered_target_types.aliases_to_types.items()):
+        field_types = sorted(map(describe, target_type.class_field_types(union_membership)))
+        lines.append(f"{alias}={describe(target_type)}({', '.join(field_types)})")
+    aliases = {**object_aliases.objects, **object_aliases.context_aware_object_factories}
+    for alias, value in sorted(aliases.items()):
+        lines.append(f"{alias}={describe(value)}")
+
+    hasher = hashlib.sha256("\n".join(lines).encode())
+    for module_name in sorted(modules):
+        source = getattr(sys.modules.get(module_name), "__file__", None)
+        if not source:
+            continue
+        try:
+            with open(source, "rb") as f:
+                hasher.update(hashlib.sha256(f.read()).digest())
+        except OSError:
+            pass
+    return hasher.hexdigest()
+
+
 class Parser:
     def __init__(
         self,
@@ -315,6 +756,7 @@ class Parser:
         union_membership: UnionMembership,
         object_aliases: BuildFileAliases,
         ignore_unrecognized_symbols: bool,
+        build_file_cache_dir: str | None = None,
     ) -> None:
         self._symbols_info, self._parse_state = self._generate_symbols(
             build_root,
@@ -323,6 +765,21 @@ class Parser:
             union_membership,
         )
         self.ignore_unrecognized_symbols = ignore_unrecognized_symbols
+        self._compiled_build_files = CompiledBuildFileCache(build_file_cache_dir)
+        self._parsed_address_families = (
+            ParsedAddressFamilyCache(
+                build_file_cache_dir,
+                _symbols_fingerprint(
+                    build_root,
+                    ignore_unrecognized_symbols,
+                    registered_target_types,
+                    union_membership,
+                    object_aliases,
+                ),
+            )
+            if build_file_cache_dir
+            else None
+        )
 
     @staticmethod
     def _generate_symbols(
@@ -374,6 +831,15 @@ class Parser:
     def symbols(self) -> FrozenDict[str, Any]:
         return self._symbols_info.symbols
 
+    @property
+    def parsed_address_families(self) -> ParsedAddressFamilyCache | None:
+        """The persistent cache of parsed BUILD files, if `build_file_cache_dir` is set."""
+        return self._parsed_address_families
+
+    def compile(self, filepath: str, build_file_content: str) -> CompiledBuildFile:
+        """Compile the BUILD file, reusing a previous result for identical content."""
+        return self._compiled_build_files.get(filepath, build_file_content)
+
     def parse(
         self,
         filepath: str,
@@ -398,13 +864,13 @@ class Parser:
             **self.symbols,
             **extra_symbols.symbols,
         }
+        compiled = self.compile(filepath, build_file_content)
 
         if self.ignore_unrecognized_symbols:
             defined_symbols = set()
             while True:
                 try:
-                    code = compile(build_file_content, filepath, "exec", dont_inherit=True)
-                    exec(code, global_symbols)
+                    exec(compiled.code, global_symbols)
                 except NameError as e:
                     bad_symbol = _extract_symbol_from_name_error(e)
                     if bad_symbol in defined_symbols:
@@ -426,12 +892,11 @@ class Parser:
                     continue
                 break
 
-            error_on_imports(build_file_content, filepath)
+            compiled.error_on_imports(filepath)
             return self._parse_state.parsed_targets()
 
         try:
-            code = compile(build_file_content, filepath, "exec", dont_inherit=True)
-            exec(code, global_symbols)
+            exec(compiled.code, global_symbols)
         except NameError as e:
             frame = traceback.extract_tb(e.__traceback__, limit=-1)[0]
             msg = (  # Capitalise first letter of NameError message.
@@ -459,28 +924,17 @@ class Parser:
                 f"{original}.\n\n{help_str}\n\nAll registered symbols: {valid_symbols}"
             )
 
-        error_on_imports(build_file_content, filepath)
+        compiled.error_on_imports(filepath)
         return self._parse_state.parsed_targets()
 
 
-def error_on_imports(build_file_content: str, filepath: str) -> None:
-    # This is poor sandboxing; there are many ways to get around this. But it's sufficient to tell
-    # users who aren't malicious that they're doing something wrong, and it has a low performance
-    # overhead.
-    if "import" not in build_file_content:
-        return
-    io_wrapped_python = StringIO(build_file_content)
-    for token in tokenize.generate_tokens(io_wrapped_python.readline):
-        token_str = token[1]
-        lineno, _ = token[2]
-        if token_str != "import":
-            continue
-        raise ParseError(
-            f"Import used in {filepath} at line {lineno}. Import statements are banned in "
-            "BUILD files and macros (that act like a normal BUILD file) because they can easily "
-            "break Pants caching and lead to stale results. "
-            f"\n\nInstead, consider writing a plugin ({doc_url('docs/writing-plugins/overview')})."
-        )
+def _import_error(filepath: str, lineno: int) -> ParseError:
+    return ParseError(
+        f"Import used in {filepath} at line {lineno}. Import statements are banned in "
+        "BUILD files and macros (that act like a normal BUILD file) because they can easily "
+        "break Pants caching and lead to stale results. "
+        f"\n\nInstead, consider writing a plugin ({doc_url('docs/writing-plugins/overview')})."
+    )
 
 
 def _extract_symbol_from_name_error(err: NameError) -> str:
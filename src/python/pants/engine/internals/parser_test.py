@@ -3,7 +3,9 @@
 
 from __future__ import annotations
 
+import os
 import re
+import sys
 from textwrap import dedent
 from typing import Any
 
@@ -14,12 +16,16 @@ from pants.core.target_types import GenericTarget
 from pants.engine.addresses import Address
 from pants.engine.env_vars import EnvironmentVars
 from pants.engine.internals.defaults import BuildFileDefaults, BuildFileDefaultsParserState
+from pants.engine.internals.mapper import AddressMap
 from pants.engine.internals.parser import (
     BuildFilePreludeSymbols,
+    CompiledBuildFileCache,
+    ParsedAddressFamilyCache,
     ParseError,
     Parser,
     _extract_symbol_from_name_error,
 )
+from pants.engine.internals.target_adaptor import TargetAdaptor
 from pants.engine.target import InvalidFieldException, RegisteredTargetTypes, StringField
 from pants.engine.unions import UnionMembership
 from pants.testutil.pytest_util import no_exception
@@ -255,3 +261,104 @@ def test_unrecognized_symbol_in_prelude(
         'build_file_dir', 'caof', 'env', 'macro', 'obj']
         """
     )
+
+
+def test_compiled_build_file_cache(tmp_path) -> None:
+    content = dedent(
+        """\
+        tgt(description=env("DESCRIPTION"), tags=[env(NOT_CONSTANT)])
+        """
+    )
+    cache = CompiledBuildFileCache(str(tmp_path))
+    compiled = cache.get("a/BUILD", content)
+    assert compiled.code.co_filename == "a/BUILD"
+    assert compiled.referenced_env_vars == ("DESCRIPTION",)
+    assert compiled.non_constant_env_var_linenos == (1,)
+    assert compiled.import_lineno is None
+
+    # Identical content is only compiled once, but reports the path it was requested for.
+    same_content = cache.get("b/BUILD", content)
+    assert same_content.code.co_filename == "b/BUILD"
+    assert same_content.referenced_env_vars == compiled.referenced_env_vars
+
+    # A new cache reads the persisted entry.
+    persisted = CompiledBuildFileCache(str(tmp_path)).get("c/BUILD", content)
+    assert persisted.code.co_filename == "c/BUILD"
+    assert persisted.referenced_env_vars == compiled.referenced_env_vars
+    assert persisted.non_constant_env_var_linenos == compiled.non_constant_env_var_linenos
+
+    assert cache.get("a/BUILD", "import os").import_lineno == 1
+
+
+def test_compiled_build_file_cache_pruning(tmp_path) -> None:
+    day = 24 * 60 * 60
+    now = 100 * day
+    CompiledBuildFileCache(str(tmp_path), clock=lambda: now).get("a/BUILD", "tgt(name='a')")
+    (stale_entry,) = (tmp_path / sys.implementation.cache_tag).glob("*/*")
+    os.utime(stale_entry, (now - 40 * day, now - 40 * day))
+    other_version_entry = tmp_path / "cpython-00" / "ab" / "abc"
+    other_version_entry.parent.mkdir(parents=True)
+    other_version_entry.write_bytes(b"")
+    os.utime(other_version_entry, (now - 40 * day, now - 40 * day))
+    address_family_entry = tmp_path / ParsedAddressFamilyCache.SUBDIR / "ab" / "abc"
+    address_family_entry.parent.mkdir(parents=True)
+    address_family_entry.write_bytes(b"")
+    os.utime(address_family_entry, (now - 40 * day, now - 40 * day))
+
+    # Pruning happens at most once a day.
+    CompiledBuildFileCache(str(tmp_path), clock=lambda: now + 1).get("b/BUILD", "tgt(name='b')")
+    assert stale_entry.exists()
+
+    # Entries which have not been used for `max_age_days` are then pruned, for any Python version,
+    # but the parsed address families are left to prune themselves.
+    cache = CompiledBuildFileCache(str(tmp_path), clock=lambda: now + 2 * day)
+    cache.get("c/BUILD", "tgt(name='c')")
+    assert not stale_entry.exists()
+    assert not other_version_entry.exists()
+    assert address_family_entry.exists()
+    assert len(list((tmp_path / sys.implementation.cache_tag).glob("*/*"))) == 2
+
+
+def test_parsed_address_family_cache(tmp_path) -> None:
+    cache = ParsedAddressFamilyCache(str(tmp_path), "fingerprint")
+    key = cache.key("a", b"content")
+    # Parts are delimited, so that different sequences of parts have different keys.
+    assert key != cache.key("ac", b"ontent")
+    assert key != ParsedAddressFamilyCache(str(tmp_path), "other").key("a", b"content")
+    assert cache.get(key) is None
+
+    address_map = AddressMap.create(
+        "a/BUILD", [TargetAdaptor("tgt", "t", "a/BUILD:1", description="hello")]
+    )
+    cache.put(key, (address_map, BuildFileDefaults({"tgt": FrozenDict({"tags": ("x",)})})))
+    # A new cache reads the persisted entry.
+    persisted_map, persisted_defaults = ParsedAddressFamilyCache(str(tmp_path), "fingerprint").get(
+        key
+    )
+    assert persisted_map == address_map
+    assert persisted_map.name_to_target_adaptor["t"].description_of_origin == "a/BUILD:1"
+    assert persisted_defaults == BuildFileDefaults({"tgt": FrozenDict({"tags": ("x",)})})
+
+    # Values which can't be pickled are not persisted.
+    unpicklable_key = cache.key("b")
+    cache.put(unpicklable_key, lambda: None)
+    assert cache.get(unpicklable_key) is None
+
+
+def test_parsed_address_family_cache_pruning(tmp_path) -> None:
+    day = 24 * 60 * 60
+    now = 100 * day
+    cache = ParsedAddressFamilyCache(str(tmp_path), "fingerprint", clock=lambda: now)
+    used_key, unused_key = cache.key("used"), cache.key("unused")
+    cache.put(used_key, "used")
+    cache.put(unused_key, "unused")
+    for path in (tmp_path / ParsedAddressFamilyCache.SUBDIR).glob("*/*/*"):
+        os.utime(path, (now - 40 * day, now - 40 * day))
+
+    # Reading an entry marks it as used.
+    later = ParsedAddressFamilyCache(str(tmp_path), "fingerprint", clock=lambda: now + 2 * day)
+    assert later.get(used_key) == "used"
+    later.put(later.key("new"), "new")
+    assert later.get(used_key) == "used"
+    assert later.get(unused_key) is None
+    assert later.get(later.key("new")) == "new"
@@ -3,17 +3,25 @@
 from __future__ import annotations
 
 import ast
+import builtins
 import inspect
 import itertools
+import json
 import logging
+import os
 import sys
+import time
 from contextlib import contextmanager
+from dataclasses import dataclass
 from functools import partial
+from hashlib import sha256
+from types import ModuleType
 from typing import Any, Callable, Iterator, List, Sequence, get_type_hints
 
 import typing_extensions
 
 from pants.base.exceptions import RuleTypeError
+from pants.engine.internals import native_engine
 from pants.engine.internals.selectors import (
     Awaitable,
     AwaitableConstraints,
@@ -21,6 +29,7 @@ from pants.engine.internals.selectors import (
     GetParseError,
     MultiGet,
 )
+from pants.util.dirutil import safe_mkdir_for
 from pants.util.memo import memoized
 from pants.util.strutil import softwrap
 from pants.util.typing import patch_forward_ref
@@ -57,11 +66,22 @@ class _TypeStack:
     def __init__(self, func: Callable) -> None:
         self._stack: list[dict[str, Any]] = []
         self.root = sys.modules[func.__module__]
+        # The global (or builtin) names looked up, and the values they resolved to.
+        self.globals_used: dict[str, Any] = {}
         self.push(self.root)
         self._push_function_closures(func)
+        self._global_depth = len(self._stack)
 
     def __getitem__(self, name: str) -> Any:
-        for ns in reversed(self._stack):
+        for ns in reversed(self._stack[self._global_depth :]):
+            if name in ns:
+                return ns[name]
+        value = self._lookup_global(name)
+        self.globals_used[name] = value
+        return value
+
+    def _lookup_global(self, name: str) -> Any:
+        for ns in reversed(self._stack[: self._global_depth]):
             if name in ns:
                 return ns[name]
         return self.root.__builtins__.get(name, None)
@@ -139,8 +159,35 @@ class _AwaitableCollector(ast.NodeVisitor):
 
         self.types = _TypeStack(func)
         self.awaitables: List[AwaitableConstraints] = []
+        self.helpers: List[_CollectedAwaitables] = []
         self.visit(ast.parse(source))
 
+    def collected(self) -> _CollectedAwaitables:
+        cacheable = (
+            not self.func.__closure__
+            and "<locals>" not in self.func.__qualname__
+            and all(helper.cacheable for helper in self.helpers)
+        )
+        sources = {self.func.__code__.co_filename}
+        lookups: set[tuple[str, str, str]] = set()
+        if cacheable:
+            try:
+                for name, value in self.types.globals_used.items():
+                    lookups.add((self.func.__module__, name, _describe(value)))
+                    sources.add(_source_file(value))
+                for awaitable in self.awaitables:
+                    sources.update(_source_file(t) for t in awaitable.input_types)
+                    sources.add(_source_file(awaitable.output_type))
+            except _Uncacheable:
+                cacheable = False
+        for helper in self.helpers:
+            sources.update(helper.sources)
+            lookups.update(helper.lookups)
+        sources.discard("")
+        return _CollectedAwaitables(
+            tuple(self.awaitables), frozenset(sources), frozenset(lookups), cacheable
+        )
+
     def _format(self, node: ast.AST, msg: str) -> str:
         lineno = node.lineno + self.func.__code__.co_firstlineno - 1
         return f"{self.source_file}:{lineno}: {msg}"
@@ -305,7 +352,9 @@ class _AwaitableCollector(ast.NodeVisitor):
                 self.awaitables.append(self._get_byname_awaitable(rule_id, func, call_node))
             elif inspect.iscoroutinefunction(func) or _returns_awaitable(func):
                 # Is a call to a "rule helper".
-                self.awaitables.extend(collect_awaitables(func))
+                helper = _collect(func)
+                self.helpers.append(helper)
+                self.awaitables.extend(helper.awaitables)
 
         self.generic_visit(call_node)
 
@@ -380,6 +429,245 @@ class _AwaitableCollector(ast.NodeVisitor):
                 )
 
 
+@dataclass(frozen=True)
+class _CollectedAwaitables:
+    awaitables: tuple[AwaitableConstraints, ...]
+    # What the awaitables were collected from, including by helpers, for `AwaitablesCache`: the
+    # source files read, and the global names looked up in each module with `_describe` of their
+    # value.
+    sources: frozenset[str]
+    lookups: frozenset[tuple[str, str, str]]
+    # False if the awaitables depend on something that can't be described, e.g. a closure.
+    cacheable: bool
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+_MISSING = object()
+
+
+def _resolve(ref: str) -> Any:
+    """Look up a `_ref` in the modules that have been imported, or return `_MISSING`."""
+    module_name, _, qualname = ref.partition(":")
+    obj = sys.modules.get(module_name, _MISSING)
+    for attr in qualname.split(".") if qualname else ():
+        obj = getattr(obj, attr, _MISSING)
+    return obj
+
+
+def _ref(obj: Any) -> str:
+    """A reference to a module, class or function, by which `_resolve` finds it again."""
+    if isinstance(obj, ModuleType):
+        return obj.__name__
+    module = getattr(obj, "__module__", None)
+    qualname = getattr(obj, "__qualname__", None)
+    if isinstance(module, str) and isinstance(qualname, str):
+        ref = f"{module}:{qualname}"
+        if _resolve(ref) is obj:
+            return ref
+    raise _Uncacheable()
+
+
+def _describe(value: Any) -> str:
+    """Describe the value of a global name, to detect that it has changed since it was looked up.
+
+    Other values than modules, classes and functions are only described by their type.
+    """
+    if value is None:
+        return ""
+    try:
+        return _ref(value)
+    except _Uncacheable:
+        return f"{_ref(type(value))}()"
+
+
+def _source_file(value: Any) -> str:
+    """The source file of the module defining the given value, or of its type."""
+    if not isinstance(value, ModuleType):
+        module_name = getattr(value, "__module__", None)
+        if not isinstance(module_name, str):
+            module_name = type(value).__module__
+        value = sys.modules.get(module_name)
+    return getattr(value, "__file__", None) or ""
+
+
+@memoized
+def _file_digest(path: str) -> str:
+    try:
+        with open(path, "rb") as f:
+            return sha256(f.read()).hexdigest()
+    except OSError:
+        return ""
+
+
+class AwaitablesCache:
+    """A persistent cache of the awaitables collected from each rule and rule helper.
+
+    Collecting them means parsing the source of every rule as it is declared, which adds up across
+    all of the rules of the enabled backends. An entry is keyed by the source file and qualified
+    name of its function, and is only used if none of the source files it was collected from have
+    changed since, and if the global names that were looked up still refer to the same things.
+
+    Entries are also keyed by the path of the source file, so each install of Pants (and each
+    Python version) has its own entries. Entries are touched when they are read, and those which
+    have not been used in `max_age_days` are pruned when the cache is written to, at most once a
+    day: the time of the last pruning is recorded by the mtime of a marker file in the directory.
+    """
+
+    _PRUNED_MARKER = ".pruned"
+    _PRUNE_INTERVAL_SECONDS = 24 * 60 * 60
+
+    def __init__(
+        self, directory: str, *, max_age_days: float = 30, clock: Callable[[], float] = time.time
+    ) -> None:
+        self._directory = directory
+        self._max_age_seconds = max_age_days * 24 * 60 * 60
+        self._clock = clock
+
+    def _path(self, func: Callable) -> str:
+        key = sha256(
+            "\0".join(
+                (
+                    _file_digest(__file__),
+                    sys.version,
+                    func.__code__.co_filename,
+                    func.__qualname__,
+                )
+            ).encode()
+        ).hexdigest()
+        return os.path.join(self._directory, key[:2], f"{key}.json")
+
+    def get(self, func: Callable) -> _CollectedAwaitables | None:
+        path = self._path(func)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable rule awaitables cache entry `{path}`: {e}")
+            return None
+
+        try:
+            sources: dict[str, str] = entry["sources"]
+            if any(_file_digest(source) != digest for source, digest in sources.items()):
+                return None
+            lookups = frozenset(tuple(lookup) for lookup in entry["lookups"])
+            for module_name, name, description in lookups:
+                namespace = vars(sys.modules[module_name])
+                value = namespace[name] if name in namespace else vars(builtins).get(name)
+                if _describe(value) != description:
+                    return None
+
+            def resolve(ref: str) -> Any:
+                obj = _resolve(ref)
+                if obj is _MISSING:
+                    raise _Uncacheable()
+                return obj
+
+            awaitables = tuple(
+                AwaitableConstraints(
+                    rule_id,
+                    resolve(output_type),
+                    explicit_args_arity,
+                    tuple(resolve(input_type) for input_type in input_types),
+                    is_effect,
+                )
+                for rule_id, output_type, explicit_args_arity, input_types, is_effect in entry[
+                    "awaitables"
+                ]
+            )
+        except (KeyError, TypeError, ValueError, _Uncacheable):
+            return None
+        try:
+            now = self._clock()
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        return _CollectedAwaitables(awaitables, frozenset(sources), lookups, cacheable=True)
+
+    def put(self, func: Callable, collected: _CollectedAwaitables) -> None:
+        if not collected.cacheable:
+            return
+        try:
+            entry = {
+                "sources": {source: _file_digest(source) for source in sorted(collected.sources)},
+                "lookups": sorted(collected.lookups),
+                "awaitables": [
+                    [
+                        awaitable.rule_id,
+                        _ref(awaitable.output_type),
+                        awaitable.explicit_args_arity,
+                        [_ref(input_type) for input_type in awaitable.input_types],
+                        awaitable.is_effect,
+                    ]
+                    for awaitable in collected.awaitables
+                ],
+            }
+        except _Uncacheable:
+            return
+        self._maybe_prune()
+        path = self._path(func)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            safe_mkdir_for(path)
+            with open(tmp_path, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Failed to write to the rule awaitables cache `{self._directory}`: {e}")
+
+    def _maybe_prune(self) -> None:
+        now = self._clock()
+        marker = os.path.join(self._directory, self._PRUNED_MARKER)
+        try:
+            if os.stat(marker).st_mtime > now - self._PRUNE_INTERVAL_SECONDS:
+                return
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return
+        cutoff = now - self._max_age_seconds
+        for root, _, files in os.walk(self._directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    if os.stat(path).st_mtime < cutoff:
+                        os.unlink(path)
+                except OSError:
+                    continue
+        try:
+            safe_mkdir_for(marker)
+            with open(marker, "w"):
+                pass
+            os.utime(marker, (now, now))
+        except OSError as e:
+            logger.debug(f"Failed to record the pruning of the rule awaitables cache: {e}")
+
+
+@memoized
+def _awaitables_cache() -> AwaitablesCache | None:
+    # NB: Rules are declared as their modules are imported, before options are parsed, so this is
+    # configured by the environment alone. Set to the empty string to disable the cache.
+    directory = os.environ.get("PANTS_RULE_AWAITABLES_CACHE_DIR")
+    if directory is None:
+        directory = os.path.join(native_engine.default_cache_path(), "rule_awaitables")
+    return AwaitablesCache(directory) if directory else None
+
+
+@memoized
+def _collect(func: Callable) -> _CollectedAwaitables:
+    cache = _awaitables_cache()
+    collected = cache.get(func) if cache else None
+    if collected is None:
+        collected = _AwaitableCollector(func).collected()
+        if cache:
+            cache.put(func, collected)
+    return collected
+
+
 @memoized
 def collect_awaitables(func: Callable) -> List[AwaitableConstraints]:
-    return _AwaitableCollector(func).awaitables
+    return list(_collect(func).awaitables)
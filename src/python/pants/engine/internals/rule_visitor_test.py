@@ -3,13 +3,20 @@
 
 from __future__ import annotations
 
+import os
+import sys
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Iterable
 
 import pytest
 
 from pants.base.exceptions import RuleTypeError
-from pants.engine.internals.rule_visitor import collect_awaitables
+from pants.engine.internals.rule_visitor import (
+    AwaitablesCache,
+    _AwaitableCollector,
+    collect_awaitables,
+)
 from pants.engine.internals.selectors import Get, GetParseError, MultiGet
 from pants.engine.rules import implicitly, rule
 from pants.util.strutil import softwrap
@@ -335,3 +342,45 @@ def test_union_types() -> None:
         Get(str, mc.b)
 
     assert_awaitables(somerule, [(str, bool)])
+
+
+def test_awaitables_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = AwaitablesCache(str(tmp_path))
+    collected = _AwaitableCollector(_top_helper).collected()
+    assert collected.cacheable
+    assert cache.get(_top_helper) is None
+
+    cache.put(_top_helper, collected)
+    assert cache.get(_top_helper) == collected
+
+    # A global name used by the helper of `_top_helper` now refers to something else.
+    monkeypatch.setattr(sys.modules[__name__], "STR", bytes)
+    assert cache.get(_top_helper) is None
+
+
+def test_awaitables_cache_pruning(tmp_path: Path) -> None:
+    day = 24 * 60 * 60
+    now = 100 * day
+    collected = _AwaitableCollector(_top_helper).collected()
+    AwaitablesCache(str(tmp_path), clock=lambda: now).put(_top_helper, collected)
+    (entry,) = tmp_path.glob("*/*.json")
+    stale_entry = tmp_path / "ab" / "stale.json"
+    stale_entry.parent.mkdir(exist_ok=True)
+    stale_entry.write_text("{}")
+    for path in (entry, stale_entry):
+        os.utime(path, (now - 40 * day, now - 40 * day))
+
+    # Reading an entry marks it as used, and entries which have not been used for `max_age_days`
+    # are pruned when the cache is next written to, at most once a day.
+    cache = AwaitablesCache(str(tmp_path), clock=lambda: now + 2 * day)
+    assert cache.get(_top_helper) == collected
+    cache.put(_helper_helper, _AwaitableCollector(_helper_helper).collected())
+    assert entry.exists()
+    assert not stale_entry.exists()
+
+
+def test_awaitables_cache_closure() -> None:
+    async def rule():
+        await Get(STR, INT, 42)
+
+    assert not _AwaitableCollector(rule).collected().cacheable
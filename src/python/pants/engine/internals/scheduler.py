@@ -105,6 +105,49 @@ class ExecutionTimeoutError(ExecutionError):
     """An ExecutionRequest specified a timeout which elapsed before the request completed."""
 
 
+def _remoting_options(execution_options: ExecutionOptions) -> PyRemotingOptions:
+    return PyRemotingOptions(
+        provider=execution_options.remote_provider.value,
+        execution_enable=execution_options.remote_execution,
+        store_headers=execution_options.remote_store_headers,
+        store_chunk_bytes=execution_options.remote_store_chunk_bytes,
+        store_rpc_retries=execution_options.remote_store_rpc_retries,
+        store_rpc_concurrency=execution_options.remote_store_rpc_concurrency,
+        store_rpc_timeout_millis=execution_options.remote_store_rpc_timeout_millis,
+        store_batch_api_size_limit=execution_options.remote_store_batch_api_size_limit,
+        cache_warnings_behavior=execution_options.remote_cache_warnings.value,
+        cache_content_behavior=execution_options.cache_content_behavior.value,
+        cache_rpc_concurrency=execution_options.remote_cache_rpc_concurrency,
+        cache_rpc_timeout_millis=execution_options.remote_cache_rpc_timeout_millis,
+        execution_headers=execution_options.remote_execution_headers,
+        execution_overall_deadline_secs=execution_options.remote_execution_overall_deadline_secs,
+        execution_rpc_concurrency=execution_options.remote_execution_rpc_concurrency,
+        store_address=execution_options.remote_store_address,
+        execution_address=execution_options.remote_execution_address,
+        execution_process_cache_namespace=execution_options.process_execution_cache_namespace,
+        instance_name=execution_options.remote_instance_name,
+        root_ca_certs_path=execution_options.remote_ca_certs_path,
+        client_certs_path=execution_options.remote_client_certs_path,
+        client_key_path=execution_options.remote_client_key_path,
+        append_only_caches_base_path=execution_options.remote_execution_append_only_caches_base_path,
+    )
+
+
+def _exec_strategy_options(execution_options: ExecutionOptions) -> PyExecutionStrategyOptions:
+    return PyExecutionStrategyOptions(
+        local_cache=execution_options.local_cache,
+        remote_cache_read=execution_options.remote_cache_read,
+        remote_cache_write=execution_options.remote_cache_write,
+        local_keep_sandboxes=execution_options.keep_sandboxes.value,
+        local_parallelism=execution_options.process_execution_local_parallelism,
+        local_enable_nailgun=execution_options.process_execution_local_enable_nailgun,
+        remote_parallelism=execution_options.process_execution_remote_parallelism,
+        child_max_memory=execution_options.process_total_child_memory_usage or 0,
+        child_default_memory=execution_options.process_per_child_memory_usage,
+        graceful_shutdown_timeout=execution_options.process_execution_graceful_shutdown_timeout,
+    )
+
+
 class Scheduler:
     def __init__(
         self,
@@ -177,31 +220,6 @@ class Scheduler:
             parsed_python_deps_result=NativeParsedPythonDependencies,
             parsed_javascript_deps_result=NativeParsedJavascriptDependencies,
         )
-        remoting_options = PyRemotingOptions(
-            provider=execution_options.remote_provider.value,
-            execution_enable=execution_options.remote_execution,
-            store_headers=execution_options.remote_store_headers,
-            store_chunk_bytes=execution_options.remote_store_chunk_bytes,
-            store_rpc_retries=execution_options.remote_store_rpc_retries,
-            store_rpc_concurrency=execution_options.remote_store_rpc_concurrency,
-            store_rpc_timeout_millis=execution_options.remote_store_rpc_timeout_millis,
-            store_batch_api_size_limit=execution_options.remote_store_batch_api_size_limit,
-            cache_warnings_behavior=execution_options.remote_cache_warnings.value,
-            cache_content_behavior=execution_options.cache_content_behavior.value,
-            cache_rpc_concurrency=execution_options.remote_cache_rpc_concurrency,
-            cache_rpc_timeout_millis=execution_options.remote_cache_rpc_timeout_millis,
-            execution_headers=execution_options.remote_execution_headers,
-            execution_overall_deadline_secs=execution_options.remote_execution_overall_deadline_secs,
-            execution_rpc_concurrency=execution_options.remote_execution_rpc_concurrency,
-            store_address=execution_options.remote_store_address,
-            execution_address=execution_options.remote_execution_address,
-            execution_process_cache_namespace=execution_options.process_execution_cache_namespace,
-            instance_name=execution_options.remote_instance_name,
-            root_ca_certs_path=execution_options.remote_ca_certs_path,
-            client_certs_path=execution_options.remote_client_certs_path,
-            client_key_path=execution_options.remote_client_key_path,
-            append_only_caches_base_path=execution_options.remote_execution_append_only_caches_base_path,
-        )
         py_local_store_options = PyLocalStoreOptions(
             store_dir=local_store_options.store_dir,
             process_cache_max_size_bytes=local_store_options.processes_max_size_bytes,
@@ -210,19 +228,6 @@ class Scheduler:
             lease_time_millis=LOCAL_STORE_LEASE_TIME_SECS * 1000,
             shard_count=local_store_options.shard_count,
         )
-        exec_strategy_opts = PyExecutionStrategyOptions(
-            local_cache=execution_options.local_cache,
-            remote_cache_read=execution_options.remote_cache_read,
-            remote_cache_write=execution_options.remote_cache_write,
-            local_keep_sandboxes=execution_options.keep_sandboxes.value,
-            local_parallelism=execution_options.process_execution_local_parallelism,
-            local_enable_nailgun=execution_options.process_execution_local_enable_nailgun,
-            remote_parallelism=execution_options.process_execution_remote_parallelism,
-            child_max_memory=execution_options.process_total_child_memory_usage or 0,
-            child_default_memory=execution_options.process_per_child_memory_usage,
-            graceful_shutdown_timeout=execution_options.process_execution_graceful_shutdown_timeout,
-        )
-
         self._py_executor = executor
         self._py_scheduler = native_engine.scheduler_create(
             executor,
@@ -234,9 +239,9 @@ class Scheduler:
             ignore_patterns,
             use_gitignore,
             watch_filesystem,
-            remoting_options,
+            _remoting_options(execution_options),
             py_local_store_options,
-            exec_strategy_opts,
+            _exec_strategy_options(execution_options),
             ca_certs_path,
         )
 
@@ -301,6 +306,21 @@ class Scheduler:
     def invalidate_all(self) -> None:
         native_engine.graph_invalidate_all(self.py_scheduler)
 
+    def evict_all(self) -> None:
+        native_engine.graph_evict_all(self.py_scheduler)
+
+    def update_remoting(self, execution_options: ExecutionOptions) -> None:
+        """Reconnect the remote store and process execution with the given options.
+
+        Unlike creating a new Scheduler, this keeps the graph, and so all memoized work. It should
+        only be called between runs.
+        """
+        native_engine.scheduler_update_remoting(
+            self.py_scheduler,
+            _remoting_options(execution_options),
+            _exec_strategy_options(execution_options),
+        )
+
     def check_invalidation_watcher_liveness(self) -> None:
         native_engine.check_invalidation_watcher_liveness(self.py_scheduler)
 
@@ -530,10 +530,13 @@ async def find_valid_field_sets_for_target_roots(
             logger.warning(str(no_applicable_exception))
 
     if request.num_shards > 0:
+        keys_in_shard = request.keys_in_shard(
+            tgt.address.spec for tgt in targets_to_applicable_field_sets
+        )
         sharded_targets_to_applicable_field_sets = {
             tgt: value
             for tgt, value in targets_to_applicable_field_sets.items()
-            if request.is_in_shard(tgt.address.spec)
+            if tgt.address.spec in keys_in_shard
         }
         return TargetRootsToFieldSets(sharded_targets_to_applicable_field_sets)
     return TargetRootsToFieldSets(targets_to_applicable_field_sets)
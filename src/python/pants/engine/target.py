@@ -1517,6 +1517,40 @@ def get_shard(key: str, num_shards: int) -> int:
     return zlib.crc32(key.encode()) % num_shards
 
 
+def assign_weighted_shards(
+    keys: Iterable[str], num_shards: int, weights: Mapping[str, float]
+) -> dict[str, int]:
+    """Assign each key to a shard, balancing the total weight of each shard.
+
+    Keys with a known weight are bin-packed longest-first onto the currently lightest shard (the
+    LPT heuristic). Keys without a known weight fall back to `get_shard`, and are counted as having
+    the median known weight so that the packing accounts for them.
+
+    The assignment only depends on the keys and weights, so as long as every shard is computed
+    from the same inputs, the shards will be disjoint and cover all keys.
+    """
+    sorted_keys = sorted(set(keys))
+    known = sorted(
+        ((weights[key], key) for key in sorted_keys if key in weights),
+        key=lambda weight_and_key: (-weight_and_key[0], weight_and_key[1]),
+    )
+    known_weights = sorted(weight for weight, _ in known)
+    default_weight = known_weights[len(known_weights) // 2] if known_weights else 1.0
+
+    assignments: dict[str, int] = {}
+    loads = [0.0] * num_shards
+    for key in sorted_keys:
+        if key not in weights:
+            shard = get_shard(key, num_shards)
+            assignments[key] = shard
+            loads[shard] += default_weight
+    for weight, key in known:
+        shard = min(range(num_shards), key=lambda i: (loads[i], i))
+        assignments[key] = shard
+        loads[shard] += weight
+    return assignments
+
+
 @dataclass(frozen=True)
 class TargetRootsToFieldSetsRequest(Generic[_FS]):
     field_set_superclass: Type[_FS]
@@ -1524,6 +1558,9 @@ class TargetRootsToFieldSetsRequest(Generic[_FS]):
     no_applicable_targets_behavior: NoApplicableTargetsBehavior
     shard: int
     num_shards: int
+    # Historical durations (in seconds) per address spec. If non-empty, shards are balanced by
+    # duration rather than by count.
+    shard_weights: FrozenDict[str, float]
 
     def __init__(
         self,
@@ -1533,16 +1570,29 @@ class TargetRootsToFieldSetsRequest(Generic[_FS]):
         no_applicable_targets_behavior: NoApplicableTargetsBehavior,
         shard: int = 0,
         num_shards: int = -1,
+        shard_weights: Mapping[str, float] = FrozenDict(),
     ) -> None:
         object.__setattr__(self, "field_set_superclass", field_set_superclass)
         object.__setattr__(self, "goal_description", goal_description)
         object.__setattr__(self, "no_applicable_targets_behavior", no_applicable_targets_behavior)
         object.__setattr__(self, "shard", shard)
         object.__setattr__(self, "num_shards", num_shards)
+        object.__setattr__(self, "shard_weights", FrozenDict(shard_weights))
 
     def is_in_shard(self, key: str) -> bool:
         return get_shard(key, self.num_shards) == self.shard
 
+    def keys_in_shard(self, keys: Iterable[str]) -> set[str]:
+        """Return the subset of `keys` which belong to this request's shard.
+
+        Unlike `is_in_shard`, this considers all keys at once, which allows balancing shards by
+        `shard_weights`.
+        """
+        if not self.shard_weights:
+            return {key for key in keys if self.is_in_shard(key)}
+        assignments = assign_weighted_shards(keys, self.num_shards, self.shard_weights)
+        return {key for key, shard in assignments.items() if shard == self.shard}
+
 
 @dataclass(frozen=True)
 class FieldSetsPerTarget(Generic[_FS]):
@@ -34,6 +34,7 @@ from pants.engine.target import (
     ListOfDictStringToStringField,
     MultipleSourcesField,
     NestedDictStringToStringField,
+    NoApplicableTargetsBehavior,
     OptionalSingleSourceField,
     OverridesField,
     ScalarField,
@@ -42,7 +43,9 @@ from pants.engine.target import (
     StringField,
     StringSequenceField,
     Target,
+    TargetRootsToFieldSetsRequest,
     ValidNumbers,
+    assign_weighted_shards,
     generate_file_based_overrides_field_help_message,
     get_shard,
     parse_shard_spec,
@@ -1528,6 +1531,45 @@ def test_get_shard() -> None:
     assert get_shard("foo/bar/4", 2) == 1
 
 
+def test_assign_weighted_shards() -> None:
+    weights = {"slow": 10.0, "medium1": 5.0, "medium2": 5.0, "fast1": 1.0, "fast2": 1.0}
+    assignments = assign_weighted_shards(weights.keys(), 2, weights)
+    loads = [0.0, 0.0]
+    for key, shard in assignments.items():
+        loads[shard] += weights[key]
+    assert loads == [11.0, 11.0]
+    assert assignments["slow"] != assignments["medium1"]
+    assert assignments["medium1"] == assignments["medium2"]
+
+    # The assignment does not depend on the order of the keys.
+    assert assign_weighted_shards(reversed(list(weights.keys())), 2, weights) == assignments
+
+    # Keys without a weight fall back to `get_shard`.
+    unknown = assign_weighted_shards(["foo/bar/1", "foo/bar/4", "slow"], 2, weights)
+    assert unknown["foo/bar/1"] == get_shard("foo/bar/1", 2)
+    assert unknown["foo/bar/4"] == get_shard("foo/bar/4", 2)
+    assert set(unknown) == {"foo/bar/1", "foo/bar/4", "slow"}
+
+
+def test_keys_in_shard() -> None:
+    keys = [f"foo/bar/{i}" for i in range(10)]
+    weights = {key: float(i) for i, key in enumerate(keys)}
+    for shard_weights in ({}, weights):
+        shards = [
+            TargetRootsToFieldSetsRequest(
+                FieldSet,
+                goal_description="test",
+                no_applicable_targets_behavior=NoApplicableTargetsBehavior.ignore,
+                shard=shard,
+                num_shards=3,
+                shard_weights=shard_weights,
+            ).keys_in_shard(keys)
+            for shard in range(3)
+        ]
+        assert set().union(*shards) == set(keys)
+        assert sum(len(shard) for shard in shards) == len(keys)
+
+
 def test_generate_file_based_overrides_field_help_message() -> None:
     # Just test the Example: part looks right
     message = generate_file_based_overrides_field_help_message(
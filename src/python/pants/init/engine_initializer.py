@@ -210,6 +210,7 @@ class EngineInitializer:
             engine_visualize_to=bootstrap_options.engine_visualize_to,
             watch_filesystem=bootstrap_options.watch_filesystem,
             is_bootstrap=is_bootstrap,
+            build_file_cache_dir=bootstrap_options.build_file_cache_dir,
         )
 
     @staticmethod
@@ -229,6 +230,7 @@ class EngineInitializer:
         engine_visualize_to: str | None = None,
         watch_filesystem: bool = True,
         is_bootstrap: bool = False,
+        build_file_cache_dir: str | None = None,
     ) -> GraphScheduler:
         build_root_path = build_root or get_buildroot()
 
@@ -246,6 +248,7 @@ class EngineInitializer:
                 union_membership=union_membership,
                 object_aliases=build_configuration.registered_aliases,
                 ignore_unrecognized_symbols=is_bootstrap,
+                build_file_cache_dir=build_file_cache_dir,
             )
 
         @rule
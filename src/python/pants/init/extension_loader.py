@@ -2,9 +2,11 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
 import importlib
+import importlib.util
 import logging
 import traceback
-from typing import Dict, List, Optional
+from types import ModuleType
+from typing import Dict, Iterable, List, Optional, Sequence
 
 from pkg_resources import Requirement, WorkingSet
 
@@ -28,11 +30,19 @@ class PluginLoadOrderError(PluginLoadingError):
     pass
 
 
+# Goals (and the flags that request them) which describe every backend, and so need them all.
+_GOALS_NEEDING_ALL_BACKENDS = frozenset(
+    ["help", "help-advanced", "help-all", "goals", "-h", "--help", "--help-advanced", "--help-all"]
+)
+
+
 def load_backends_and_plugins(
     plugins: List[str],
     working_set: WorkingSet,
     backends: List[str],
     bc_builder: Optional[BuildConfiguration.Builder] = None,
+    *,
+    lazy_args: Optional[Sequence[str]] = None,
 ) -> BuildConfiguration:
     """Load named plugins and source backends.
 
@@ -40,9 +50,11 @@ def load_backends_and_plugins(
     :param working_set: A pkg_resources.WorkingSet to load plugins from.
     :param backends: v2 backends to load.
     :param bc_builder: The BuildConfiguration (for adding aliases).
+    :param lazy_args: If set, the command line of this run, to only load the backends it needs.
+      See `load_backend`.
     """
     bc_builder = bc_builder or BuildConfiguration.Builder()
-    load_build_configuration_from_source(bc_builder, backends)
+    load_build_configuration_from_source(bc_builder, backends, lazy_args=lazy_args)
     load_plugins(bc_builder, plugins, working_set)
     register_builtin_goals(bc_builder)
     return bc_builder.create()
@@ -112,36 +124,108 @@ def load_plugins(
 
 
 def load_build_configuration_from_source(
-    build_configuration: BuildConfiguration.Builder, backends: List[str]
+    build_configuration: BuildConfiguration.Builder,
+    backends: List[str],
+    *,
+    lazy_args: Optional[Sequence[str]] = None,
 ) -> None:
     """Installs pants backend packages to provide BUILD file symbols and cli goals.
 
     :param build_configuration: The BuildConfiguration (for adding aliases).
     :param backends: An list of packages to load v2 backends from.
+    :param lazy_args: If set, the command line of this run, to only load the backends it needs.
+      See `load_backend`.
     :raises: :class:``pants.base.exceptions.BuildConfigurationError`` if there is a problem loading
       the build configuration.
     """
     # NB: Backends added here must be explicit dependencies of this module.
     backend_packages = FrozenOrderedSet(["pants.core", "pants.backend.project_info", *backends])
     for backend_package in backend_packages:
-        load_backend(build_configuration, backend_package)
+        load_backend(build_configuration, backend_package, lazy_args=lazy_args)
 
 
-def load_backend(build_configuration: BuildConfiguration.Builder, backend_package: str) -> None:
+def load_backend(
+    build_configuration: BuildConfiguration.Builder,
+    backend_package: str,
+    *,
+    lazy_args: Optional[Sequence[str]] = None,
+) -> None:
     """Installs the given backend package into the build configuration.
 
+    If `lazy_args` is set, and the backend package has a `manifest` module next to its `register`
+    module, the backend is only loaded if the command line requests one of the goals, or mentions
+    one of the subsystems, listed in the manifest. Otherwise, only the entrypoints of the manifest
+    are installed: these should be cheap to import, and provide whatever BUILD files may refer to,
+    e.g. the fields that the backend adds to target types.
+
     :param build_configuration: the BuildConfiguration to install the backend plugin into.
     :param backend_package: the package name containing the backend plugin register module that
       provides the plugin entrypoints.
+    :param lazy_args: the command line of this run, if backends should only be loaded when needed.
     :raises: :class:``pants.base.exceptions.BuildConfigurationError`` if there is a problem loading
       the build configuration.
     """
+    if lazy_args is not None:
+        manifest = _import_backend_manifest(backend_package)
+        if manifest is not None:
+            subsystems = tuple(getattr(manifest, "subsystems", ()))
+            if not is_backend_needed(getattr(manifest, "goals", ()), subsystems, lazy_args):
+                logger.debug(f"Not loading the {backend_package} backend, which is not needed.")
+                _install_entrypoints(build_configuration, backend_package, manifest)
+                build_configuration.register_deferred_scopes(subsystems)
+                return
+
     backend_module = backend_package + ".register"
     try:
         module = importlib.import_module(backend_module)
     except ImportError as ex:
         traceback.print_exc()
         raise BackendConfigurationError(f"Failed to load the {backend_module} backend: {ex!r}")
+    _install_entrypoints(build_configuration, backend_package, module)
+
+
+def is_backend_needed(goals: Iterable[str], subsystems: Iterable[str], args: Sequence[str]) -> bool:
+    """Whether the given command line may need a backend with the given goals and subsystems.
+
+    That is, if it requests one of the goals, or refers to one of the subsystems, either as a scope
+    or through a flag of the scope, or if it requests a goal which needs all backends, e.g. `help`.
+    """
+    subsystems = tuple(subsystems)
+    scopes = {*goals, *subsystems}
+    flag_prefixes = tuple(f"{subsystem}-" for subsystem in subsystems)
+    for arg in args:
+        if arg == "--":
+            break
+        if arg in _GOALS_NEEDING_ALL_BACKENDS or arg in scopes:
+            return True
+        if arg.startswith("--"):
+            flag = arg[2:].partition("=")[0]
+            if flag.startswith("no-"):
+                flag = flag[3:]
+            if flag.startswith(flag_prefixes):
+                return True
+    return False
+
+
+def _import_backend_manifest(backend_package: str) -> Optional[ModuleType]:
+    manifest_module = backend_package + ".manifest"
+    try:
+        if importlib.util.find_spec(manifest_module) is None:
+            return None
+    except ImportError:
+        # Reported when loading the backend itself.
+        return None
+    try:
+        return importlib.import_module(manifest_module)
+    except ImportError as ex:
+        traceback.print_exc()
+        raise BackendConfigurationError(f"Failed to load the {manifest_module} manifest: {ex!r}")
+
+
+def _install_entrypoints(
+    build_configuration: BuildConfiguration.Builder, backend_package: str, module: ModuleType
+) -> None:
+    backend_module = module.__name__
 
     def invoke_entrypoint(name: str):
         entrypoint = getattr(module, name, lambda: None)
@@ -41,3 +41,22 @@ def test_each_distinct_backend_loads(backend) -> None:
     """This should catch graph incompleteness errors, i.e. when a required rule is not
     registered."""
     assert_backends_load([backend])
+
+
+def test_lazy_backends() -> None:
+    config = {
+        "GLOBAL": {
+            "backend_packages": ["pants.backend.python", "pants.backend.python.lint.flake8"],
+            "lazy_backends": True,
+            "pantsd": False,
+        },
+        # Accepted, even though Flake8 is not loaded to verify it.
+        "flake8": {"args": ["--max-line-length=100"]},
+    }
+    result = run_pants(["-ldebug", "list", "src/python/pants/util:strutil"], config=config)
+    result.assert_success()
+    assert "Not loading the pants.backend.python.lint.flake8 backend" in result.stderr
+
+    result = run_pants(["-ldebug", "lint", "--help"], config=config)
+    result.assert_success()
+    assert "Not loading the pants.backend.python.lint.flake8 backend" not in result.stderr
@@ -58,11 +58,14 @@ def _initialize_build_configuration(
     backends_requirements = _collect_backends_requirements(bootstrap_options.backend_packages)
     working_set = plugin_resolver.resolve(options_bootstrapper, env, backends_requirements)
 
-    # Load plugins and backends.
+    # Load plugins and backends. Without pantsd, only the backends needed by this run are loaded
+    # if `--lazy-backends` is set, whereas pantsd loads them once for all runs.
+    lazy = bootstrap_options.lazy_backends and not bootstrap_options.pantsd
     return load_backends_and_plugins(
         bootstrap_options.plugins,
         working_set,
         bootstrap_options.backend_packages,
+        lazy_args=options_bootstrapper.args if lazy else None,
     )
 
 
@@ -94,10 +94,18 @@ class Config:
         }
         return _ConfigValues(config_source.path, toml_values, seed_values)
 
-    def verify(self, section_to_valid_options: dict[str, set[str]]):
+    def verify(
+        self,
+        section_to_valid_options: dict[str, set[str]],
+        unverified_sections: Iterable[str] = (),
+    ):
         error_log = []
         for config_values in self.values:
-            error_log.extend(config_values.get_verification_errors(section_to_valid_options))
+            error_log.extend(
+                config_values.get_verification_errors(
+                    section_to_valid_options, unverified_sections=frozenset(unverified_sections)
+                )
+            )
         if error_log:
             for error in error_log:
                 logger.error(error)
@@ -261,7 +269,11 @@ class _ConfigValues:
 
         return stringify(option_value)
 
-    def get_verification_errors(self, section_to_valid_options: dict[str, set[str]]) -> list[str]:
+    def get_verification_errors(
+        self,
+        section_to_valid_options: dict[str, set[str]],
+        unverified_sections: frozenset[str] = frozenset(),
+    ) -> list[str]:
         error_log = []
         for section, vals in self.section_to_values.items():
             if section == DEFAULT_SECTION:
@@ -269,7 +281,8 @@ class _ConfigValues:
             try:
                 valid_options_in_section = section_to_valid_options[section]
             except KeyError:
-                error_log.append(f"Invalid section [{section}] in {self.path}")
+                if section not in unverified_sections:
+                    error_log.append(f"Invalid section [{section}] in {self.path}")
             else:
                 for option in sorted(set(vals.keys()) - valid_options_in_section):
                     if option not in valid_options_in_section:
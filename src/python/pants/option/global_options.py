@@ -862,6 +862,23 @@ class BootstrapOptions:
         default=False,
         help="Re-resolve plugins, even if previously resolved.",
     )
+    lazy_backends = BoolOption(
+        advanced=True,
+        default=False,
+        help=softwrap(
+            """
+            If true, don't load the backends that the goals and flags on the command line don't
+            need, among those which publish a manifest of the goals they contribute to and the
+            subsystems they register (a `manifest.py` next to their `register.py`). BUILD files
+            can still use the fields such backends add to targets, and their config is accepted
+            but not verified.
+
+            This speeds up starting Pants without `pantsd`, e.g. in CI, for goals which only need
+            some of the enabled backends. It has no effect with `pantsd`, which loads all of the
+            backends once for every run.
+            """
+        ),
+    )
     level = LogLevelOption()
     show_log_target = BoolOption(
         default=False,
@@ -1137,7 +1154,8 @@ class BootstrapOptions:
             """
             The maximum memory usage of the pantsd process.
 
-            When the maximum memory is exceeded, the daemon will restart gracefully,
+            When the maximum memory is exceeded (even after evicting the in-memory graph once
+            `--pantsd-soft-max-memory-usage` is exceeded), the daemon will restart gracefully,
             although all previous in-memory caching will be lost. Setting too low means that
             you may miss out on some caching, whereas setting too high may over-consume
             resources and may result in the operating system killing Pantsd due to memory
@@ -1150,6 +1168,23 @@ class BootstrapOptions:
             """
         ),
     )
+    pantsd_soft_max_memory_usage = MemorySizeOption(
+        advanced=True,
+        default=None,
+        help=softwrap(
+            """
+            The memory usage of the pantsd process above which it evicts the values held by its
+            in-memory graph, rather than restarting.
+
+            Evicting keeps the daemon, its file watching, and its connections running, and only
+            the work needed by later runs is redone: this is usually much cheaper than a restart.
+            The daemon still restarts if it remains above `--pantsd-max-memory-usage` after
+            evicting.
+
+            If unset, this is the same as `--pantsd-max-memory-usage`. Accepts the same units.
+            """
+        ),
+    )
 
     # These facilitate configuring the native engine.
     print_stacktrace = BoolOption(
@@ -1315,6 +1350,26 @@ class BootstrapOptions:
         default=tempfile.gettempdir(),
         default_help_repr="<tmp_dir>",
     )
+    build_file_cache_dir = StrOption(
+        advanced=True,
+        default=None,
+        help=softwrap(
+            f"""
+            If set, a directory in which to persist compiled BUILD files, along with the facts
+            Pants derives from them (such as referenced environment variables), keyed by the hash
+            of their content. Later runs then only need to parse BUILD files whose content is new.
+
+            The targets parsed from the BUILD files of each directory are persisted there too,
+            keyed by everything that parsing them depends on (including the installed backends,
+            the preludes, and the values of the environment variables that they read). So a new
+            pantsd, e.g. after a restart, only has to evaluate the BUILD files that changed.
+
+            Entries which have not been used for 30 days are deleted.
+
+            {cache_instructions}
+            """
+        ),
+    )
     local_cache = BoolOption(
         default=DEFAULT_EXECUTION_OPTIONS.local_cache,
         help=softwrap(
@@ -234,8 +234,12 @@ class Options:
     def scope_to_flags(self) -> dict[str, list[str]]:
         return self._scope_to_flags
 
-    def verify_configs(self, global_config: Config) -> None:
-        """Verify all loaded configs have correct scopes and options."""
+    def verify_configs(self, global_config: Config, deferred_scopes: Iterable[str] = ()) -> None:
+        """Verify all loaded configs have correct scopes and options.
+
+        The sections of `deferred_scopes`, which belong to backends that were not loaded, are only
+        verified if some loaded backend registers their scope too.
+        """
 
         section_to_valid_options = {}
         for scope in self.known_scope_to_info:
@@ -243,7 +247,7 @@ class Options:
             section_to_valid_options[section] = set(
                 self.for_scope(scope, check_deprecations=False, log_parser_warnings=True)
             )
-        global_config.verify(section_to_valid_options)
+        global_config.verify(section_to_valid_options, unverified_sections=deferred_scopes)
 
     def is_known_scope(self, scope: str) -> bool:
         """Whether the given scope is known by this instance.
@@ -6,6 +6,7 @@ from __future__ import annotations
 import logging
 import os
 import sys
+import threading
 import time
 import warnings
 from pathlib import PurePath
@@ -94,6 +95,7 @@ class PantsDaemon(PantsDaemonProcessManager):
     def _setup_services(
         bootstrap_options: OptionValueContainer,
         graph_scheduler: GraphScheduler,
+        run_lock: threading.Lock,
     ):
         """Initialize pantsd services.
 
@@ -115,6 +117,8 @@ class PantsDaemon(PantsDaemonProcessManager):
             ),
             pid=os.getpid(),
             max_memory_usage_in_bytes=bootstrap_options.pantsd_max_memory_usage,
+            soft_max_memory_usage_in_bytes=bootstrap_options.pantsd_soft_max_memory_usage,
+            run_lock=run_lock,
         )
 
         store_gc_service = StoreGCService(
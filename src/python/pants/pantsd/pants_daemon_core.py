@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 import logging
 import threading
 from contextlib import contextmanager
@@ -14,7 +15,7 @@ from pants.engine.internals.native_engine import PyExecutor
 from pants.engine.unions import UnionMembership
 from pants.init.engine_initializer import EngineInitializer, GraphScheduler
 from pants.init.options_initializer import OptionsInitializer
-from pants.option.global_options import AuthPluginResult, DynamicRemoteOptions
+from pants.option.global_options import AuthPluginResult, DynamicRemoteOptions, ExecutionOptions
 from pants.option.option_value_container import OptionValueContainer
 from pants.option.options_bootstrapper import OptionsBootstrapper
 from pants.option.options_fingerprinter import OptionsFingerprinter
@@ -29,6 +30,7 @@ class PantsServicesConstructor(Protocol):
         self,
         bootstrap_options: OptionValueContainer,
         graph_scheduler: GraphScheduler,
+        run_lock: threading.Lock,
     ) -> PantsServices:
         ...
 
@@ -51,6 +53,8 @@ class PantsDaemonCore:
         self._executor = executor
         self._services_constructor = services_constructor
         self._lifecycle_lock = threading.RLock()
+        # Held for the duration of each run: see `run_lock`.
+        self._run_lock = threading.Lock()
         # N.B. This Event is used as nothing more than an atomic flag - nothing waits on it.
         self._kill_switch = threading.Event()
 
@@ -61,6 +65,15 @@ class PantsDaemonCore:
         self._prior_dynamic_remote_options: DynamicRemoteOptions | None = None
         self._prior_auth_plugin_result: AuthPluginResult | None = None
 
+    @property
+    def run_lock(self) -> threading.Lock:
+        """A lock which is held while a run is in progress.
+
+        Runs acquire it (in DaemonPantsRunner) so that only one runs at a time, and services which
+        must not interfere with an in-flight run acquire it while they do so.
+        """
+        return self._run_lock
+
     def is_valid(self) -> bool:
         """Return true if the core is valid.
 
@@ -108,7 +121,9 @@ class PantsDaemonCore:
                 bootstrap_options, build_config, dynamic_remote_options, self._executor
             )
 
-            self._services = self._services_constructor(bootstrap_options, self._scheduler)
+            self._services = self._services_constructor(
+                bootstrap_options, self._scheduler, self._run_lock
+            )
             self._fingerprint = options_fingerprint
             logger.info("Scheduler initialized.")
         except Exception as e:
@@ -116,6 +131,22 @@ class PantsDaemonCore:
             self._scheduler = None
             raise e
 
+    def _update_remoting(
+        self,
+        bootstrap_options: OptionValueContainer,
+        dynamic_remote_options: DynamicRemoteOptions,
+    ) -> None:
+        """Reconnect the remote clients of the existing scheduler with new headers, keeping its graph.
+
+        Must be called under the lifecycle lock.
+        """
+        assert self._scheduler is not None
+        logger.info("Remote cache/execution headers updated: reconnecting remote clients...")
+        self._scheduler.scheduler.update_remoting(
+            ExecutionOptions.from_options(bootstrap_options, dynamic_remote_options)
+        )
+        logger.info("Remote clients reconnected.")
+
     def prepare(
         self, options_bootstrapper: OptionsBootstrapper, env: CompleteEnvironmentVars
     ) -> tuple[GraphScheduler, OptionsInitializer]:
@@ -134,8 +165,11 @@ class PantsDaemonCore:
         scheduler_restart_explanation: str | None = None
 
         # Because these options are computed dynamically via side effects like reading from a file,
-        # they need to be re-evaluated every run. We only reinitialize the scheduler if changes
-        # were made, though.
+        # they need to be re-evaluated every run. If only their headers (i.e. credentials) have
+        # changed, we reconnect the remote clients of the scheduler, rather than reinitializing it
+        # (and losing its graph). Any other change reinitializes the scheduler: e.g. with
+        # `--cache-content-behavior=defer`, its graph may reference digests which only exist in the
+        # previous store.
         dynamic_remote_options, auth_plugin_result = DynamicRemoteOptions.from_options(
             options,
             env,
@@ -147,7 +181,11 @@ class PantsDaemonCore:
             and dynamic_remote_options != self._prior_dynamic_remote_options
         )
         if remote_options_changed:
-            scheduler_restart_explanation = "Remote cache/execution options updated"
+            assert self._prior_dynamic_remote_options is not None
+            if not _only_headers_changed(
+                self._prior_dynamic_remote_options, dynamic_remote_options
+            ):
+                scheduler_restart_explanation = "Remote cache/execution options updated"
 
         # Compute the fingerprint of the bootstrap options. Note that unlike
         # PantsDaemonProcessManager (which fingerprints only `daemon=True` options), this
@@ -178,6 +216,11 @@ class PantsDaemonCore:
                         dynamic_remote_options,
                         scheduler_restart_explanation,
                     )
+            elif remote_options_changed:
+                bootstrap_options = options.bootstrap_option_values()
+                assert bootstrap_options is not None
+                with self._handle_exceptions():
+                    self._update_remoting(bootstrap_options, dynamic_remote_options)
 
             self._prior_dynamic_remote_options = dynamic_remote_options
             self._prior_auth_plugin_result = auth_plugin_result
@@ -193,3 +236,10 @@ class PantsDaemonCore:
             if self._scheduler is not None:
                 self._scheduler.scheduler.shutdown()
                 self._scheduler = None
+
+
+def _only_headers_changed(prior: DynamicRemoteOptions, current: DynamicRemoteOptions) -> bool:
+    """Whether the given remote options differ only by their headers, which carry credentials."""
+    return current == dataclasses.replace(
+        prior, store_headers=current.store_headers, execution_headers=current.execution_headers
+    )
@@ -1,7 +1,11 @@
 # Copyright 2016 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+import ctypes
+import ctypes.util
+import gc
 import logging
+import threading
 import time
 from typing import Optional, Tuple, cast
 
@@ -13,6 +17,8 @@ from pants.init.engine_initializer import GraphScheduler
 from pants.pantsd.service.pants_service import PantsService
 from pants.util.strutil import softwrap
 
+_BYTES_PER_MIB = 1_048_576
+
 
 class SchedulerService(PantsService):
     """The pantsd scheduler service.
@@ -37,6 +43,8 @@ class SchedulerService(PantsService):
         pidfile: str,
         pid: int,
         max_memory_usage_in_bytes: int,
+        soft_max_memory_usage_in_bytes: Optional[int] = None,
+        run_lock: Optional[threading.Lock] = None,
     ) -> None:
         """
         :param graph_scheduler: The GraphScheduler instance for graph construction.
@@ -47,7 +55,13 @@ class SchedulerService(PantsService):
                         to remain valid.
         :param pid: This processes' pid.
         :param max_memory_usage_in_bytes: The maximum memory usage of the process: the service will
-                                          shut down if it observes more than this amount in use.
+                                          shut down if it observes more than this amount in use,
+                                          even after evicting the graph.
+        :param soft_max_memory_usage_in_bytes: The memory usage above which the service will evict
+                                               the values held by the graph, rather than shut down.
+                                               Defaults to `max_memory_usage_in_bytes`.
+        :param run_lock: A lock which is held while a run is in progress: the graph is only evicted
+                         while it can be acquired.
         """
         super().__init__()
         self._graph_helper = graph_scheduler
@@ -70,6 +84,14 @@ class SchedulerService(PantsService):
         self._pidfile = pidfile
         self._pid = pid
         self._max_memory_usage_in_bytes = max_memory_usage_in_bytes
+        self._soft_max_memory_usage_in_bytes = min(
+            soft_max_memory_usage_in_bytes or max_memory_usage_in_bytes,
+            max_memory_usage_in_bytes,
+        )
+        # The memory usage above which we next evict: raised after an eviction that doesn't get us
+        # back below the soft limit, so that we don't evict on every check.
+        self._eviction_threshold_in_bytes = self._soft_max_memory_usage_in_bytes
+        self._run_lock = run_lock or threading.Lock()
 
     def _get_snapshot(self, globs: Tuple[str, ...], poll: bool) -> Optional[Snapshot]:
         """Returns a Snapshot of the input globs.
@@ -115,19 +137,70 @@ class SchedulerService(PantsService):
         if int(pid_from_file) != self._pid:
             raise Exception(f"Another instance of pantsd is running at {pid_from_file}")
 
+    def _memory_usage_in_bytes(self) -> int:
+        return cast(int, psutil.Process(self._pid).memory_info()[0])
+
+    def _evict(self) -> int:
+        """Evict the values held by the graph, and return the memory it frees to the OS.
+
+        Returns the number of nodes that were evicted.
+        """
+        graph_len = self._scheduler.graph_len()
+        self._scheduler.evict_all()
+        gc.collect()
+        _release_free_memory()
+        return graph_len
+
+    def _check_max_memory_usage(self, memory_usage_in_bytes: int, evicted: bool) -> None:
+        if memory_usage_in_bytes <= self._max_memory_usage_in_bytes:
+            return
+        raise Exception(
+            softwrap(
+                f"""
+                pantsd process {self._pid} was using
+                {memory_usage_in_bytes / _BYTES_PER_MIB:.2f} MiB of memory
+                {"even after evicting the graph " if evicted else ""}(above the
+                `--pantsd-max-memory-usage` limit of
+                {self._max_memory_usage_in_bytes / _BYTES_PER_MIB:.2f} MiB).
+                """
+            )
+        )
+
     def _check_memory_usage(self):
-        memory_usage_in_bytes = psutil.Process(self._pid).memory_info()[0]
-        if memory_usage_in_bytes > self._max_memory_usage_in_bytes:
-            bytes_per_mib = 1_048_576
-            raise Exception(
-                softwrap(
-                    f"""
-                    pantsd process {self._pid} was using {memory_usage_in_bytes / bytes_per_mib:.2f}
-                    MiB of memory (above the `--pantsd-max-memory-usage` limit of
-                    {self._max_memory_usage_in_bytes / bytes_per_mib:.2f} MiB).
-                    """
-                )
+        memory_usage_in_bytes = self._memory_usage_in_bytes()
+        if memory_usage_in_bytes <= self._eviction_threshold_in_bytes:
+            return
+
+        # Evicting the graph while a run is in progress would discard Nodes that the run is still
+        # using: wait until it has completed, unless we have already exceeded the hard limit.
+        if not self._run_lock.acquire(blocking=False):
+            self._check_max_memory_usage(memory_usage_in_bytes, evicted=False)
+            return
+        try:
+            evicted = self._evict()
+        finally:
+            self._run_lock.release()
+
+        evicted_memory_usage_in_bytes = self._memory_usage_in_bytes()
+        self._logger.warning(
+            softwrap(
+                f"""
+                pantsd process {self._pid} was using {memory_usage_in_bytes / _BYTES_PER_MIB:.2f}
+                MiB of memory (above the `--pantsd-soft-max-memory-usage` limit of
+                {self._soft_max_memory_usage_in_bytes / _BYTES_PER_MIB:.2f} MiB): evicted
+                {evicted} nodes from the graph, leaving
+                {evicted_memory_usage_in_bytes / _BYTES_PER_MIB:.2f} MiB in use.
+                """
             )
+        )
+        self._check_max_memory_usage(evicted_memory_usage_in_bytes, evicted=True)
+        # If evicting didn't get us back below the soft limit, wait until we're halfway to the hard
+        # limit before evicting again.
+        self._eviction_threshold_in_bytes = (
+            self._soft_max_memory_usage_in_bytes
+            if evicted_memory_usage_in_bytes <= self._soft_max_memory_usage_in_bytes
+            else (evicted_memory_usage_in_bytes + self._max_memory_usage_in_bytes) // 2
+        )
 
     def _check_invalidation_watcher_liveness(self):
         self._scheduler.check_invalidation_watcher_liveness()
@@ -155,3 +228,17 @@ class SchedulerService(PantsService):
                 self._logger.critical(f"The scheduler was invalidated: {e!r}")
                 self.terminate()
         self._scheduler_session.cancel()
+
+
+def _release_free_memory() -> None:
+    """Ask the allocator to return the memory that it holds but is no longer in use to the OS.
+
+    This is only possible with glibc: elsewhere, the memory is reused by the process instead.
+    """
+    libc_name = ctypes.util.find_library("c")
+    if libc_name is None:
+        return
+    try:
+        ctypes.CDLL(libc_name).malloc_trim(0)
+    except (AttributeError, OSError):
+        pass
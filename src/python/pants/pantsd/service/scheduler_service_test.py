@@ -0,0 +1,104 @@
+# Copyright 2023 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import os
+import threading
+
+import pytest
+
+from pants.init.engine_initializer import GraphScheduler
+from pants.pantsd.service.scheduler_service import SchedulerService
+from pants.testutil.rule_runner import RuleRunner
+
+
+class FakeMemorySchedulerService(SchedulerService):
+    """A SchedulerService which reports scripted memory usage, and records evictions."""
+
+    def __init__(self, memory_usage_in_bytes: list[int], **kwargs) -> None:
+        super().__init__(
+            graph_scheduler=GraphScheduler(RuleRunner().scheduler.scheduler, {}),
+            build_root=os.getcwd(),
+            invalidation_globs=(),
+            pidfile="pidfile",
+            pid=os.getpid(),
+            **kwargs,
+        )
+        self.memory_usage_in_bytes = memory_usage_in_bytes
+        self.evictions = 0
+
+    def _memory_usage_in_bytes(self) -> int:
+        return self.memory_usage_in_bytes.pop(0)
+
+    def _evict(self) -> int:
+        self.evictions += 1
+        return 0
+
+
+def test_below_soft_limit() -> None:
+    service = FakeMemorySchedulerService(
+        [2000], max_memory_usage_in_bytes=4000, soft_max_memory_usage_in_bytes=2000
+    )
+    service._check_memory_usage()
+    assert service.evictions == 0
+
+
+def test_evict_above_soft_limit() -> None:
+    service = FakeMemorySchedulerService(
+        [3000, 1500], max_memory_usage_in_bytes=4000, soft_max_memory_usage_in_bytes=2000
+    )
+    service._check_memory_usage()
+    assert service.evictions == 1
+    assert service._eviction_threshold_in_bytes == 2000
+
+
+def test_raise_threshold_when_eviction_is_insufficient() -> None:
+    service = FakeMemorySchedulerService(
+        [3000, 2500, 3000, 3500, 3500],
+        max_memory_usage_in_bytes=4000,
+        soft_max_memory_usage_in_bytes=2000,
+    )
+    service._check_memory_usage()
+    assert service.evictions == 1
+    # Halfway between the usage after eviction and the hard limit.
+    assert service._eviction_threshold_in_bytes == 3250
+
+    service._check_memory_usage()
+    assert service.evictions == 1
+
+    service._check_memory_usage()
+    assert service.evictions == 2
+    assert service._eviction_threshold_in_bytes == 3750
+
+
+def test_soft_limit_defaults_to_hard_limit() -> None:
+    service = FakeMemorySchedulerService([4000, 5000, 4500], max_memory_usage_in_bytes=4000)
+    service._check_memory_usage()
+    assert service.evictions == 0
+
+    with pytest.raises(Exception, match="even after evicting the graph"):
+        service._check_memory_usage()
+    assert service.evictions == 1
+
+
+def test_no_eviction_during_run() -> None:
+    run_lock = threading.Lock()
+    service = FakeMemorySchedulerService(
+        [3000, 5000, 3000, 1500],
+        max_memory_usage_in_bytes=4000,
+        soft_max_memory_usage_in_bytes=2000,
+        run_lock=run_lock,
+    )
+    with run_lock:
+        # Above the soft limit: eviction waits for the run to complete.
+        service._check_memory_usage()
+        assert service.evictions == 0
+        # Above the hard limit: the service fails without evicting.
+        with pytest.raises(Exception, match="above the `--pantsd-max-memory-usage` limit"):
+            service._check_memory_usage()
+        assert service.evictions == 0
+
+    service._check_memory_usage()
+    assert service.evictions == 1
+    assert not run_lock.locked()
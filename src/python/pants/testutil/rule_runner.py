@@ -745,6 +745,27 @@ def run_rule_with_mocks(
             raise AssertionError(f"Rule requested: {res}, which cannot be satisfied.")
         return provider(*res.inputs)
 
+    def multi_get(gets: Sequence[Get | Effect | Coroutine]) -> list:
+        # Coroutines are advanced in lockstep, so that (as in the engine) each of them requests its
+        # first `Get` before any of them completes.
+        results: list = [None] * len(gets)
+        coroutine_inputs: dict[int, Any] = {}
+        for i, g in enumerate(gets):
+            if isinstance(g, Coroutine):
+                coroutine_inputs[i] = None
+            else:
+                results[i] = get(g)
+        while coroutine_inputs:
+            for i, coroutine_input in list(coroutine_inputs.items()):
+                try:
+                    res = gets[i].send(coroutine_input)  # type: ignore[union-attr]
+                except StopIteration as e:
+                    results[i] = e.value
+                    del coroutine_inputs[i]
+                    continue
+                coroutine_inputs[i] = get(res) if isinstance(res, (Get, Effect)) else multi_get(res)
+        return results
+
     rule_coroutine = res
     rule_input = None
     while True:
@@ -753,7 +774,7 @@ def run_rule_with_mocks(
             if isinstance(res, (Get, Effect)):
                 rule_input = get(res)
             elif type(res) in (tuple, list):
-                rule_input = [get(g) for g in res]  # type: ignore[union-attr]
+                rule_input = multi_get(res)  # type: ignore[arg-type]
             else:
                 return res  # type: ignore[return-value]
         except StopIteration as e:
@@ -150,3 +150,54 @@ def partition_sequentially(
             yield emit_batch()
     if batch:
         yield emit_batch()
+
+
+def partition_sequentially_by_weight(
+    items: Iterable[_T],
+    *,
+    key: Callable[[_T], str],
+    weight: Callable[[_T], float],
+    weight_target: float,
+    size_max: int | None = None,
+) -> Iterator[list[_T]]:
+    """Stably partitions the given items into batches of around `weight_target` total weight.
+
+    This is like `partition_sequentially`, except that each item counts as its `weight` rather than
+    as one item, so that (for example) a few slow tests can fill a batch as much as many fast ones.
+
+    Weights are rounded up to a power of two before use, so that small changes in an item's weight
+    (such as noise in a measured duration) do not move the batch boundaries.
+    """
+
+    # As in `partition_sequentially`, a batch ends after an item whose key's hash has enough
+    # leading zero bits. But rather than breaking with a probability of `1/size_target` per item,
+    # we break with a probability of `weight/weight_target`, so that on average a batch ends once
+    # it has accumulated `weight_target`. Items at least as heavy as `weight_target` always end a
+    # batch.
+    def zero_prefix_threshold(item: _T) -> float:
+        item_weight = weight(item)
+        if item_weight <= 0:
+            return math.inf
+        quantized_weight = 2 ** math.ceil(math.log(item_weight, 2))
+        return math.log(max(1.0, weight_target / quantized_weight), 2)
+
+    batch: list[_T] = []
+
+    def emit_batch() -> list[_T]:
+        assert batch
+        result = list(batch)
+        batch.clear()
+        return result
+
+    keyed_items = []
+    for item in items:
+        keyed_items.append((key(item), item))
+    keyed_items.sort()
+
+    for item_key, item in keyed_items:
+        batch.append(item)
+        prefix_zero_bits = native_engine.hash_prefix_zero_bits(item_key)
+        if prefix_zero_bits >= zero_prefix_threshold(item) or (size_max and len(batch) >= size_max):
+            yield emit_batch()
+    if batch:
+        yield emit_batch()
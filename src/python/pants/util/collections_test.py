@@ -13,6 +13,7 @@ from pants.util.collections import (
     ensure_list,
     ensure_str_list,
     partition_sequentially,
+    partition_sequentially_by_weight,
     recursively_update,
 )
 
@@ -107,3 +108,30 @@ def test_partition_sequentially(size_target: int) -> None:
     for to_add in [item for i, item in enumerate(all_items) if i % 2 == 1]:
         updated_partitions = partitioned_buckets([to_add, *base_items])
         assert 1 <= len(base_partitions ^ updated_partitions) <= 4
+
+
+def test_partition_sequentially_by_weight() -> None:
+    def partitioned_buckets(weights: dict[str, float]) -> set[tuple[str, ...]]:
+        return {
+            tuple(p)
+            for p in partition_sequentially_by_weight(
+                weights, key=str, weight=weights.__getitem__, weight_target=64
+            )
+        }
+
+    all_items = sorted(f"item{i}" for i in range(0, 1024))
+    weights = dict.fromkeys(all_items, 1.0)
+    weights.update(dict.fromkeys(all_items[::97], 100.0))
+    buckets = partitioned_buckets(weights)
+
+    # Every item is present exactly once, and items heavier than the target end their batch.
+    assert sorted(item for bucket in buckets for item in bucket) == all_items
+    for bucket in buckets:
+        assert all(weights[item] < 64 for item in bucket[:-1])
+
+    # Light batches are larger than heavy ones.
+    light_buckets = [bucket for bucket in buckets if all(weights[i] == 1.0 for i in bucket)]
+    assert sum(map(len, light_buckets)) / len(light_buckets) > 8
+
+    # Small changes in weight do not move the boundaries.
+    assert partitioned_buckets({item: weight * 0.9 for item, weight in weights.items()}) == buckets
@@ -777,6 +777,22 @@ impl<N: Node> Entry<N> {
         };
     }
 
+    ///
+    /// Clears the state of this Node like `clear`, and also drops its previous result, which frees
+    /// the memory that it holds at the cost of always re-running the Node when it is next requested.
+    ///
+    /// The caller must have removed all edges from this Node from the graph.
+    ///
+    pub(crate) fn evict(&mut self) {
+        self.clear(false);
+        if let EntryState::NotStarted {
+            previous_result, ..
+        } = &mut *self.state.lock()
+        {
+            *previous_result = None;
+        }
+    }
+
     ///
     /// Dirties this Node, which will cause it to examine its dependencies the next time it is
     /// requested, and re-run if any of them have changed generations.
@@ -206,6 +206,17 @@ impl<N: Node> InnerGraph<N> {
         }
     }
 
+    fn evict(&mut self) {
+        // Every Node is cleared, so all of the edges are removed: they are re-added when the Nodes
+        // re-run.
+        self.pg.clear_edges();
+        for eid in self.nodes.values() {
+            if let Some(entry) = self.pg.node_weight_mut(*eid) {
+                entry.evict();
+            }
+        }
+    }
+
     ///
     /// Clears the values of all "invalidation root" Nodes and dirties their transitive dependents.
     ///
@@ -628,6 +639,15 @@ impl<N: Node> Graph<N> {
         inner.clear()
     }
 
+    ///
+    /// Clears the state of all Nodes in the Graph, including the previous results that `clear`
+    /// keeps in order to clean Nodes, which frees the memory held by the Graph.
+    ///
+    pub fn evict(&self) {
+        let mut inner = self.inner.lock();
+        inner.evict()
+    }
+
     pub fn invalidate_from_roots<P: Fn(&N) -> bool>(
         &self,
         log_dirtied: bool,
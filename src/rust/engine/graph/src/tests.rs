@@ -73,6 +73,40 @@ async fn invalidate_and_clean() {
     );
 }
 
+#[tokio::test]
+async fn evict() {
+    let graph = empty_graph();
+    let context = graph.context(TContext::new());
+
+    // Create three nodes.
+    assert_eq!(
+        graph.create(TNode::new(2), &context).await,
+        Ok(vec![T(0, 0), T(1, 0), T(2, 0)])
+    );
+    assert_eq!(graph.inner.lock().pg.edge_count(), 2);
+
+    // Evicting drops the previous results of all Nodes, so they all re-run rather than being
+    // cleaned. It also drops their edges, which are re-added (once) when they re-run.
+    graph.evict();
+    assert_eq!(graph.inner.lock().pg.edge_count(), 0);
+    assert_eq!(
+        graph.create(TNode::new(2), &context).await,
+        Ok(vec![T(0, 0), T(1, 0), T(2, 0)])
+    );
+    assert_eq!(graph.inner.lock().pg.edge_count(), 2);
+    assert_eq!(
+        context.runs(),
+        vec![
+            TNode::new(2),
+            TNode::new(1),
+            TNode::new(0),
+            TNode::new(2),
+            TNode::new(1),
+            TNode::new(0),
+        ]
+    );
+}
+
 #[tokio::test]
 async fn invalidate_and_rerun() {
     let graph = empty_graph();
@@ -23,7 +23,7 @@ use futures::FutureExt;
 use graph::{Graph, InvalidationResult};
 use hashing::Digest;
 use log::{log, Level};
-use parking_lot::Mutex;
+use parking_lot::{Mutex, RwLock};
 // use docker::docker::{self, DOCKER, IMAGE_PULL_CACHE};
 use docker::docker;
 use process_execution::switched::SwitchedCommandRunner;
@@ -63,11 +63,9 @@ pub struct Core {
     pub types: Types,
     pub intrinsics: Intrinsics,
     pub executor: Executor,
-    store: Store,
-    /// The CommandRunners to use for execution, in ascending order of reliability (for the purposes
-    /// of backtracking). For performance reasons, caching `CommandRunners` might skip validation of
-    /// their outputs, and so should be listed before uncached `CommandRunners`.
-    pub command_runners: Vec<Arc<dyn CommandRunner>>,
+    /// The local-only Store, which the Store of `remoting` wraps.
+    local_store: Store,
+    remoting: RwLock<Arc<Remoting>>,
     pub http_client: reqwest::Client,
     pub local_cache: PersistentCache,
     pub vfs: PosixFS,
@@ -77,10 +75,22 @@ pub struct Core {
     pub graceful_shutdown_timeout: Duration,
     pub sessions: Sessions,
     pub named_caches: NamedCaches,
-    pub immutable_inputs: ImmutableInputs,
     pub local_execution_root_dir: PathBuf,
 }
 
+///
+/// The parts of a Core which depend on the remoting options, and which are replaced as a unit when
+/// those options are updated.
+///
+struct Remoting {
+    store: Store,
+    /// The CommandRunners to use for execution, in ascending order of reliability (for the purposes
+    /// of backtracking). For performance reasons, caching `CommandRunners` might skip validation of
+    /// their outputs, and so should be listed before uncached `CommandRunners`.
+    command_runners: Vec<Arc<dyn CommandRunner>>,
+    immutable_inputs: ImmutableInputs,
+}
+
 #[derive(Clone, Debug)]
 pub struct RemotingOptions {
     pub provider: RemoteProvider,
@@ -170,29 +180,6 @@ impl From<&LocalStoreOptions> for store::LocalOptions {
 }
 
 impl Core {
-    async fn make_store(
-        executor: &Executor,
-        local_store_options: &LocalStoreOptions,
-        local_execution_root_dir: &Path,
-        enable_remote: bool,
-        remoting_opts: &RemotingOptions,
-        tls_config: grpc_util::tls::Config,
-    ) -> Result<Store, String> {
-        let local_only = Store::local_only_with_options(
-            executor.clone(),
-            local_store_options.store_dir.clone(),
-            local_execution_root_dir,
-            local_store_options.into(),
-        )?;
-        if enable_remote {
-            local_only
-                .into_with_remote(remoting_opts.to_remote_store_options(tls_config)?)
-                .await
-        } else {
-            Ok(local_only)
-        }
-    }
-
     ///
     /// Make the innermost / leaf runner. Will have concurrency control and process pooling, but
     /// will not have caching.
@@ -454,6 +441,118 @@ impl Core {
         Ok(runners)
     }
 
+    ///
+    /// Creates the Store and the CommandRunners which use the given remoting options, on top of
+    /// the given local Store.
+    ///
+    async fn make_remoting(
+        local_store: &Store,
+        executor: &Executor,
+        local_cache: &PersistentCache,
+        local_execution_root_dir: &Path,
+        named_caches: &NamedCaches,
+        remoting_opts: &RemotingOptions,
+        exec_strategy_opts: &ExecutionStrategyOptions,
+    ) -> Result<Remoting, String> {
+        // We re-use these certs for both the execution and store service; they're generally tied together.
+        let root_ca_certs = if let Some(ref path) = remoting_opts.root_ca_certs_path {
+            Some(
+                std::fs::read(path)
+                    .map_err(|err| format!("Error reading root CA certs file {path:?}: {err}"))?,
+            )
+        } else {
+            None
+        };
+
+        let client_certs = remoting_opts
+            .client_certs_path
+            .as_ref()
+            .map(|path| {
+                std::fs::read(path).map_err(|err| {
+                    format!("Error reading client authentication certs file {path:?}: {err}")
+                })
+            })
+            .transpose()?;
+
+        let client_key = remoting_opts
+            .client_key_path
+            .as_ref()
+            .map(|path| {
+                std::fs::read(path).map_err(|err| {
+                    format!("Error reading client authentication key file {path:?}: {err}")
+                })
+            })
+            .transpose()?;
+
+        let mtls_data = match (client_certs.as_ref(), client_key.as_ref()) {
+      (Some(cert), Some(key)) => Some((cert.deref(), key.deref())),
+      (None, None) => None,
+      _ => {
+        return Err(
+			"Both remote_client_certs_path and remote_client_key_path must be specified to enable client authentication, but only one was provided."
+            .to_owned(),
+        )
+      }
+    };
+
+        let tls_config = grpc_util::tls::Config::new(root_ca_certs.as_deref(), mtls_data)?;
+
+        let need_remote_store = remoting_opts.execution_enable
+            || exec_strategy_opts.remote_cache_read
+            || exec_strategy_opts.remote_cache_write;
+
+        let full_store = if need_remote_store {
+            local_store
+                .clone()
+                .into_with_remote(remoting_opts.to_remote_store_options(tls_config.clone())?)
+                .await
+                .map_err(|e| format!("Could not initialize Store: {e:?}"))?
+        } else {
+            local_store.clone()
+        };
+
+        let store = if (exec_strategy_opts.remote_cache_read
+            || exec_strategy_opts.remote_cache_write)
+            && remoting_opts.cache_content_behavior == CacheContentBehavior::Fetch
+            && !remoting_opts.execution_enable
+        {
+            // In remote cache mode with eager fetching, the only interaction with the remote CAS
+            // should be through the remote cache code paths. Thus, the store seen by the rest of the
+            // code base should be the local-only store.
+            full_store.clone().into_local_only()
+        } else {
+            // Otherwise, the remote CAS should be visible everywhere.
+            //
+            // With remote execution, we do not always write remote results into the local cache, so it's
+            // important to always have access to the remote cache or else we will get missing digests.
+            full_store.clone()
+        };
+
+        let immutable_inputs = ImmutableInputs::new(store.clone(), local_execution_root_dir)?;
+        let command_runners = Self::make_command_runners(
+            &full_store,
+            &store,
+            executor,
+            local_cache,
+            local_execution_root_dir,
+            &immutable_inputs,
+            named_caches,
+            remoting_opts.instance_name.clone(),
+            remoting_opts.execution_process_cache_namespace.clone(),
+            tls_config,
+            exec_strategy_opts,
+            remoting_opts,
+        )
+        .await?;
+        log::debug!("Using {command_runners:?} for process execution.");
+
+        Ok(Remoting {
+            store,
+            command_runners,
+            immutable_inputs,
+        })
+    }
+
     fn load_certificates(
         ca_certs_path: Option<PathBuf>,
     ) -> Result<Vec<reqwest::Certificate>, String> {
@@ -503,53 +602,6 @@ impl Core {
         remoting_opts: RemotingOptions,
         exec_strategy_opts: ExecutionStrategyOptions,
     ) -> Result<Core, String> {
-        // We re-use these certs for both the execution and store service; they're generally tied together.
-        let root_ca_certs = if let Some(ref path) = remoting_opts.root_ca_certs_path {
-            Some(
-                std::fs::read(path)
-                    .map_err(|err| format!("Error reading root CA certs file {path:?}: {err}"))?,
-            )
-        } else {
-            None
-        };
-
-        let client_certs = remoting_opts
-            .client_certs_path
-            .as_ref()
-            .map(|path| {
-                std::fs::read(path).map_err(|err| {
-                    format!("Error reading client authentication certs file {path:?}: {err}")
-                })
-            })
-            .transpose()?;
-
-        let client_key = remoting_opts
-            .client_key_path
-            .as_ref()
-            .map(|path| {
-                std::fs::read(path).map_err(|err| {
-                    format!("Error reading client authentication key file {path:?}: {err}")
-                })
-            })
-            .transpose()?;
-
-        let mtls_data = match (client_certs.as_ref(), client_key.as_ref()) {
-      (Some(cert), Some(key)) => Some((cert.deref(), key.deref())),
-      (None, None) => None,
-      _ => {
-        return Err(
-			"Both remote_client_certs_path and remote_client_key_path must be specified to enable client authentication, but only one was provided."
-            .to_owned(),
-        )
-      }
-    };
-
-        let tls_config = grpc_util::tls::Config::new(root_ca_certs.as_deref(), mtls_data)?;
-
-        let need_remote_store = remoting_opts.execution_enable
-            || exec_strategy_opts.remote_cache_read
-            || exec_strategy_opts.remote_cache_write;
-
         std::fs::create_dir_all(&local_store_options.store_dir).map_err(|e| {
             format!(
                 "Error making directory {:?}: {:?}",
@@ -557,15 +609,12 @@ impl Core {
             )
         })?;
 
-        let full_store = Self::make_store(
-            &executor,
-            &local_store_options,
+        let local_store = Store::local_only_with_options(
+            executor.clone(),
+            local_store_options.store_dir.clone(),
             &local_execution_root_dir,
-            need_remote_store,
-            &remoting_opts,
-            tls_config.clone(),
+            (&local_store_options).into(),
         )
-        .await
         .map_err(|e| format!("Could not initialize Store: {e:?}"))?;
 
         let local_cache = PersistentCache::new(
@@ -577,41 +626,17 @@ impl Core {
             local_store_options.shard_count,
         )?;
 
-        let store = if (exec_strategy_opts.remote_cache_read
-            || exec_strategy_opts.remote_cache_write)
-            && remoting_opts.cache_content_behavior == CacheContentBehavior::Fetch
-            && !remoting_opts.execution_enable
-        {
-            // In remote cache mode with eager fetching, the only interaction with the remote CAS
-            // should be through the remote cache code paths. Thus, the store seen by the rest of the
-            // code base should be the local-only store.
-            full_store.clone().into_local_only()
-        } else {
-            // Otherwise, the remote CAS should be visible everywhere.
-            //
-            // With remote execution, we do not always write remote results into the local cache, so it's
-            // important to always have access to the remote cache or else we will get missing digests.
-            full_store.clone()
-        };
-
-        let immutable_inputs = ImmutableInputs::new(store.clone(), &local_execution_root_dir)?;
         let named_caches = NamedCaches::new_local(named_caches_dir);
-        let command_runners = Self::make_command_runners(
-            &full_store,
-            &store,
+        let remoting = Self::make_remoting(
+            &local_store,
             &executor,
             &local_cache,
             &local_execution_root_dir,
-            &immutable_inputs,
             &named_caches,
-            remoting_opts.instance_name.clone(),
-            remoting_opts.execution_process_cache_namespace.clone(),
-            tls_config.clone(),
-            &exec_strategy_opts,
             &remoting_opts,
+            &exec_strategy_opts,
         )
         .await?;
-        log::debug!("Using {command_runners:?} for process execution.");
 
         let graph = Arc::new(InvalidatableGraph(Graph::new(executor.clone())));
 
@@ -656,8 +681,8 @@ impl Core {
             types,
             intrinsics,
             executor: executor.clone(),
-            store,
-            command_runners,
+            local_store,
+            remoting: RwLock::new(Arc::new(remoting)),
             http_client,
             local_cache,
             vfs: PosixFS::new(&build_root, ignorer, executor)
@@ -668,31 +693,58 @@ impl Core {
             graceful_shutdown_timeout: exec_strategy_opts.graceful_shutdown_timeout,
             sessions,
             named_caches,
-            immutable_inputs,
             local_execution_root_dir,
         })
     }
 
     pub fn store(&self) -> Store {
-        self.store.clone()
+        self.remoting.read().store.clone()
     }
 
     ///
-    /// Shuts down this Core.
+    /// The CommandRunner to use at the given level of backtracking, if any.
     ///
-    pub async fn shutdown(&self, timeout: Duration) {
-        // Shutdown the Sessions, which will prevent new work from starting and then await any ongoing
-        // work.
-        if let Err(msg) = self.sessions.shutdown(timeout).await {
-            log::warn!("During shutdown: {}", msg);
-        }
-        // Then clear the Graph to ensure that drop handlers run (particularly for running processes).
-        self.graph.clear();
+    pub fn command_runner(&self, backtrack_level: usize) -> Option<Arc<dyn CommandRunner>> {
+        self.remoting
+            .read()
+            .command_runners
+            .get(backtrack_level)
+            .cloned()
+    }
+
+    pub fn immutable_inputs(&self) -> ImmutableInputs {
+        self.remoting.read().immutable_inputs.clone()
+    }
+
+    ///
+    /// Replaces the Store and the CommandRunners with ones which use the given remoting options,
+    /// while keeping the Graph and all other state. Should only be called between runs: the
+    /// previous CommandRunners are shut down.
+    ///
+    pub async fn update_remoting(
+        &self,
+        remoting_opts: RemotingOptions,
+        exec_strategy_opts: ExecutionStrategyOptions,
+    ) -> Result<(), String> {
+        let remoting = Self::make_remoting(
+            &self.local_store,
+            &self.executor,
+            &self.local_cache,
+            &self.local_execution_root_dir,
+            &self.named_caches,
+            &remoting_opts,
+            &exec_strategy_opts,
+        )
+        .await?;
+        let previous = std::mem::replace(&mut *self.remoting.write(), Arc::new(remoting));
+        Self::shutdown_command_runners(&previous.command_runners).await;
+        Ok(())
+    }
 
+    async fn shutdown_command_runners(command_runners: &[Arc<dyn CommandRunner>]) {
         // Allow command runners to cleanly shutdown in an async context to avoid issues with
         // waiting for async code to run in a non-async drop context.
-        let shutdown_futures = self
-            .command_runners
+        let shutdown_futures = command_runners
             .iter()
             .map(|runner| runner.shutdown().boxed());
         let shutdown_results = futures::future::join_all(shutdown_futures).await;
@@ -702,6 +754,22 @@ impl Core {
             }
         }
     }
+
+    ///
+    /// Shuts down this Core.
+    ///
+    pub async fn shutdown(&self, timeout: Duration) {
+        // Shutdown the Sessions, which will prevent new work from starting and then await any ongoing
+        // work.
+        if let Err(msg) = self.sessions.shutdown(timeout).await {
+            log::warn!("During shutdown: {}", msg);
+        }
+        // Then clear the Graph to ensure that drop handlers run (particularly for running processes).
+        self.graph.clear();
+
+        let remoting = self.remoting.read().clone();
+        Self::shutdown_command_runners(&remoting.command_runners).await;
+    }
 }
 
 pub struct InvalidatableGraph(Graph<NodeKey>);
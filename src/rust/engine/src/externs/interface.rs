@@ -113,6 +113,7 @@ fn native_engine(py: Python, m: &PyModule) -> PyO3Result<()> {
     m.add_function(wrap_pyfunction!(graph_invalidate_paths, m)?)?;
     m.add_function(wrap_pyfunction!(graph_invalidate_all_paths, m)?)?;
     m.add_function(wrap_pyfunction!(graph_invalidate_all, m)?)?;
+    m.add_function(wrap_pyfunction!(graph_evict_all, m)?)?;
     m.add_function(wrap_pyfunction!(graph_len, m)?)?;
     m.add_function(wrap_pyfunction!(graph_visualize, m)?)?;
 
@@ -149,6 +150,7 @@ fn native_engine(py: Python, m: &PyModule) -> PyO3Result<()> {
     m.add_function(wrap_pyfunction!(scheduler_live_items, m)?)?;
     m.add_function(wrap_pyfunction!(scheduler_create, m)?)?;
     m.add_function(wrap_pyfunction!(scheduler_shutdown, m)?)?;
+    m.add_function(wrap_pyfunction!(scheduler_update_remoting, m)?)?;
 
     m.add_function(wrap_pyfunction!(strongly_connected_components, m)?)?;
     m.add_function(wrap_pyfunction!(hash_prefix_zero_bits, m)?)?;
@@ -1081,6 +1083,26 @@ fn scheduler_shutdown(py: Python, py_scheduler: &PyScheduler, timeout_secs: u64)
     })
 }
 
+#[pyfunction]
+fn scheduler_update_remoting(
+    py: Python,
+    py_scheduler: &PyScheduler,
+    remoting_options: &PyRemotingOptions,
+    exec_strategy_opts: &PyExecutionStrategyOptions,
+) -> PyO3Result<()> {
+    let core = &py_scheduler.0.core;
+    let remoting_opts = remoting_options.0.clone();
+    let exec_strategy_opts = exec_strategy_opts.0.clone();
+    core.executor
+        .enter(|| {
+            py.allow_threads(|| {
+                core.executor
+                    .block_on(core.update_remoting(remoting_opts, exec_strategy_opts))
+            })
+        })
+        .map_err(PyValueError::new_err)
+}
+
 #[pyfunction]
 fn scheduler_execute(
     py: Python,
@@ -1251,6 +1273,15 @@ fn graph_invalidate_all(py: Python, py_scheduler: &PyScheduler) {
         .enter(|| py.allow_threads(|| py_scheduler.0.invalidate_all()))
 }
 
+#[pyfunction]
+fn graph_evict_all(py: Python, py_scheduler: &PyScheduler) {
+    py_scheduler
+        .0
+        .core
+        .executor
+        .enter(|| py.allow_threads(|| py_scheduler.0.evict_all()))
+}
+
 #[pyfunction]
 fn check_invalidation_watcher_liveness(py_scheduler: &PyScheduler) -> PyO3Result<()> {
     py_scheduler
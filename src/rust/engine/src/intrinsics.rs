@@ -679,7 +679,7 @@ fn interactive_process(
         process.input_digests.inputs.clone(),
         &context.core.store(),
         &context.core.named_caches,
-        &context.core.immutable_inputs,
+        &context.core.immutable_inputs(),
         None,
         None,
       )
@@ -433,8 +433,7 @@ impl ExecuteProcess {
 
         let command_runner = context
             .core
-            .command_runners
-            .get(backtrack_level)
+            .command_runner(backtrack_level)
             .ok_or_else(|| {
                 // NB: We only backtrack for a Process if it produces a Digest which cannot be consumed
                 // from disk: if we've fallen all the way back to local execution, and even that
@@ -117,6 +117,13 @@ impl Scheduler {
         self.core.graph.clear();
     }
 
+    ///
+    /// Invalidate the entire graph, and drop all of the values that it holds.
+    ///
+    pub fn evict_all(&self) {
+        self.core.graph.evict();
+    }
+
     ///
     /// Return Scheduler and per-Session metrics.
     ///
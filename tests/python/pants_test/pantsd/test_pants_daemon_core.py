@@ -1,8 +1,12 @@
 # Copyright 2020 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+import dataclasses
+
 from pants.engine.env_vars import CompleteEnvironmentVars
 from pants.engine.internals.native_engine import PyExecutor
+from pants.init.engine_initializer import GraphScheduler
+from pants.option.global_options import DynamicRemoteOptions
 from pants.pantsd.pants_daemon_core import PantsDaemonCore
 from pants.pantsd.service.pants_service import PantsServices
 from pants.testutil.option_util import create_options_bootstrapper
@@ -10,7 +14,7 @@ from pants.testutil.option_util import create_options_bootstrapper
 
 def test_prepare_scheduler() -> None:
     # A core with no services.
-    def create_services(bootstrap_options, graph_scheduler):
+    def create_services(bootstrap_options, graph_scheduler, run_lock):
         return PantsServices()
 
     env = CompleteEnvironmentVars({})
@@ -30,3 +34,39 @@ def test_prepare_scheduler() -> None:
     )
     assert first_scheduler is not second_scheduler
     assert first_options_initializer is second_options_initializer
+
+
+def test_prepare_scheduler_remote_options_changed(monkeypatch) -> None:
+    def create_services(bootstrap_options, graph_scheduler, run_lock):
+        return PantsServices()
+
+    env = CompleteEnvironmentVars({})
+    core = PantsDaemonCore(
+        create_options_bootstrapper([]),
+        PyExecutor(core_threads=2, max_threads=4),
+        create_services,
+    )
+    first_scheduler, _ = core.prepare(create_options_bootstrapper([]), env)
+    prior_remote_options = core._prior_dynamic_remote_options
+    assert prior_remote_options is not None
+
+    def prepare_with(remote_options: DynamicRemoteOptions) -> GraphScheduler:
+        monkeypatch.setattr(
+            DynamicRemoteOptions, "from_options", lambda *args, **kwargs: (remote_options, None)
+        )
+        scheduler, _ = core.prepare(create_options_bootstrapper([]), env)
+        return scheduler
+
+    # If only the headers change, the remote clients of the scheduler are reconnected.
+    second_scheduler = prepare_with(
+        dataclasses.replace(
+            prior_remote_options, store_headers={"authorization": "Bearer rotated-token"}
+        )
+    )
+    assert second_scheduler is first_scheduler
+
+    # Otherwise, the scheduler is reinitialized.
+    third_scheduler = prepare_with(
+        dataclasses.replace(prior_remote_options, instance_name="another-instance")
+    )
+    assert third_scheduler is not first_scheduler